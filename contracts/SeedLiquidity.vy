@@ -1,4 +1,4 @@
-# @version 0.2.8
+# @version 0.3.10
 """
 @title Pool tokens to seed Uniswap liquidity
 @license MIT
@@ -9,11 +9,11 @@ from vyper.interfaces import ERC20
 
 interface Factory:
     def getPair(tokenA: address, tokenB: address) -> address: view
-    def createPair(tokenA: address, tokenB: address) -> address: nonpayable
 
 
 interface Router:
     def factory() -> address: view
+    def WETH() -> address: view
     def addLiquidity(
         tokenA: address,
         tokenB: address,
@@ -26,65 +26,464 @@ interface Router:
     ) -> (uint256, uint256, uint256): nonpayable
 
 
-router: public(Router)
-tokens: public(address[2])
-target: public(uint256[2])
-pair: public(ERC20)
-balances: public(HashMap[address, HashMap[uint256, uint256]])  # address -> index -> balance
+interface WETH:
+    def deposit(): payable
+    def withdraw(wad: uint256): nonpayable
+
+
+event Deposit:
+    user: indexed(address)
+    amounts: uint256[2]
+
+event Provide:
+    caller: indexed(address)
+    amounts: uint256[2]
+    liquidity: uint256
+
+event Claim:
+    user: indexed(address)
+    liquidity: uint256
+
+event Bail:
+    user: indexed(address)
+    amounts: uint256[2]
+
+
+struct State:
+    tokens: address[2]
+    target: uint256[2]
+    totals: uint256[2]
+    pair: address
+    liquidity: uint256
+    expiry: uint256
+    locktime: uint256
+    unlock: uint256
+    phase: uint256
+
+struct Position:
+    balances: uint256[2]
+    claimable: uint256
+    refunds: uint256[2]
+
+struct Depositor:
+    user: address
+    balances: uint256[2]
+
+struct Permit:
+    deadline: uint256  # zero skips the permit and uses the existing allowance
+    v: uint8
+    r: bytes32
+    s: bytes32
+
+
+# both token balances of a user share one slot, token 0 in the low 128 bits
+BALANCE_BITS: constant(uint256) = 128
+BALANCE_MASK: constant(uint256) = 2 ** 128 - 1
+ADDRESS_MASK: constant(uint256) = 2 ** 160 - 1
+
+# max number of users served by `claim_for` and `bail_for`
+MAX_BATCH: constant(uint256) = 100
+# max number of depositors returned by `get_depositors`
+MAX_PAGE: constant(uint256) = 1000
+
+# UniswapV2Pair creation code hash, for factories without `INIT_CODE_PAIR_HASH()`
+PAIR_INIT_CODE_HASH: constant(bytes32) = 0x96e8ac42782006f8894161745b24916fe9339b629bc3e7ca895b7c575c1d9c52
+
+# campaign phases reported by `state()`
+PHASE_OPEN: constant(uint256) = 0  # accepting deposits
+PHASE_READY: constant(uint256) = 1  # targets reached, `provide()` can be called
+PHASE_LOCKED: constant(uint256) = 2  # liquidity provided, waiting for unlock
+PHASE_CLAIMABLE: constant(uint256) = 3  # `claim()` can be called
+PHASE_BAILABLE: constant(uint256) = 4  # expired without liquidity, `bail()` can be called
+
+# configuration fixed at deployment lives in the bytecode
+router: public(immutable(Router))
+weth: public(immutable(address))
+tokens: public(immutable(address[2]))
+target: public(immutable(uint256[2]))
+pair: public(immutable(ERC20))
+expiry: public(immutable(uint256))
+locktime: public(immutable(uint256))
+partial: public(immutable(bool))
+
+positions: HashMap[address, uint256]  # address -> packed balances
 totals: public(HashMap[uint256, uint256])  # index -> balance
 liquidity: public(uint256)
-expiry: public(uint256)
-locktime: public(uint256)
+unclaimed: uint256  # packed balances which haven't been claimed yet
+refunds: uint256  # packed amounts left over by a partial `provide()`, paid out by `claim()`
 unlock: public(uint256)
+depositors: public(HashMap[uint256, address])  # index -> user, in order of the first deposit
+counts: uint256  # depositors in the low 128 bits, deposits in the high 128 bits
 
 
 @external
-def __init__(router: address, tokens: address[2], target: uint256[2], duration: uint256, locktime: uint256):
+def __init__(
+    _router: address,
+    _tokens: address[2],
+    _target: uint256[2],
+    _duration: uint256,
+    _locktime: uint256,
+    _partial: bool,
+):
     """
     @notice Set up a new seed liquidity contract
 
-    @param router UniswapRouter address, e.g. 0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D
-    @param tokens Tokens which comprise a pair
-    @param target Amounts of tokens to provide, also determines the initial price
-    @param duration Duration over which the contract accepts deposits, in seconds
-    @param locktime How long the liquidity will stay locked, in seconds
+    @param _router UniswapRouter address, e.g. 0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D
+    @param _tokens Tokens which comprise a pair
+    @param _target Amounts of tokens to provide, also determines the initial price
+    @param _duration Duration over which the contract accepts deposits, in seconds
+    @param _locktime How long the liquidity will stay locked, in seconds
+    @param _partial Allow `provide()` after expiry with what was raised
+    """
+    for i in range(2):
+        assert _target[i] <= BALANCE_MASK  # dev: target too large
+    router = Router(_router)
+    weth = Router(_router).WETH()
+    tokens = _tokens
+    target = _target
+    factory: address = Router(_router).factory()
+    _pair: address = Factory(factory).getPair(_tokens[0], _tokens[1])
+    if _pair == empty(address):
+        # the router deploys the pair in `provide()`, a campaign that fails never pays for it
+        init_code_hash: bytes32 = PAIR_INIT_CODE_HASH
+        success: bool = False
+        response: Bytes[32] = b""
+        success, response = raw_call(
+            factory,
+            method_id("INIT_CODE_PAIR_HASH()"),
+            max_outsize=32,
+            is_static_call=True,
+            revert_on_failure=False,
+        )
+        if success and len(response) == 32:
+            init_code_hash = extract32(response, 0)
+        token0: address = _tokens[0]
+        token1: address = _tokens[1]
+        if convert(token1, uint256) < convert(token0, uint256):
+            token0 = _tokens[1]
+            token1 = _tokens[0]
+        salt: bytes32 = keccak256(concat(convert(token0, bytes20), convert(token1, bytes20)))
+        _pair = convert(
+            convert(keccak256(concat(b"\xff", convert(factory, bytes20), salt, init_code_hash)), uint256) & ADDRESS_MASK,
+            address,
+        )
+    else:
+        assert ERC20(_pair).totalSupply() == 0  # dev: pair already liquid
+    pair = ERC20(_pair)
+    expiry = block.timestamp + _duration
+    locktime = _locktime
+    partial = _partial
+
+
+@view
+@internal
+def _pair_empty() -> bool:
+    # the pair has no code until the router or someone else creates it
+    if not pair.address.is_contract:
+        return True
+    return pair.totalSupply() == 0
+
+
+@pure
+@internal
+def _unpack(position: uint256, index: uint256) -> uint256:
+    return (position >> (BALANCE_BITS * index)) & BALANCE_MASK
+
+
+@view
+@external
+def balances(user: address, index: uint256) -> uint256:
+    """
+    @notice Get the amount of a token deposited by a user
+    @param user Depositor address
+    @param index Token index
+    """
+    if index > 1:
+        return 0
+    return self._unpack(self.positions[user], index)
+
+
+@view
+@external
+def depositor_count() -> uint256:
+    """
+    @notice Get the number of users who have deposited
+    """
+    return self.counts & BALANCE_MASK
+
+
+@view
+@external
+def deposit_count() -> uint256:
+    """
+    @notice Get the number of deposits which took any tokens
+    """
+    return self.counts >> BALANCE_BITS
+
+
+@view
+@external
+def get_depositors(offset: uint256, limit: uint256) -> DynArray[Depositor, MAX_PAGE]:
+    """
+    @notice Get a page of all depositors with their balances, in order of the first deposit
+    @dev Users who have claimed or bailed stay listed with zero balances.
+    @param offset Index of the first depositor
+    @param limit Max number of depositors to return
+    """
+    result: DynArray[Depositor, MAX_PAGE] = []
+    end: uint256 = min(offset + min(limit, MAX_PAGE), self.counts & BALANCE_MASK)
+    user: address = empty(address)
+    position: uint256 = 0
+    for i in range(MAX_PAGE):
+        if offset + i >= end:
+            break
+        user = self.depositors[offset + i]
+        position = self.positions[user]
+        result.append(Depositor({user: user, balances: [position & BALANCE_MASK, position >> BALANCE_BITS]}))
+    return result
+
+
+@view
+@external
+def state() -> State:
+    """
+    @notice Get the whole campaign state in one call
+    @dev `phase` is one of open (0), ready (1), locked (2), claimable (3) or bailable (4)
+    """
+    liquidity: uint256 = self.liquidity
+    unlock: uint256 = self.unlock
+    totals: uint256[2] = [self.totals[0], self.totals[1]]
+    phase: uint256 = PHASE_OPEN
+    if liquidity != 0:
+        phase = PHASE_LOCKED
+        if block.timestamp >= unlock:
+            phase = PHASE_CLAIMABLE
+    elif block.timestamp < expiry:
+        if totals[0] == target[0] and totals[1] == target[1] and self._pair_empty():
+            phase = PHASE_READY
+    elif partial and totals[0] != 0 and totals[1] != 0 and self._pair_empty():
+        # `bail()` stays open as well, whichever comes first
+        phase = PHASE_READY
+    else:
+        phase = PHASE_BAILABLE
+    return State({
+        tokens: tokens,
+        target: target,
+        totals: totals,
+        pair: pair.address,
+        liquidity: liquidity,
+        expiry: expiry,
+        locktime: locktime,
+        unlock: unlock,
+        phase: phase,
+    })
+
+
+@view
+@internal
+def _claimable(position: uint256, liquidity: uint256, unclaimed: uint256) -> uint256:
+    # the last claimer also receives the rounding dust
+    if position == unclaimed:
+        return pair.balanceOf(self)
+    # each token side is entitled to half of the liquidity
+    totals: uint256[2] = target
+    if partial:
+        totals = [self.totals[0], self.totals[1]]
+    amount: uint256 = 0
+    for i in range(2):
+        amount += self._unpack(position, i) * liquidity / (2 * totals[i])
+    return amount
+
+
+@view
+@internal
+def _refunds(position: uint256, unclaimed: uint256) -> uint256[2]:
+    # every depositor gets back the same share of their side that wasn't seeded
+    refunds: uint256 = self.refunds
+    amounts: uint256[2] = empty(uint256[2])
+    excess: uint256 = 0
+    for i in range(2):
+        excess = self._unpack(refunds, i)
+        if excess == 0:
+            continue
+        if position == unclaimed:
+            amounts[i] = ERC20(tokens[i]).balanceOf(self)
+        else:
+            amounts[i] = self._unpack(position, i) * excess / self.totals[i]
+    return amounts
+
+
+@view
+@external
+def position(user: address) -> Position:
+    """
+    @notice Get the balances of a user and what `claim()` would send them
+    @dev The claimable amount and refunds are zero until liquidity is provided.
+    @param user Depositor address
     """
-    self.router = Router(router)
-    self.tokens = tokens
-    self.target = target
-    factory: address = self.router.factory()
-    pair: address = Factory(factory).getPair(tokens[0], tokens[1])
-    if pair == ZERO_ADDRESS:
-        pair = Factory(factory).createPair(tokens[0], tokens[1])
-    self.pair = ERC20(pair)
-    self.expiry = block.timestamp + duration
-    self.locktime = locktime
-    assert self.pair.totalSupply() == 0  # dev: pair already liquid
+    position: uint256 = self.positions[user]
+    claimable: uint256 = 0
+    refunds: uint256[2] = empty(uint256[2])
+    liquidity: uint256 = self.liquidity
+    if liquidity != 0 and position != 0:
+        unclaimed: uint256 = self.unclaimed
+        claimable = self._claimable(position, liquidity, unclaimed)
+        if partial:
+            refunds = self._refunds(position, unclaimed)
+    return Position({
+        balances: [self._unpack(position, 0), self._unpack(position, 1)],
+        claimable: claimable,
+        refunds: refunds,
+    })
 
 
 @external
-def deposit(amounts: uint256[2]):
+@payable
+def __default__():
+    # only accept ether unwrapped for `bail`
+    assert msg.sender == weth  # dev: use `deposit_eth()`
+
+
+@internal
+def _deposit(user: address, amounts: uint256[2], wrap: bool) -> uint256[2]:
+    assert self.liquidity == 0  # dev: liquidity already seeded
+    assert block.timestamp < expiry  # dev: contract has expired
+    # read every storage slot once and write it back once, skip the sides with nothing to take
+    position: uint256 = self.positions[user]
+    # a position is only emptied once deposits are closed, so an empty one is a new depositor
+    first: bool = position == 0
+    total: uint256 = 0
+    amount: uint256 = 0
+    refund: uint256 = 0
+    accepted: uint256[2] = empty(uint256[2])
+    for i in range(2):
+        if amounts[i] == 0:
+            continue
+        total = self.totals[i]
+        amount = min(amounts[i], target[i] - total)
+        if wrap and tokens[i] == weth:
+            # all of the ether was sent, wrap what's taken and refund the rest
+            refund = amounts[i] - amount
+            if amount != 0:
+                WETH(weth).deposit(value=amount)
+        elif amount != 0:
+            assert ERC20(tokens[i]).transferFrom(user, self, amount)
+        if amount == 0:
+            continue
+        accepted[i] = amount
+        # cannot carry into the other half, balances never exceed the target
+        position += amount << (BALANCE_BITS * i)
+        self.totals[i] = total + amount
+    if accepted[0] != 0 or accepted[1] != 0:
+        counts: uint256 = self.counts
+        if first:
+            self.depositors[counts & BALANCE_MASK] = user
+            counts += 1
+        self.counts = counts + (1 << BALANCE_BITS)
+        self.positions[user] = position
+        log Deposit(user, accepted)
+    if refund != 0:
+        raw_call(user, b"", value=refund)
+    return accepted
+
+
+@external
+def deposit(amounts: uint256[2]) -> uint256[2]:
     """
     @notice Deposit token amounts into the contract
     @dev
         A user must have approved the contract to spend both tokens.
         The token amounts are clamped to not exceed their targets.
+        A token with nothing to take after clamping isn't transferred.
         This function only works up to the moment when liquidity is provided
         or the contract has expired, whichever comes first.
 
     @param amounts Token amounts to deposit
+    @return Token amounts accepted
     """
-    assert self.liquidity == 0  # dev: liquidity already seeded
-    assert block.timestamp < self.expiry  # dev: contract has expired
-    amount: uint256 = 0
+    return self._deposit(msg.sender, amounts, False)
+
+
+@external
+def deposit_single(index: uint256, amount: uint256) -> uint256:
+    """
+    @notice Deposit one of the tokens into the contract
+    @dev Same as `deposit` with zero for the other token.
+
+    @param index Token index
+    @param amount Token amount to deposit
+    @return Token amount accepted
+    """
+    if index == 0:
+        return self._deposit(msg.sender, [amount, 0], False)[0]
+    assert index == 1  # dev: invalid index
+    return self._deposit(msg.sender, [0, amount], False)[1]
+
+
+@external
+@payable
+def deposit_eth(amount: uint256) -> uint256[2]:
+    """
+    @notice Deposit ether for the WETH side and tokens for the other side
+    @dev
+        The sent ether is wrapped into WETH and clamped to the WETH target,
+        the excess is refunded in the same call.
+        Only available when one of the tokens is the router's WETH.
+        Otherwise the same as `deposit`.
+
+    @param amount Amount of the other token to deposit
+    @return Token amounts accepted
+    """
+    amounts: uint256[2] = [amount, msg.value]
+    if tokens[0] == weth:
+        amounts = [msg.value, amount]
+    else:
+        assert tokens[1] == weth  # dev: no weth side
+    return self._deposit(msg.sender, amounts, True)
+
+
+@external
+def deposit_with_permit(amounts: uint256[2], permits: Permit[2]) -> uint256[2]:
+    """
+    @notice Approve the tokens with EIP-2612 signatures and deposit them in one call
+    @dev
+        Each permit must be signed for the exact deposit amount of its token.
+        A permit with zero deadline is skipped, so a token without `permit`
+        support can use an existing allowance instead.
+        A failed permit reverts unless the allowance already covers the amount,
+        so a permit front-run by someone else doesn't block the deposit.
+        Otherwise the same as `deposit`.
+
+    @param amounts Token amounts to deposit
+    @param permits Permit signatures for each token
+    @return Token amounts accepted
+    """
+    success: bool = False
     for i in range(2):
-        amount = min(amounts[i], self.target[i] - self.totals[i])
-        assert ERC20(self.tokens[i]).transferFrom(msg.sender, self, amount)
-        self.balances[msg.sender][i] += amount
-        self.totals[i] += amount
+        if permits[i].deadline == 0 or amounts[i] == 0:
+            continue
+        success = raw_call(
+            tokens[i],
+            _abi_encode(
+                msg.sender,
+                self,
+                amounts[i],
+                permits[i].deadline,
+                permits[i].v,
+                permits[i].r,
+                permits[i].s,
+                method_id=method_id("permit(address,address,uint256,uint256,uint8,bytes32,bytes32)"),
+            ),
+            revert_on_failure=False,
+        )
+        if not success:
+            # e.g. the permit was front-run, it already set the allowance then
+            assert ERC20(tokens[i]).allowance(msg.sender, self) >= amounts[i]  # dev: permit failed
+    return self._deposit(msg.sender, amounts, False)
 
 
 @external
+@nonreentrant("lock")
 def provide():
     """
     @notice Bootstrap a new Uniswap pair using the assets in the contract
@@ -92,59 +491,154 @@ def provide():
         This function can only be called once and before the contract has expired.
         Requires the target to be reached for both tokens.
         Requires the pool to have no liquidity in it.
+        Creates the pair through the router if it doesn't exist yet, and reverts
+        if the router didn't seed the pair derived at deployment.
+        A partial contract can also be provided after expiry with what was raised.
+        The pair is seeded at the target price with all of the side that is
+        furthest from its target, `claim()` refunds the excess of the other side.
     """
     assert self.liquidity == 0  # dev: liquidity already seeded
-    assert block.timestamp < self.expiry  # dev: contract has expired
-    assert self.pair.totalSupply() == 0  # dev: cannot seed a liquid pair
-    amount: uint256 = 0
+    expired: bool = block.timestamp >= expiry
+    assert partial or not expired  # dev: contract has expired
+    assert self._pair_empty()  # dev: cannot seed a liquid pair
+    totals: uint256[2] = [self.totals[0], self.totals[1]]
+    amounts: uint256[2] = target
+    if expired:
+        assert totals[0] != 0 and totals[1] != 0  # dev: nothing to provide
+        # cannot overflow, totals and targets fit in 128 bits
+        if totals[0] * target[1] <= totals[1] * target[0]:
+            amounts = [totals[0], totals[0] * target[1] / target[0]]
+        else:
+            amounts = [totals[1] * target[0] / target[1], totals[1]]
     for i in range(2):
-        assert self.totals[i] == self.target[i]  # dev: target not reached
-        assert ERC20(self.tokens[i]).approve(self.router.address, self.totals[i])
-    
-    self.router.addLiquidity(
-        self.tokens[0],
-        self.tokens[1],
-        self.totals[0],
-        self.totals[1],
-        self.totals[0],  # don't allow slippage
-        self.totals[1],
+        if not expired:
+            assert totals[i] == target[i]  # dev: target not reached
+        assert ERC20(tokens[i]).approve(router.address, amounts[i])
+
+    router.addLiquidity(
+        tokens[0],
+        tokens[1],
+        amounts[0],
+        amounts[1],
+        amounts[0],  # don't allow slippage
+        amounts[1],
         self,
         block.timestamp
     )
-    
-    self.unlock = block.timestamp + self.locktime
-    self.liquidity = self.pair.balanceOf(self)
-    assert self.liquidity > 0  # dev: no liquidity provided
+
+    # the pair may have been derived with the wrong init code hash at deployment
+    assert Factory(router.factory()).getPair(tokens[0], tokens[1]) == pair.address  # dev: wrong pair
+
+    self.unlock = block.timestamp + locktime
+    liquidity: uint256 = pair.balanceOf(self)
+    assert liquidity > 0  # dev: no liquidity provided
+    self.liquidity = liquidity
+    self.unclaimed = totals[0] | (totals[1] << BALANCE_BITS)
+    if expired:
+        self.refunds = (totals[0] - amounts[0]) | ((totals[1] - amounts[1]) << BALANCE_BITS)
+    log Provide(msg.sender, amounts, liquidity)
+
+
+@internal
+def _claim(user: address, liquidity: uint256, unclaimed: uint256) -> uint256:
+    position: uint256 = self.positions[user]
+    if position == 0:
+        return unclaimed
+    self.positions[user] = 0
+    amount: uint256 = self._claimable(position, liquidity, unclaimed)
+    refunds: uint256[2] = empty(uint256[2])
+    if partial:
+        refunds = self._refunds(position, unclaimed)
+    # settle the books before any transfer
+    # position halves never exceed the unclaimed halves, so there is no borrow
+    remaining: uint256 = unclaimed - position
+    self.unclaimed = remaining
+    assert pair.transfer(user, amount)
+    log Claim(user, amount)
+    for i in range(2):
+        if refunds[i] != 0:
+            assert ERC20(tokens[i]).transfer(user, refunds[i])
+    return remaining
 
 
 @external
+@nonreentrant("lock")
 def claim():
     """
     @notice Claim the received LP tokens
     @dev
         Can be called after liquidity is provided.
         The token amount is distributed pro-rata to the contribution.
+        The last claimer also receives the rounding dust.
+        After a partial `provide()` the excess tokens are refunded pro-rata as well.
     """
-    assert self.liquidity != 0  # dev: liquidity not seeded
+    liquidity: uint256 = self.liquidity
+    assert liquidity != 0  # dev: liquidity not seeded
     assert block.timestamp >= self.unlock # dev: liquidity is locked
-    amount: uint256 = 0
+    self._claim(msg.sender, liquidity, self.unclaimed)
+
+
+@external
+@nonreentrant("lock")
+def claim_for(users: DynArray[address, MAX_BATCH]):
+    """
+    @notice Send the received LP tokens to many depositors at once
+    @dev Same as `claim()` for each of the users, users without a balance are skipped.
+    @param users Depositors to claim for
+    """
+    liquidity: uint256 = self.liquidity
+    assert liquidity != 0  # dev: liquidity not seeded
+    assert block.timestamp >= self.unlock # dev: liquidity is locked
+    unclaimed: uint256 = self.unclaimed
+    for user in users:
+        unclaimed = self._claim(user, liquidity, unclaimed)
+
+
+@internal
+def _bail(user: address, unwrap: bool):
+    position: uint256 = self.positions[user]
+    if position == 0:
+        return
+    self.positions[user] = 0
+    amounts: uint256[2] = [self._unpack(position, 0), self._unpack(position, 1)]
+    if partial:
+        # a later `provide()` seeds only what's left, settle both sides before paying out
+        for i in range(2):
+            self.totals[i] -= amounts[i]
+    log Bail(user, amounts)
     for i in range(2):
-        amount += self.balances[msg.sender][i] * self.liquidity / self.totals[i] / 2
-        self.balances[msg.sender][i] = 0
-    assert self.pair.transfer(msg.sender, amount)
+        if unwrap and tokens[i] == weth:
+            WETH(weth).withdraw(amounts[i])
+            raw_call(user, b"", value=amounts[i])
+        else:
+            ERC20(tokens[i]).transfer(user, amounts[i])
 
 
 @external
-def bail():
+@nonreentrant("lock")
+def bail(unwrap: bool = False):
     """
     @notice Withdraw the tokens if the contract has expired without providing liquidity
     @dev
         Can be called after expiry given no liquidity has been provided.
+        A partial contract can be bailed out of until someone calls `provide()`.
+
+    @param unwrap Pay the WETH side out as ether
     """
     assert self.liquidity == 0  # dev: liquidity already seeded, use `claim()`
-    assert block.timestamp >= self.expiry  # dev: contract not expired
-    amount: uint256 = 0
-    for i in range(2):
-        amount = self.balances[msg.sender][i]
-        self.balances[msg.sender][i] = 0
-        ERC20(self.tokens[i]).transfer(msg.sender, amount)
+    assert block.timestamp >= expiry  # dev: contract not expired
+    self._bail(msg.sender, unwrap)
+
+
+@external
+@nonreentrant("lock")
+def bail_for(users: DynArray[address, MAX_BATCH]):
+    """
+    @notice Refund many depositors at once
+    @dev Same as `bail()` for each of the users, users without a balance are skipped.
+    @param users Depositors to refund
+    """
+    assert self.liquidity == 0  # dev: liquidity already seeded, use `claim_for()`
+    assert block.timestamp >= expiry  # dev: contract not expired
+    for user in users:
+        self._bail(user, False)
@@ -0,0 +1,108 @@
+# @version 0.3.10
+"""
+@title Seed liquidity factory
+@license MIT
+@author banteg
+@notice Deploy `SeedLiquidity` campaigns from one blueprint and keep a registry of them
+@dev
+    Campaigns are created from an EIP-5202 blueprint of `SeedLiquidity`, so they keep
+    their configuration in immutables. EIP-1167 forwarders can't do that, every clone
+    would have to read its configuration from storage on each call.
+"""
+
+interface SeedLiquidity:
+    def pair() -> address: view
+
+
+event SeedDeployed:
+    pair: indexed(address)
+    seed: address
+    tokens: address[2]
+    target: uint256[2]
+    expiry: uint256
+
+
+MAX_PAGE: constant(uint256) = 1000
+
+router: public(immutable(address))
+blueprint: public(immutable(address))
+
+seeds: public(HashMap[uint256, address])  # index -> seed
+seed_count: public(uint256)
+pair_seeds: HashMap[address, HashMap[uint256, address]]  # pair -> index -> seed
+pair_seed_count: public(HashMap[address, uint256])
+
+
+@external
+def __init__(_router: address, _blueprint: address):
+    """
+    @notice Set up a factory for one router
+    @param _router UniswapRouter address, e.g. 0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D
+    @param _blueprint EIP-5202 blueprint of `SeedLiquidity`
+    """
+    router = _router
+    blueprint = _blueprint
+
+
+@external
+def deploy_seed(
+    tokens: address[2], target: uint256[2], duration: uint256, locktime: uint256, partial: bool = False
+) -> address:
+    """
+    @notice Deploy a new seed liquidity contract
+    @dev Takes the same arguments as the `SeedLiquidity` constructor, except the router.
+
+    @param tokens Tokens which comprise a pair
+    @param target Amounts of tokens to provide, also determines the initial price
+    @param duration Duration over which the contract accepts deposits, in seconds
+    @param locktime How long the liquidity will stay locked, in seconds
+    @param partial Allow `provide()` after expiry with what was raised
+    @return Address of the new contract
+    """
+    seed: address = create_from_blueprint(
+        blueprint, router, tokens, target, duration, locktime, partial, code_offset=3
+    )
+    pair: address = SeedLiquidity(seed).pair()
+    index: uint256 = self.pair_seed_count[pair]
+    self.pair_seeds[pair][index] = seed
+    self.pair_seed_count[pair] = index + 1
+    index = self.seed_count
+    self.seeds[index] = seed
+    self.seed_count = index + 1
+    log SeedDeployed(pair, seed, tokens, target, block.timestamp + duration)
+    return seed
+
+
+@view
+@external
+def get_seeds(offset: uint256, limit: uint256) -> DynArray[address, MAX_PAGE]:
+    """
+    @notice Get a page of all deployed seed contracts, oldest first
+    @param offset Index of the first contract
+    @param limit Max number of contracts to return
+    """
+    result: DynArray[address, MAX_PAGE] = []
+    end: uint256 = min(offset + min(limit, MAX_PAGE), self.seed_count)
+    for i in range(MAX_PAGE):
+        if offset + i >= end:
+            break
+        result.append(self.seeds[offset + i])
+    return result
+
+
+@view
+@external
+def get_pair_seeds(pair: address, offset: uint256, limit: uint256) -> DynArray[address, MAX_PAGE]:
+    """
+    @notice Get a page of the seed contracts deployed for a Uniswap pair, oldest first
+    @param pair Uniswap pair address
+    @param offset Index of the first contract
+    @param limit Max number of contracts to return
+    """
+    result: DynArray[address, MAX_PAGE] = []
+    end: uint256 = min(offset + min(limit, MAX_PAGE), self.pair_seed_count[pair])
+    for i in range(MAX_PAGE):
+        if offset + i >= end:
+            break
+        result.append(self.pair_seeds[pair][offset + i])
+    return result
@@ -0,0 +1,379 @@
+# @version 0.3.10
+"""
+@title Pool tokens to seed many Uniswap pairs from one contract
+@license MIT
+@author banteg
+@notice Same as `SeedLiquidity`, but hosts any number of campaigns keyed by id
+@dev
+    Every campaign behaves exactly like a standalone `SeedLiquidity` contract.
+    Campaigns share the token balances of this contract, the books of each one
+    only ever pay out what was deposited into it. All entry points share one
+    reentrancy lock, so a token of one campaign can't reach into the balances
+    of the others, and tokens which take a fee on transfer are rejected.
+"""
+from vyper.interfaces import ERC20
+
+interface Factory:
+    def getPair(tokenA: address, tokenB: address) -> address: view
+    def createPair(tokenA: address, tokenB: address) -> address: nonpayable
+
+
+interface Router:
+    def factory() -> address: view
+    def addLiquidity(
+        tokenA: address,
+        tokenB: address,
+        amountADesired: uint256,
+        amountBDesired: uint256,
+        amountAMin: uint256,
+        amountBMin: uint256,
+        to: address,
+        deadline: uint256
+    ) -> (uint256, uint256, uint256): nonpayable
+
+
+struct Campaign:
+    tokens: address[2]
+    target: uint256[2]
+    pair: address
+    expiry: uint256
+    locktime: uint256
+    totals: uint256[2]
+    liquidity: uint256
+    unclaimed: uint256  # packed balances which haven't been claimed yet
+    claimed: uint256  # LP tokens paid out so far
+    unlock: uint256
+
+
+event CampaignCreated:
+    id: indexed(uint256)
+    pair: indexed(address)
+    tokens: address[2]
+    target: uint256[2]
+    expiry: uint256
+
+
+# both token balances of a user share one slot, token 0 in the low 128 bits
+BALANCE_BITS: constant(uint256) = 128
+BALANCE_MASK: constant(uint256) = 2 ** 128 - 1
+
+# max number of users served by `claim_for` and `bail_for`
+MAX_BATCH: constant(uint256) = 100
+
+router: public(immutable(Router))
+
+campaigns: HashMap[uint256, Campaign]  # id -> campaign
+campaign_count: public(uint256)
+positions: HashMap[uint256, HashMap[address, uint256]]  # id -> address -> packed balances
+
+
+@external
+def __init__(_router: address):
+    """
+    @notice Set up a campaign host for one router
+    @param _router UniswapRouter address, e.g. 0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D
+    """
+    router = Router(_router)
+
+
+@external
+@nonreentrant("lock")
+def create(tokens: address[2], target: uint256[2], duration: uint256, locktime: uint256) -> uint256:
+    """
+    @notice Start a new seed liquidity campaign
+    @dev Takes the same arguments as the `SeedLiquidity` constructor, except the router.
+
+    @param tokens Tokens which comprise a pair
+    @param target Amounts of tokens to provide, also determines the initial price
+    @param duration Duration over which the campaign accepts deposits, in seconds
+    @param locktime How long the liquidity will stay locked, in seconds
+    @return Id of the new campaign
+    """
+    for i in range(2):
+        assert target[i] <= BALANCE_MASK  # dev: target too large
+    factory: address = router.factory()
+    pair: address = Factory(factory).getPair(tokens[0], tokens[1])
+    if pair == empty(address):
+        pair = Factory(factory).createPair(tokens[0], tokens[1])
+    assert ERC20(pair).totalSupply() == 0  # dev: pair already liquid
+
+    id: uint256 = self.campaign_count
+    expiry: uint256 = block.timestamp + duration
+    self.campaigns[id] = Campaign({
+        tokens: tokens,
+        target: target,
+        pair: pair,
+        expiry: expiry,
+        locktime: locktime,
+        totals: empty(uint256[2]),
+        liquidity: 0,
+        unclaimed: 0,
+        claimed: 0,
+        unlock: 0,
+    })
+    self.campaign_count = id + 1
+    log CampaignCreated(id, pair, tokens, target, expiry)
+    return id
+
+
+@pure
+@internal
+def _unpack(position: uint256, index: uint256) -> uint256:
+    return (position >> (BALANCE_BITS * index)) & BALANCE_MASK
+
+
+@view
+@external
+def tokens(id: uint256, index: uint256) -> address:
+    return self.campaigns[id].tokens[index]
+
+
+@view
+@external
+def target(id: uint256, index: uint256) -> uint256:
+    return self.campaigns[id].target[index]
+
+
+@view
+@external
+def pair(id: uint256) -> address:
+    return self.campaigns[id].pair
+
+
+@view
+@external
+def expiry(id: uint256) -> uint256:
+    return self.campaigns[id].expiry
+
+
+@view
+@external
+def locktime(id: uint256) -> uint256:
+    return self.campaigns[id].locktime
+
+
+@view
+@external
+def totals(id: uint256, index: uint256) -> uint256:
+    return self.campaigns[id].totals[index]
+
+
+@view
+@external
+def liquidity(id: uint256) -> uint256:
+    return self.campaigns[id].liquidity
+
+
+@view
+@external
+def unlock(id: uint256) -> uint256:
+    return self.campaigns[id].unlock
+
+
+@view
+@external
+def balances(id: uint256, user: address, index: uint256) -> uint256:
+    """
+    @notice Get the amount of a token deposited by a user into a campaign
+    @param id Campaign id
+    @param user Depositor address
+    @param index Token index
+    """
+    if index > 1:
+        return 0
+    return self._unpack(self.positions[id][user], index)
+
+
+@external
+@nonreentrant("lock")
+def deposit(id: uint256, amounts: uint256[2]):
+    """
+    @notice Deposit token amounts into a campaign
+    @dev
+        A user must have approved the contract to spend both tokens.
+        The token amounts are clamped to not exceed their targets.
+        Reverts for tokens which take a fee on transfer.
+        This function only works up to the moment when liquidity is provided
+        or the campaign has expired, whichever comes first.
+
+    @param id Campaign id
+    @param amounts Token amounts to deposit
+    """
+    assert self.campaigns[id].liquidity == 0  # dev: liquidity already seeded
+    assert block.timestamp < self.campaigns[id].expiry  # dev: campaign has expired
+    # read every storage slot once and write it back once
+    position: uint256 = self.positions[id][msg.sender]
+    total: uint256 = 0
+    amount: uint256 = 0
+    token: ERC20 = empty(ERC20)
+    balance: uint256 = 0
+    for i in range(2):
+        total = self.campaigns[id].totals[i]
+        amount = min(amounts[i], self.campaigns[id].target[i] - total)
+        token = ERC20(self.campaigns[id].tokens[i])
+        balance = token.balanceOf(self)
+        assert token.transferFrom(msg.sender, self, amount)
+        # a fee would be paid out of the balances of other campaigns
+        assert token.balanceOf(self) == balance + amount  # dev: fee on transfer not supported
+        # cannot carry into the other half, balances never exceed the target
+        position += amount << (BALANCE_BITS * i)
+        self.campaigns[id].totals[i] = total + amount
+    self.positions[id][msg.sender] = position
+
+
+@external
+@nonreentrant("lock")
+def provide(id: uint256):
+    """
+    @notice Bootstrap a new Uniswap pair using the assets of a campaign
+    @dev
+        This function can only be called once per campaign and before it has expired.
+        Requires the target to be reached for both tokens.
+        Requires the pool to have no liquidity in it.
+
+    @param id Campaign id
+    """
+    assert self.campaigns[id].liquidity == 0  # dev: liquidity already seeded
+    assert block.timestamp < self.campaigns[id].expiry  # dev: campaign has expired
+    pair: ERC20 = ERC20(self.campaigns[id].pair)
+    assert pair.totalSupply() == 0  # dev: cannot seed a liquid pair
+    tokens: address[2] = self.campaigns[id].tokens
+    target: uint256[2] = self.campaigns[id].target
+    for i in range(2):
+        assert self.campaigns[id].totals[i] == target[i]  # dev: target not reached
+        assert ERC20(tokens[i]).approve(router.address, target[i])
+
+    amount0: uint256 = 0
+    amount1: uint256 = 0
+    liquidity: uint256 = 0
+    amount0, amount1, liquidity = router.addLiquidity(
+        tokens[0],
+        tokens[1],
+        target[0],
+        target[1],
+        target[0],  # don't allow slippage
+        target[1],
+        self,
+        block.timestamp
+    )
+
+    self.campaigns[id].unlock = block.timestamp + self.campaigns[id].locktime
+    # the LP tokens minted for this call, the pair balance may hold more
+    assert liquidity > 0  # dev: no liquidity provided
+    self.campaigns[id].liquidity = liquidity
+    self.campaigns[id].unclaimed = target[0] | (target[1] << BALANCE_BITS)
+
+
+@internal
+def _claim(
+    id: uint256, user: address, pair: ERC20, target: uint256[2], liquidity: uint256, unclaimed: uint256, claimed: uint256
+) -> (uint256, uint256):
+    position: uint256 = self.positions[id][user]
+    if position == 0:
+        return unclaimed, claimed
+    self.positions[id][user] = 0
+    # position halves never exceed the unclaimed halves, so there is no borrow
+    remaining: uint256 = unclaimed - position
+    amount: uint256 = 0
+    if remaining == 0:
+        # the rest of this campaign's LP, the pair balance may also hold other campaigns'
+        amount = liquidity - claimed
+    else:
+        # each token side is entitled to half of the liquidity
+        for i in range(2):
+            amount += self._unpack(position, i) * liquidity / (2 * target[i])
+    assert pair.transfer(user, amount)
+    return remaining, claimed + amount
+
+
+@external
+@nonreentrant("lock")
+def claim(id: uint256):
+    """
+    @notice Claim the LP tokens received by a campaign
+    @dev
+        Can be called after liquidity is provided.
+        The token amount is distributed pro-rata to the contribution.
+        The last claimer also receives the rounding dust.
+
+    @param id Campaign id
+    """
+    liquidity: uint256 = self.campaigns[id].liquidity
+    assert liquidity != 0  # dev: liquidity not seeded
+    assert block.timestamp >= self.campaigns[id].unlock # dev: liquidity is locked
+    unclaimed: uint256 = 0
+    claimed: uint256 = 0
+    unclaimed, claimed = self._claim(
+        id,
+        msg.sender,
+        ERC20(self.campaigns[id].pair),
+        self.campaigns[id].target,
+        liquidity,
+        self.campaigns[id].unclaimed,
+        self.campaigns[id].claimed,
+    )
+    self.campaigns[id].unclaimed = unclaimed
+    self.campaigns[id].claimed = claimed
+
+
+@external
+@nonreentrant("lock")
+def claim_for(id: uint256, users: DynArray[address, MAX_BATCH]):
+    """
+    @notice Send the LP tokens received by a campaign to many depositors at once
+    @dev Same as `claim()` for each of the users, users without a balance are skipped.
+    @param id Campaign id
+    @param users Depositors to claim for
+    """
+    liquidity: uint256 = self.campaigns[id].liquidity
+    assert liquidity != 0  # dev: liquidity not seeded
+    assert block.timestamp >= self.campaigns[id].unlock # dev: liquidity is locked
+    pair: ERC20 = ERC20(self.campaigns[id].pair)
+    target: uint256[2] = self.campaigns[id].target
+    unclaimed: uint256 = self.campaigns[id].unclaimed
+    claimed: uint256 = self.campaigns[id].claimed
+    for user in users:
+        unclaimed, claimed = self._claim(id, user, pair, target, liquidity, unclaimed, claimed)
+    self.campaigns[id].unclaimed = unclaimed
+    self.campaigns[id].claimed = claimed
+
+
+@internal
+def _bail(id: uint256, user: address, tokens: address[2]):
+    position: uint256 = self.positions[id][user]
+    if position == 0:
+        return
+    self.positions[id][user] = 0
+    for i in range(2):
+        ERC20(tokens[i]).transfer(user, self._unpack(position, i))
+
+
+@external
+@nonreentrant("lock")
+def bail(id: uint256):
+    """
+    @notice Withdraw the tokens if a campaign has expired without providing liquidity
+    @dev
+        Can be called after expiry given no liquidity has been provided.
+
+    @param id Campaign id
+    """
+    assert self.campaigns[id].liquidity == 0  # dev: liquidity already seeded, use `claim()`
+    assert block.timestamp >= self.campaigns[id].expiry  # dev: campaign not expired
+    self._bail(id, msg.sender, self.campaigns[id].tokens)
+
+
+@external
+@nonreentrant("lock")
+def bail_for(id: uint256, users: DynArray[address, MAX_BATCH]):
+    """
+    @notice Refund many depositors of a campaign at once
+    @dev Same as `bail()` for each of the users, users without a balance are skipped.
+    @param id Campaign id
+    @param users Depositors to refund
+    """
+    assert self.campaigns[id].liquidity == 0  # dev: liquidity already seeded, use `claim_for()`
+    assert block.timestamp >= self.campaigns[id].expiry  # dev: campaign not expired
+    tokens: address[2] = self.campaigns[id].tokens
+    for user in users:
+        self._bail(id, user, tokens)
@@ -0,0 +1,70 @@
+# @version 0.2.8
+"""
+@title Mock ERC20
+@license MIT
+@notice Minimal ERC20 used as a stand-in for real tokens in local tests
+"""
+from vyper.interfaces import ERC20
+
+implements: ERC20
+
+
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    value: uint256
+
+event Approval:
+    owner: indexed(address)
+    spender: indexed(address)
+    value: uint256
+
+
+name: public(String[64])
+symbol: public(String[32])
+decimals: public(uint256)
+totalSupply: public(uint256)
+balanceOf: public(HashMap[address, uint256])
+allowance: public(HashMap[address, HashMap[address, uint256]])
+
+
+@external
+def __init__(name: String[64], symbol: String[32], decimals: uint256, supply: uint256):
+    """
+    @notice Deploy a token and mint the whole supply to the deployer
+
+    @param name Token name
+    @param symbol Token symbol
+    @param decimals Number of decimals
+    @param supply Amount of tokens minted to the deployer
+    """
+    self.name = name
+    self.symbol = symbol
+    self.decimals = decimals
+    self.totalSupply = supply
+    self.balanceOf[msg.sender] = supply
+    log Transfer(ZERO_ADDRESS, msg.sender, supply)
+
+
+@external
+def transfer(receiver: address, amount: uint256) -> bool:
+    self.balanceOf[msg.sender] -= amount
+    self.balanceOf[receiver] += amount
+    log Transfer(msg.sender, receiver, amount)
+    return True
+
+
+@external
+def transferFrom(sender: address, receiver: address, amount: uint256) -> bool:
+    self.allowance[sender][msg.sender] -= amount
+    self.balanceOf[sender] -= amount
+    self.balanceOf[receiver] += amount
+    log Transfer(sender, receiver, amount)
+    return True
+
+
+@external
+def approve(spender: address, amount: uint256) -> bool:
+    self.allowance[msg.sender][spender] = amount
+    log Approval(msg.sender, spender, amount)
+    return True
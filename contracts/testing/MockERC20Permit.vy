@@ -0,0 +1,124 @@
+# @version 0.3.10
+"""
+@title Mock ERC20 with permit
+@license MIT
+@notice Minimal ERC20 with EIP-2612 `permit`, used as a stand-in for real tokens in local tests
+"""
+from vyper.interfaces import ERC20
+
+implements: ERC20
+
+
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    value: uint256
+
+event Approval:
+    owner: indexed(address)
+    spender: indexed(address)
+    value: uint256
+
+
+name: public(String[64])
+symbol: public(String[32])
+decimals: public(uint256)
+totalSupply: public(uint256)
+balanceOf: public(HashMap[address, uint256])
+allowance: public(HashMap[address, HashMap[address, uint256]])
+nonces: public(HashMap[address, uint256])
+DOMAIN_SEPARATOR: public(bytes32)
+
+DOMAIN_TYPE_HASH: constant(bytes32) = keccak256("EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+PERMIT_TYPE_HASH: constant(bytes32) = keccak256("Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)")
+
+
+@external
+def __init__(name: String[64], symbol: String[32], decimals: uint256, supply: uint256):
+    """
+    @notice Deploy a token and mint the whole supply to the deployer
+
+    @param name Token name
+    @param symbol Token symbol
+    @param decimals Number of decimals
+    @param supply Amount of tokens minted to the deployer
+    """
+    self.name = name
+    self.symbol = symbol
+    self.decimals = decimals
+    self.totalSupply = supply
+    self.balanceOf[msg.sender] = supply
+    self.DOMAIN_SEPARATOR = keccak256(
+        concat(
+            DOMAIN_TYPE_HASH,
+            keccak256(name),
+            keccak256("1"),
+            convert(chain.id, bytes32),
+            convert(self, bytes32),
+        )
+    )
+    log Transfer(empty(address), msg.sender, supply)
+
+
+@external
+def transfer(receiver: address, amount: uint256) -> bool:
+    self.balanceOf[msg.sender] -= amount
+    self.balanceOf[receiver] += amount
+    log Transfer(msg.sender, receiver, amount)
+    return True
+
+
+@external
+def transferFrom(sender: address, receiver: address, amount: uint256) -> bool:
+    self.allowance[sender][msg.sender] -= amount
+    self.balanceOf[sender] -= amount
+    self.balanceOf[receiver] += amount
+    log Transfer(sender, receiver, amount)
+    return True
+
+
+@external
+def approve(spender: address, amount: uint256) -> bool:
+    self.allowance[msg.sender][spender] = amount
+    log Approval(msg.sender, spender, amount)
+    return True
+
+
+@external
+def permit(owner: address, spender: address, amount: uint256, deadline: uint256, v: uint8, r: bytes32, s: bytes32) -> bool:
+    """
+    @notice Approve `spender` with an EIP-2612 signature of `owner`
+
+    @param owner Token holder who signed the permit
+    @param spender Address allowed to spend the tokens
+    @param amount Allowance to set
+    @param deadline Timestamp after which the signature is invalid
+    @param v Signature `v`
+    @param r Signature `r`
+    @param s Signature `s`
+    """
+    assert owner != empty(address)  # dev: invalid owner
+    assert deadline >= block.timestamp  # dev: permit expired
+    nonce: uint256 = self.nonces[owner]
+    digest: bytes32 = keccak256(
+        concat(
+            b"\x19\x01",
+            self.DOMAIN_SEPARATOR,
+            keccak256(
+                concat(
+                    PERMIT_TYPE_HASH,
+                    convert(owner, bytes32),
+                    convert(spender, bytes32),
+                    convert(amount, bytes32),
+                    convert(nonce, bytes32),
+                    convert(deadline, bytes32),
+                )
+            ),
+        )
+    )
+    signer: address = ecrecover(digest, convert(v, uint256), convert(r, uint256), convert(s, uint256))
+    assert signer == owner  # dev: invalid signature
+    self.nonces[owner] = nonce + 1
+    self.allowance[owner][spender] = amount
+    log Approval(owner, spender, amount)
+    return True
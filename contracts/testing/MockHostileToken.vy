@@ -0,0 +1,103 @@
+# @version 0.3.10
+"""
+@title Mock hostile ERC20
+@license MIT
+@notice
+    ERC20 which can burn a fee from every transfer and call back into a contract
+    from `transferFrom`, used to test the seed contracts against such tokens
+"""
+from vyper.interfaces import ERC20
+
+implements: ERC20
+
+
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    value: uint256
+
+event Approval:
+    owner: indexed(address)
+    spender: indexed(address)
+    value: uint256
+
+
+name: public(String[64])
+symbol: public(String[32])
+decimals: public(uint256)
+totalSupply: public(uint256)
+balanceOf: public(HashMap[address, uint256])
+allowance: public(HashMap[address, HashMap[address, uint256]])
+
+fee: public(uint256)  # basis points burned from every transfer
+hook: public(address)  # called once by the next `transferFrom`
+hook_data: public(Bytes[256])
+hook_success: public(bool)  # whether the last callback succeeded
+
+
+@external
+def __init__(name: String[64], symbol: String[32], decimals: uint256, supply: uint256):
+    """
+    @notice Deploy a token and mint the whole supply to the deployer
+
+    @param name Token name
+    @param symbol Token symbol
+    @param decimals Number of decimals
+    @param supply Amount of tokens minted to the deployer
+    """
+    self.name = name
+    self.symbol = symbol
+    self.decimals = decimals
+    self.totalSupply = supply
+    self.balanceOf[msg.sender] = supply
+    log Transfer(empty(address), msg.sender, supply)
+
+
+@external
+def set_fee(fee: uint256):
+    """
+    @notice Burn `fee` basis points from every transfer
+    """
+    self.fee = fee
+
+
+@external
+def set_hook(target: address, data: Bytes[256]):
+    """
+    @notice Call `target` with `data` from the next `transferFrom`, before moving the tokens
+    """
+    self.hook = target
+    self.hook_data = data
+
+
+@internal
+def _transfer(sender: address, receiver: address, amount: uint256):
+    burned: uint256 = amount * self.fee / 10000
+    self.balanceOf[sender] -= amount
+    self.balanceOf[receiver] += amount - burned
+    self.totalSupply -= burned
+    log Transfer(sender, receiver, amount - burned)
+
+
+@external
+def transfer(receiver: address, amount: uint256) -> bool:
+    self._transfer(msg.sender, receiver, amount)
+    return True
+
+
+@external
+def transferFrom(sender: address, receiver: address, amount: uint256) -> bool:
+    self.allowance[sender][msg.sender] -= amount
+    hook: address = self.hook
+    if hook != empty(address):
+        self.hook = empty(address)
+        self.hook_success = raw_call(hook, self.hook_data, revert_on_failure=False)
+    self._transfer(sender, receiver, amount)
+    return True
+
+
+@external
+def approve(spender: address, amount: uint256) -> bool:
+    self.allowance[msg.sender][spender] = amount
+    log Approval(msg.sender, spender, amount)
+    return True
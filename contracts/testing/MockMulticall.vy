@@ -0,0 +1,38 @@
+# @version 0.3.10
+"""
+@title Mock Multicall
+@license MIT
+@notice Local stand-in for Multicall3, only implements `tryAggregate`
+"""
+
+MAX_CALLS: constant(uint256) = 500
+MAX_CALLDATA: constant(uint256) = 164
+MAX_RETURNDATA: constant(uint256) = 512
+
+
+struct Call:
+    target: address
+    callData: Bytes[MAX_CALLDATA]
+
+struct Result:
+    success: bool
+    returnData: Bytes[MAX_RETURNDATA]
+
+
+@external
+def tryAggregate(requireSuccess: bool, calls: DynArray[Call, MAX_CALLS]) -> DynArray[Result, MAX_CALLS]:
+    """
+    @notice Make many calls and return all results
+    @param requireSuccess Revert if any of the calls fails
+    @param calls Targets and call data
+    """
+    results: DynArray[Result, MAX_CALLS] = []
+    success: bool = False
+    data: Bytes[MAX_RETURNDATA] = b""
+    for call in calls:
+        success, data = raw_call(
+            call.target, call.callData, max_outsize=MAX_RETURNDATA, revert_on_failure=False
+        )
+        assert success or not requireSuccess  # dev: call failed
+        results.append(Result({success: success, returnData: data}))
+    return results
@@ -0,0 +1,38 @@
+# @version 0.3.10
+"""
+@title Mock contract depositor
+@license MIT
+@notice
+    Forwards calls to other contracts and calls back into a contract when it
+    receives ether, used to test the seed contracts against reentrancy
+"""
+
+hook: public(address)  # called once on the next ether received
+hook_data: public(Bytes[256])
+hook_success: public(bool)  # whether the last callback succeeded
+
+
+@external
+def execute(target: address, data: Bytes[1024]):
+    """
+    @notice Call `target` with `data` from this contract
+    """
+    raw_call(target, data)
+
+
+@external
+def set_hook(target: address, data: Bytes[256]):
+    """
+    @notice Call `target` with `data` when this contract next receives ether
+    """
+    self.hook = target
+    self.hook_data = data
+
+
+@external
+@payable
+def __default__():
+    hook: address = self.hook
+    if hook != empty(address):
+        self.hook = empty(address)
+        self.hook_success = raw_call(hook, self.hook_data, revert_on_failure=False)
@@ -0,0 +1,69 @@
+# @version 0.3.10
+"""
+@title Mock Uniswap V2 factory
+@license MIT
+@notice
+    Local stand-in for UniswapV2Factory, deploys pairs as minimal proxies.
+    Pairs are deployed with CREATE2 and the UniswapV2Factory salt, so their
+    address can be derived from `INIT_CODE_PAIR_HASH` like on a real factory.
+"""
+
+interface Pair:
+    def initialize(token0: address, token1: address): nonpayable
+
+
+event PairCreated:
+    token0: indexed(address)
+    token1: indexed(address)
+    pair: address
+    index: uint256
+
+
+implementation: public(address)
+INIT_CODE_PAIR_HASH: public(bytes32)  # hash of the minimal proxy deployment code
+getPair: public(HashMap[address, HashMap[address, address]])
+allPairs: public(HashMap[uint256, address])
+allPairsLength: public(uint256)
+
+
+@external
+def __init__(implementation: address):
+    """
+    @param implementation `MockUniswapPair` deployment the pairs forward to
+    """
+    self.implementation = implementation
+    # the code deployed by `create_minimal_proxy_to`
+    self.INIT_CODE_PAIR_HASH = keccak256(
+        concat(
+            b"\x60\x2d\x3d\x81\x60\x09\x3d\x39\xf3\x36\x3d\x3d\x37\x3d\x3d\x3d\x36\x3d\x73",
+            convert(implementation, bytes20),
+            b"\x5a\xf4\x3d\x82\x80\x3e\x90\x3d\x91\x60\x2b\x57\xfd\x5b\xf3",
+        )
+    )
+
+
+@external
+def createPair(tokenA: address, tokenB: address) -> address:
+    """
+    @notice Deploy a pair for two tokens
+    @return Address of the new pair
+    """
+    assert tokenA != tokenB  # dev: identical addresses
+    token0: address = tokenA
+    token1: address = tokenB
+    if convert(tokenB, uint256) < convert(tokenA, uint256):
+        token0 = tokenB
+        token1 = tokenA
+    assert token0 != empty(address)  # dev: zero address
+    assert self.getPair[token0][token1] == empty(address)  # dev: pair exists
+
+    salt: bytes32 = keccak256(concat(convert(token0, bytes20), convert(token1, bytes20)))
+    pair: address = create_minimal_proxy_to(self.implementation, salt=salt)
+    Pair(pair).initialize(token0, token1)
+    self.getPair[token0][token1] = pair
+    self.getPair[token1][token0] = pair
+    index: uint256 = self.allPairsLength
+    self.allPairs[index] = pair
+    self.allPairsLength = index + 1
+    log PairCreated(token0, token1, pair, index + 1)
+    return pair
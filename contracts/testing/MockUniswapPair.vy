@@ -0,0 +1,136 @@
+# @version 0.2.8
+"""
+@title Mock Uniswap V2 pair
+@license MIT
+@notice
+    Local stand-in for UniswapV2Pair. Implements the LP token and the `mint`
+    accounting, including the permanent `MINIMUM_LIQUIDITY` burn on the first mint.
+    Deployed by `MockUniswapFactory` as a minimal proxy and set up via `initialize`.
+"""
+from vyper.interfaces import ERC20
+
+implements: ERC20
+
+
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    value: uint256
+
+event Approval:
+    owner: indexed(address)
+    spender: indexed(address)
+    value: uint256
+
+event Mint:
+    sender: indexed(address)
+    amount0: uint256
+    amount1: uint256
+
+
+MINIMUM_LIQUIDITY: constant(uint256) = 1000
+
+name: public(String[64])
+symbol: public(String[32])
+decimals: public(uint256)
+totalSupply: public(uint256)
+balanceOf: public(HashMap[address, uint256])
+allowance: public(HashMap[address, HashMap[address, uint256]])
+
+factory: public(address)
+token0: public(address)
+token1: public(address)
+reserve0: uint256
+reserve1: uint256
+
+
+@external
+def initialize(token0: address, token1: address):
+    """
+    @notice Set the pair tokens, called once by the factory
+    """
+    assert self.factory == ZERO_ADDRESS  # dev: already initialized
+    self.factory = msg.sender
+    self.token0 = token0
+    self.token1 = token1
+    self.name = "Uniswap V2"
+    self.symbol = "UNI-V2"
+    self.decimals = 18
+
+
+@internal
+@pure
+def _sqrt(x: uint256) -> uint256:
+    if x == 0:
+        return 0
+    z: uint256 = x / 2 + 1
+    y: uint256 = x
+    for i in range(256):
+        if z >= y:
+            break
+        y = z
+        z = (x / z + z) / 2
+    return y
+
+
+@internal
+def _mint(receiver: address, amount: uint256):
+    self.totalSupply += amount
+    self.balanceOf[receiver] += amount
+    log Transfer(ZERO_ADDRESS, receiver, amount)
+
+
+@view
+@external
+def getReserves() -> (uint256, uint256, uint256):
+    return self.reserve0, self.reserve1, block.timestamp
+
+
+@external
+def mint(to: address) -> uint256:
+    """
+    @notice Mint LP tokens for the tokens sent to the pair since the last sync
+    @param to Receiver of the LP tokens
+    @return Amount of LP tokens minted
+    """
+    balance0: uint256 = ERC20(self.token0).balanceOf(self)
+    balance1: uint256 = ERC20(self.token1).balanceOf(self)
+    amount0: uint256 = balance0 - self.reserve0
+    amount1: uint256 = balance1 - self.reserve1
+    supply: uint256 = self.totalSupply
+    liquidity: uint256 = 0
+    if supply == 0:
+        liquidity = self._sqrt(amount0 * amount1) - MINIMUM_LIQUIDITY
+        self._mint(ZERO_ADDRESS, MINIMUM_LIQUIDITY)  # permanently lock the first tokens
+    else:
+        liquidity = min(amount0 * supply / self.reserve0, amount1 * supply / self.reserve1)
+    assert liquidity > 0  # dev: insufficient liquidity minted
+    self._mint(to, liquidity)
+    self.reserve0 = balance0
+    self.reserve1 = balance1
+    log Mint(msg.sender, amount0, amount1)
+    return liquidity
+
+
+@external
+def transfer(receiver: address, amount: uint256) -> bool:
+    self.balanceOf[msg.sender] -= amount
+    self.balanceOf[receiver] += amount
+    log Transfer(msg.sender, receiver, amount)
+    return True
+
+
+@external
+def transferFrom(sender: address, receiver: address, amount: uint256) -> bool:
+    self.allowance[sender][msg.sender] -= amount
+    self.balanceOf[sender] -= amount
+    self.balanceOf[receiver] += amount
+    log Transfer(sender, receiver, amount)
+    return True
+
+
+@external
+def approve(spender: address, amount: uint256) -> bool:
+    self.allowance[msg.sender][spender] = amount
+    log Approval(msg.sender, spender, amount)
+    return True
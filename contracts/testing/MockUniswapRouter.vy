@@ -0,0 +1,74 @@
+# @version 0.2.8
+"""
+@title Mock Uniswap V2 router
+@license MIT
+@notice Local stand-in for UniswapV2Router02, only implements `addLiquidity`
+"""
+from vyper.interfaces import ERC20
+
+interface Factory:
+    def getPair(tokenA: address, tokenB: address) -> address: view
+    def createPair(tokenA: address, tokenB: address) -> address: nonpayable
+
+interface Pair:
+    def token0() -> address: view
+    def getReserves() -> (uint256, uint256, uint256): view
+    def mint(to: address) -> uint256: nonpayable
+
+
+factory: public(address)
+WETH: public(address)
+
+
+@external
+def __init__(factory: address, weth: address):
+    self.factory = factory
+    self.WETH = weth
+
+
+@external
+def addLiquidity(
+    tokenA: address,
+    tokenB: address,
+    amountADesired: uint256,
+    amountBDesired: uint256,
+    amountAMin: uint256,
+    amountBMin: uint256,
+    to: address,
+    deadline: uint256
+) -> (uint256, uint256, uint256):
+    """
+    @notice Add liquidity to a pair, creating it if it doesn't exist
+    @dev Follows the UniswapV2Router02 amount quoting and slippage checks
+    """
+    assert deadline >= block.timestamp  # dev: expired
+    pair: address = Factory(self.factory).getPair(tokenA, tokenB)
+    if pair == ZERO_ADDRESS:
+        pair = Factory(self.factory).createPair(tokenA, tokenB)
+
+    reserve0: uint256 = 0
+    reserve1: uint256 = 0
+    last_update: uint256 = 0
+    reserve0, reserve1, last_update = Pair(pair).getReserves()
+    reserveA: uint256 = reserve0
+    reserveB: uint256 = reserve1
+    if Pair(pair).token0() != tokenA:
+        reserveA = reserve1
+        reserveB = reserve0
+
+    amountA: uint256 = amountADesired
+    amountB: uint256 = amountBDesired
+    if reserveA != 0 or reserveB != 0:
+        amountBOptimal: uint256 = amountADesired * reserveB / reserveA
+        if amountBOptimal <= amountBDesired:
+            assert amountBOptimal >= amountBMin  # dev: insufficient B amount
+            amountB = amountBOptimal
+        else:
+            amountAOptimal: uint256 = amountBDesired * reserveA / reserveB
+            assert amountAOptimal >= amountAMin  # dev: insufficient A amount
+            amountA = amountAOptimal
+
+    assert ERC20(tokenA).transferFrom(msg.sender, pair, amountA)
+    assert ERC20(tokenB).transferFrom(msg.sender, pair, amountB)
+    liquidity: uint256 = Pair(pair).mint(to)
+    return amountA, amountB, liquidity
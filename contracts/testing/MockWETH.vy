@@ -0,0 +1,105 @@
+# @version 0.2.8
+"""
+@title Mock WETH9
+@license MIT
+@notice Wrapped Ether with the WETH9 interface, used as a stand-in for mainnet WETH in local tests
+"""
+from vyper.interfaces import ERC20
+
+implements: ERC20
+
+
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    value: uint256
+
+event Approval:
+    owner: indexed(address)
+    spender: indexed(address)
+    value: uint256
+
+event Deposit:
+    dst: indexed(address)
+    wad: uint256
+
+event Withdrawal:
+    src: indexed(address)
+    wad: uint256
+
+
+name: public(String[64])
+symbol: public(String[32])
+decimals: public(uint256)
+balanceOf: public(HashMap[address, uint256])
+allowance: public(HashMap[address, HashMap[address, uint256]])
+
+
+@external
+def __init__():
+    self.name = "Wrapped Ether"
+    self.symbol = "WETH"
+    self.decimals = 18
+
+
+@view
+@external
+def totalSupply() -> uint256:
+    return self.balance
+
+
+@internal
+def _deposit(dst: address, wad: uint256):
+    self.balanceOf[dst] += wad
+    log Deposit(dst, wad)
+
+
+@external
+@payable
+def __default__():
+    self._deposit(msg.sender, msg.value)
+
+
+@external
+@payable
+def deposit():
+    """
+    @notice Wrap the sent ether
+    """
+    self._deposit(msg.sender, msg.value)
+
+
+@external
+def withdraw(wad: uint256):
+    """
+    @notice Unwrap tokens and send the ether to the caller
+    @dev Forwards only the call stipend, same as WETH9
+    @param wad Amount to unwrap
+    """
+    self.balanceOf[msg.sender] -= wad
+    send(msg.sender, wad)
+    log Withdrawal(msg.sender, wad)
+
+
+@external
+def transfer(receiver: address, amount: uint256) -> bool:
+    self.balanceOf[msg.sender] -= amount
+    self.balanceOf[receiver] += amount
+    log Transfer(msg.sender, receiver, amount)
+    return True
+
+
+@external
+def transferFrom(sender: address, receiver: address, amount: uint256) -> bool:
+    self.allowance[sender][msg.sender] -= amount
+    self.balanceOf[sender] -= amount
+    self.balanceOf[receiver] += amount
+    log Transfer(sender, receiver, amount)
+    return True
+
+
+@external
+def approve(spender: address, amount: uint256) -> bool:
+    self.allowance[msg.sender][spender] = amount
+    log Approval(msg.sender, spender, amount)
+    return True
@@ -0,0 +1,125 @@
+"""
+Stream `SeedLiquidity` events into a local SQLite database.
+
+Logs are fetched in block-range chunks and written together with a checkpoint
+of the last processed block in one transaction, so an interrupted run resumes
+where it stopped and a repeated run only fetches the new blocks.
+
+    brownie run indexer main <seed address> [database path] [start block] --network mainnet
+
+Pass the deployment block of the seed as the start block, the first run
+otherwise scans the chain from genesis.
+"""
+import sqlite3
+
+from eth_utils import event_abi_to_log_topic, to_checksum_address
+
+EVENTS = ("Deposit", "Provide", "Claim", "Bail")
+
+# token amounts don't fit SQLite's 64-bit integers, they are stored as decimal text
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seed TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    event TEXT NOT NULL,
+    user TEXT NOT NULL,
+    amount0 TEXT,
+    amount1 TEXT,
+    liquidity TEXT,
+    PRIMARY KEY (seed, block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_user ON events (seed, user);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    seed TEXT PRIMARY KEY,
+    block_number INTEGER NOT NULL
+);
+"""
+
+
+class Indexer:
+    """
+    Index the events of one seed contract.
+
+    `start_block` should be the deployment block, earlier blocks hold no events.
+    `confirmations` keeps the indexer that many blocks behind the head, so
+    shallow reorgs never reach the database.
+    """
+
+    def __init__(self, web3, address, abi, db_path, chunk_size=2000, start_block=0, confirmations=0):
+        self.web3 = web3
+        self.address = to_checksum_address(str(address))
+        self.chunk_size = chunk_size
+        self.start_block = start_block
+        self.confirmations = confirmations
+        self.contract = web3.eth.contract(address=self.address, abi=abi)
+        self.events = {}
+        for item in abi:
+            if item["type"] == "event" and item["name"] in EVENTS:
+                self.events[event_abi_to_log_topic(item)] = getattr(self.contract.events, item["name"])()
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+
+    @property
+    def checkpoint(self):
+        """Last processed block, or `start_block - 1` before the first run."""
+        row = self.db.execute("SELECT block_number FROM checkpoints WHERE seed = ?", (self.address,)).fetchone()
+        return row[0] if row else self.start_block - 1
+
+    def sync(self, to_block=None):
+        """
+        Index all blocks after the checkpoint up to `to_block`, the confirmed head by default.
+        Returns the number of stored events.
+        """
+        if to_block is None:
+            to_block = self.web3.eth.block_number - self.confirmations
+        stored = 0
+        start = self.checkpoint + 1
+        while start <= to_block:
+            end = min(start + self.chunk_size - 1, to_block)
+            stored += self._index(start, end)
+            start = end + 1
+        return stored
+
+    def _index(self, from_block, to_block):
+        logs = self.web3.eth.get_logs(
+            {
+                "address": self.address,
+                "fromBlock": from_block,
+                "toBlock": to_block,
+                "topics": [list(self.events)],
+            }
+        )
+        rows = [self._row(log) for log in logs]
+        with self.db:
+            self.db.executemany("INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self.db.execute(
+                "INSERT OR REPLACE INTO checkpoints (seed, block_number) VALUES (?, ?)",
+                (self.address, to_block),
+            )
+        return len(rows)
+
+    def _row(self, log):
+        event = self.events[bytes(log["topics"][0])].process_log(log)
+        args = event["args"]
+        amounts = args.get("amounts", (None, None))
+        liquidity = args.get("liquidity")
+        return (
+            self.address,
+            log["blockNumber"],
+            log["logIndex"],
+            "0x" + bytes(log["transactionHash"]).hex(),
+            event["event"],
+            args["user"] if "user" in args else args["caller"],
+            *(str(amount) if amount is not None else None for amount in amounts),
+            str(liquidity) if liquidity is not None else None,
+        )
+
+
+def main(address, db_path="seed.db", start_block="0"):
+    from brownie import SeedLiquidity, web3
+
+    indexer = Indexer(web3, address, SeedLiquidity.abi, db_path, start_block=int(start_block), confirmations=12)
+    stored = indexer.sync()
+    print(f"indexed {stored} events up to block {indexer.checkpoint}")
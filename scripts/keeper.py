@@ -0,0 +1,203 @@
+"""
+Keeper that watches many `SeedLiquidity` contracts and acts on them.
+
+Every round reads `state()` of all seeds concurrently, then:
+
+- calls `provide()` on every seed which is ready, before it can expire
+- reports every seed which expired without liquidity and still holds deposits,
+  and with `refund` enabled sends `bail_for()` batches to return them
+
+Transactions are signed locally with one key. Nonces are assigned by the keeper,
+so transactions to different seeds go out in the same round without waiting
+for each other, and the gas price is capped by `max_gas_price`. A transaction
+which isn't mined in time keeps its nonce and is replaced at a higher gas price
+in a later round. A seed which fails, e.g. on an RPC error, is logged and
+checked again in the next round.
+
+    brownie run keeper main <account id> <seed address> [<seed address> ...] --network mainnet
+"""
+import asyncio
+import logging
+
+from eth_account import Account
+from eth_utils import to_checksum_address
+from web3.exceptions import TimeExhausted
+
+log = logging.getLogger(__name__)
+
+PHASE_READY = 1
+PHASE_BAILABLE = 4
+MAX_BATCH = 100  # same as `SeedLiquidity.MAX_BATCH`
+MAX_PAGE = 1000  # same as `SeedLiquidity.MAX_PAGE`
+
+
+class Keeper:
+    """
+    `abi` is the `SeedLiquidity` ABI, `private_key` signs and pays for all transactions.
+    `gas_price_multiplier` is applied to the node's gas price, rounds where the
+    result exceeds `max_gas_price` are skipped and retried on the next round.
+    """
+
+    def __init__(
+        self,
+        web3,
+        private_key,
+        seeds,
+        abi,
+        max_gas_price=None,
+        gas_price_multiplier=1.0,
+        refund=False,
+    ):
+        self.web3 = web3
+        self.account = Account.from_key(private_key)
+        self.abi = abi
+        self.max_gas_price = max_gas_price
+        self.gas_price_multiplier = gas_price_multiplier
+        self.refund = refund
+        self.seeds = {}
+        for seed in seeds:
+            self.add_seed(seed)
+        self.nonce = None
+        self.nonce_lock = None
+        self.pending = set()  # seeds with a transaction in flight
+        self.stuck = {}  # seed -> (nonce, gas price) of a transaction which wasn't mined in time
+
+    def add_seed(self, seed):
+        address = to_checksum_address(str(seed))
+        self.seeds[address] = self.web3.eth.contract(address=address, abi=self.abi)
+
+    async def tick(self):
+        """
+        Check all seeds once and act on them.
+        Returns `(seed, action, tx hashes)` for every seed that needed an action.
+        """
+        # sends within one round share the nonce counter
+        self.nonce_lock = asyncio.Lock()
+        results = await asyncio.gather(*(self.check(seed) for seed in self.seeds))
+        return [result for result in results if result is not None]
+
+    async def run(self, interval=12, rounds=None):
+        """Check all seeds every `interval` seconds, forever or for `rounds` rounds."""
+        while rounds is None or rounds > 0:
+            for seed, action, txs in await self.tick():
+                log.info("%s %s %s", seed, action, [tx.hex() for tx in txs])
+            if rounds is not None:
+                rounds -= 1
+            await asyncio.sleep(interval)
+
+    async def check(self, seed):
+        """Act on one seed, returns `(seed, action, tx hashes)` or None."""
+        try:
+            return await self._check(seed)
+        except Exception as exc:
+            # one seed never stops the others, it's checked again next round
+            log.error("%s failed: %r", seed, exc)
+            return None
+
+    async def _check(self, seed):
+        if seed in self.pending:
+            return None
+        if seed in self.stuck:
+            mined = await asyncio.to_thread(self.web3.eth.get_transaction_count, self.account.address, "latest")
+            if mined > self.stuck[seed][0]:
+                # the stuck transaction or another one with its nonce went through
+                del self.stuck[seed]
+        contract = self.seeds[seed]
+        state = await asyncio.to_thread(contract.functions.state().call)
+        phase = state[-1]
+        if phase == PHASE_READY:
+            return seed, "provide", await self._send(seed, contract.functions.provide())
+        if phase == PHASE_BAILABLE:
+            depositors = await asyncio.to_thread(self.depositors, seed)
+            if not depositors:
+                return None
+            if not self.refund:
+                return seed, "bail_due", []
+            txs = []
+            for i in range(0, len(depositors), MAX_BATCH):
+                txs += await self._send(seed, contract.functions.bail_for(depositors[i : i + MAX_BATCH]))
+                if seed in self.stuck:
+                    # the next round replaces this batch first
+                    break
+            return seed, "bail_for", txs
+        return None
+
+    def depositors(self, seed):
+        """Depositors of `seed` with a balance left, paged from its depositor index."""
+        functions = self.seeds[seed].functions
+        users = []
+        for offset in range(0, functions.depositor_count().call(), MAX_PAGE):
+            users += [user for user, balances in functions.get_depositors(offset, MAX_PAGE).call() if any(balances)]
+        return users
+
+    async def gas_price(self, replaced=None):
+        """Gas price for a new transaction, `replaced` is the gas price of the transaction it replaces."""
+        price = int(await asyncio.to_thread(lambda: self.web3.eth.gas_price) * self.gas_price_multiplier)
+        if replaced is not None:
+            # nodes only accept a replacement paying at least 10% more
+            price = max(price, replaced * 11 // 10 + 1)
+        if self.max_gas_price is not None and price > self.max_gas_price:
+            return None
+        return price
+
+    async def _send(self, seed, function):
+        """Sign and send a transaction, wait for it to be mined and return its hash in a list."""
+        stuck = self.stuck.get(seed)
+        gas_price = await self.gas_price(stuck[1] if stuck else None)
+        if gas_price is None:
+            log.warning("gas price above %s, skipping %s", self.max_gas_price, seed)
+            return []
+        try:
+            # fails if someone else acted on the seed first
+            gas = await asyncio.to_thread(function.estimate_gas, {"from": self.account.address})
+        except Exception as exc:
+            log.warning("%s would revert: %s", seed, exc)
+            return []
+
+        self.pending.add(seed)
+        try:
+            async with self.nonce_lock:
+                if self.nonce is None:
+                    self.nonce = await asyncio.to_thread(
+                        self.web3.eth.get_transaction_count, self.account.address, "pending"
+                    )
+                # a replacement reuses the nonce of the stuck transaction
+                nonce = stuck[0] if stuck else self.nonce
+                tx = function.build_transaction(
+                    {
+                        "from": self.account.address,
+                        "nonce": nonce,
+                        "gas": gas * 12 // 10,
+                        "gasPrice": gas_price,
+                        "chainId": self.web3.eth.chain_id,
+                    }
+                )
+                signed = self.account.sign_transaction(tx)
+                try:
+                    tx_hash = await asyncio.to_thread(self.web3.eth.send_raw_transaction, signed.raw_transaction)
+                except Exception:
+                    # the node decides the next nonce after a failed send
+                    self.nonce = None
+                    raise
+                if stuck is None:
+                    self.nonce += 1
+            try:
+                receipt = await asyncio.to_thread(self.web3.eth.wait_for_transaction_receipt, tx_hash)
+            except TimeExhausted:
+                # keep the nonce, later sends queue behind it instead of colliding with it
+                self.stuck[seed] = (nonce, gas_price)
+                log.warning("%s not mined in time %s, replacing it next round", seed, tx_hash.hex())
+                return [tx_hash]
+            self.stuck.pop(seed, None)
+            if receipt["status"] == 0:
+                log.warning("%s reverted in %s", seed, tx_hash.hex())
+            return [tx_hash]
+        finally:
+            self.pending.discard(seed)
+
+def main(account_id, *seeds):
+    from brownie import SeedLiquidity, accounts, web3
+
+    logging.basicConfig(level=logging.INFO)
+    keeper = Keeper(web3, accounts.load(account_id).private_key, seeds, SeedLiquidity.abi)
+    asyncio.run(keeper.run())
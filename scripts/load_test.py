@@ -0,0 +1,232 @@
+"""
+Load test of a `SeedLiquidity` campaign with many depositors on a local chain.
+
+Spins up `users` local accounts, funds them and approves the seed, then fires
+one deposit per user concurrently, calls `provide()` and claims for every user
+who got something in. The deposits overshoot the target by `overfill`, so the
+burst near the end exercises the clamp of `deposit()`.
+
+Every phase reports its wall-clock time, transactions per second, percentiles
+of the gas used per call and how the transactions landed in blocks. A dev chain
+which mines one block per transaction packs nothing, run it with interval mining
+(e.g. `anvil --block-time 2`) to see real blocks; the capacity of a block is
+reported either way from the block gas limit.
+
+    brownie run load_test main [users] [workers] [overfill]
+"""
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import NamedTuple
+
+from eth_account import Account
+
+from scripts.stats import PERCENTILES, percentile
+
+
+class PhaseReport(NamedTuple):
+    name: str
+    seconds: float  # from the first send to the last receipt
+    gas: list  # gas used per transaction
+    reverted: int
+    blocks: Counter  # block number -> transactions mined in it
+    receipts: list
+
+    @property
+    def txs(self):
+        return len(self.gas)
+
+    @property
+    def tps(self):
+        return self.txs / self.seconds if self.seconds else 0.0
+
+
+class LoadTest:
+    """
+    Drives a deployed seed from `web3` with locally signed transactions.
+
+    `funder` is a private key holding ether and both tokens for the users,
+    `workers` is the number of threads sending transactions at once.
+    """
+
+    def __init__(self, web3, seed, seed_abi, token_abi, funder, users=100, workers=16):
+        self.web3 = web3
+        self.seed = web3.eth.contract(address=str(seed), abi=seed_abi)
+        self.tokens = [
+            web3.eth.contract(address=self.seed.functions.tokens(i).call(), abi=token_abi) for i in range(2)
+        ]
+        self.target = [self.seed.functions.target(i).call() for i in range(2)]
+        self.funder = Account.from_key(funder)
+        self.users = [Account.create() for _ in range(users)]
+        self.workers = workers
+        self.chain_id = web3.eth.chain_id
+        self.gas_price = web3.eth.gas_price
+        self.nonces = {}
+        self.gas_limits = {}  # (contract, function) -> gas limit
+        self.amounts = []  # amounts sent to `deposit()` by every user
+        self.accepted = {}  # user -> amounts accepted by `deposit()`
+
+    def fund(self, amounts, value):
+        """Send every user `value` wei and its deposit amounts, from one account in nonce order."""
+        calls = [(self.funder, None, {"to": user.address, "value": value}) for user in self.users]
+        for user, amount in zip(self.users, amounts):
+            for i in range(2):
+                if amount[i]:
+                    calls.append((self.funder, self.tokens[i].functions.transfer(user.address, amount[i]), {}))
+        return self._phase("fund", calls, workers=1)
+
+    def approve(self, amounts):
+        calls = []
+        for user, amount in zip(self.users, amounts):
+            for i in range(2):
+                if amount[i]:
+                    calls.append((user, self.tokens[i].functions.approve(self.seed.address, amount[i]), {}))
+        return self._phase("approve", calls)
+
+    def deposit(self, amounts):
+        calls = [(user, self.seed.functions.deposit(amount), {}) for user, amount in zip(self.users, amounts)]
+        report = self._phase("deposit", calls)
+        for receipt in report.receipts:
+            for event in self.seed.events.Deposit().process_receipt(receipt):
+                self.accepted[event.args.user] = event.args.amounts
+        return report
+
+    def provide(self):
+        return self._phase("provide", [(self.funder, self.seed.functions.provide(), {})], workers=1)
+
+    def claim(self):
+        claimers = [user for user in self.users if any(self.accepted.get(user.address, ()))]
+        calls = [(user, self.seed.functions.claim(), {}) for user in claimers]
+        return self._phase("claim", calls)
+
+    def run(self, overfill=1.5, value=10**15):
+        """
+        Run all phases, the deposits add up to `overfill` times the target.
+        Returns the phase reports in order.
+        """
+        # half of the users bring token 0 and the other half token 1
+        amounts = [[0, 0] for _ in self.users]
+        for i in range(2):
+            depositors = range(i, len(self.users), 2)
+            for user in depositors:
+                amounts[user][i] = int(self.target[i] * overfill) // len(depositors) + 1
+        self.amounts = amounts
+        return [
+            self.fund(amounts, value),
+            self.approve(amounts),
+            self.deposit(amounts),
+            self.provide(),
+            self.claim(),
+        ]
+
+    def clamped(self):
+        """Number of deposits which were cut short by the target."""
+        return sum(
+            list(self.accepted.get(user.address, [0, 0])) != amount for user, amount in zip(self.users, self.amounts)
+        )
+
+    def _gas(self, account, function, tx):
+        if function is None:
+            return 21000
+        key = (function.address, function.fn_name)
+        if key not in self.gas_limits:
+            # the first call writes the cold slots, the later ones fit in twice its gas
+            self.gas_limits[key] = function.estimate_gas({"from": account.address, **tx}) * 2
+        return self.gas_limits[key]
+
+    def _sign(self, account, function, tx, gas):
+        nonce = self.nonces.get(account.address)
+        if nonce is None:
+            nonce = self.web3.eth.get_transaction_count(account.address)
+        self.nonces[account.address] = nonce + 1
+        tx = {
+            "from": account.address,
+            "nonce": nonce,
+            "gas": gas,
+            "gasPrice": self.gas_price,
+            "chainId": self.chain_id,
+            **tx,
+        }
+        if function is not None:
+            tx = function.build_transaction(tx)
+        return account.sign_transaction(tx).raw_transaction
+
+    def _phase(self, name, calls, workers=None):
+        """Sign all calls, then send them from `workers` threads and wait for every receipt."""
+        if not calls:
+            return PhaseReport(name, 0.0, [], 0, Counter(), [])
+        signed = [self._sign(account, function, tx, self._gas(account, function, tx)) for account, function, tx in calls]
+
+        def send(raw):
+            return self.web3.eth.wait_for_transaction_receipt(self.web3.eth.send_raw_transaction(raw))
+
+        start = perf_counter()
+        if workers == 1:
+            # keep the nonce order of a single sender, wait only at the end
+            hashes = [self.web3.eth.send_raw_transaction(raw) for raw in signed]
+            receipts = [self.web3.eth.wait_for_transaction_receipt(tx_hash) for tx_hash in hashes]
+        else:
+            with ThreadPoolExecutor(workers or self.workers) as pool:
+                receipts = list(pool.map(send, signed))
+        seconds = perf_counter() - start
+        return PhaseReport(
+            name=name,
+            seconds=seconds,
+            gas=[receipt["gasUsed"] for receipt in receipts],
+            reverted=sum(receipt["status"] == 0 for receipt in receipts),
+            blocks=Counter(receipt["blockNumber"] for receipt in receipts),
+            receipts=receipts,
+        )
+
+
+def print_report(report, block_gas_limit):
+    gas = ", ".join(f"p{q} {percentile(report.gas, q)}" for q in PERCENTILES)
+    print(
+        f"{report.name:>8}: {report.txs} txs in {report.seconds:.2f}s, {report.tps:.1f} tx/s, "
+        f"{report.reverted} reverted"
+    )
+    if report.gas:
+        print(f"{'':>8}  gas {gas}, max {max(report.gas)}")
+        print(
+            f"{'':>8}  {len(report.blocks)} blocks, up to {max(report.blocks.values())} txs per block, "
+            f"{block_gas_limit // percentile(report.gas, 50)} fit in a block at p50"
+        )
+
+
+def main(users="1000", workers="16", overfill="1.5"):
+    from brownie import (
+        MockERC20,
+        MockUniswapFactory,
+        MockUniswapPair,
+        MockUniswapRouter,
+        MockWETH,
+        SeedLiquidity,
+        accounts,
+        web3,
+    )
+
+    deployer = accounts[0]
+    funder = accounts.add()
+    weth = MockWETH.deploy({"from": deployer})
+    token = MockERC20.deploy("Load Token", "LOAD", 18, "1000000000 ether", {"from": deployer})
+    pair = MockUniswapPair.deploy({"from": deployer})
+    router = MockUniswapRouter.deploy(MockUniswapFactory.deploy(pair, {"from": deployer}), weth, {"from": deployer})
+    seed = SeedLiquidity.deploy(router, [token, weth], ["1000000 ether", "10 ether"], 86400, 0, False, {"from": deployer})
+
+    # ether for the gas of every user and tokens for deposits up to 5x the target
+    deployer.transfer(funder, int(users) * 10**15 + 10**18)
+    weth.deposit({"from": deployer, "value": "50 ether"})
+    weth.transfer(funder, "50 ether", {"from": deployer})
+    token.transfer(funder, "5000000 ether", {"from": deployer})
+
+    test = LoadTest(web3, seed, SeedLiquidity.abi, MockERC20.abi, funder.private_key, int(users), int(workers))
+    start = perf_counter()
+    reports = test.run(float(overfill))
+    elapsed = perf_counter() - start
+
+    block_gas_limit = web3.eth.get_block("latest")["gasLimit"]
+    print(f"users: {users}, workers: {workers}, overfill: {overfill}, block gas limit: {block_gas_limit}")
+    for report in reports:
+        print_report(report, block_gas_limit)
+    print(f"clamped deposits: {test.clamped()} of {len(test.users)}")
+    print(f"total: {elapsed:.2f}s")
@@ -0,0 +1,286 @@
+"""
+Gas cost planner for `SeedLiquidity` campaigns.
+
+Measures the gas used by every call path of the contract once on a local chain
+and caches the table as JSON, keyed by the contract bytecode. Campaign shapes
+are then priced from the table alone:
+
+- deposits are drawn for a number of depositors, a share of them bringing both
+  tokens, with random top-ups and sizes from one of `DISTRIBUTIONS`
+- the clamp of `deposit()` is replayed with `simulator.clamp`, so a deposit
+  which arrives after the target is full is priced as such and leaves its
+  sender with nothing to claim
+- every call is mapped to a path of the table, the campaign ends with
+  `provide()` and claims, a partial `provide()` or bails
+
+Every phase reports its calls, total gas and p50/p90/p99 gas per call, and the
+gas paid by each depositor over the whole campaign, priced at several gas prices.
+
+    brownie run planner main [depositors] [both] [topups] [table] [gwei ...]
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from scripts.simulator import clamp, uint_array
+from scripts.stats import PERCENTILES, percentile
+
+# a deposit is indexed by `1 + 2 * kind + both`, kind is open (0), join (1) or top-up (2)
+DEPOSIT_PATHS = [
+    "deposit_full",  # nothing left to take, the target is full
+    "deposit_open_single",  # first deposit into the contract
+    "deposit_open_both",
+    "deposit_join_single",  # first deposit of a user
+    "deposit_join_both",
+    "deposit_topup_single",  # later deposits of a user
+    "deposit_topup_both",
+]
+PATHS = DEPOSIT_PATHS + [
+    "deploy",
+    "provide",
+    "claim",
+    "claim_last",  # also receives the rounding dust
+    "provide_partial",  # after expiry with what was raised, see `SeedLiquidity.partial`
+    "claim_partial",  # also refunds the excess
+    "claim_partial_last",
+    "bail_single",
+    "bail_both",
+]
+# relative depositor sizes, `(rng, n) -> sizes`
+DISTRIBUTIONS = {
+    "equal": lambda rng, n: np.ones(n),
+    "uniform": lambda rng, n: rng.uniform(0, 2, size=n),
+    "lognormal": lambda rng, n: rng.lognormal(mean=0, sigma=2, size=n),
+}
+GAS_PRICES = (10, 30, 100)  # gwei
+
+# the scenarios of `measure` deposit fractions of these targets
+TARGET = [10**21, 10**18]
+DURATION = 86400
+
+
+def code_hash(bytecode):
+    return hashlib.sha256(bytes.fromhex(bytecode.removeprefix("0x"))).hexdigest()
+
+
+def load_table(path, bytecode):
+    """Cached gas table at `path`, None if it's missing or was measured for different bytecode."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    cached = json.loads(path.read_text())
+    if cached["code_hash"] != code_hash(bytecode) or set(cached["gas"]) != set(PATHS):
+        return None
+    return cached["gas"]
+
+
+def save_table(path, bytecode, table):
+    Path(path).write_text(json.dumps({"code_hash": code_hash(bytecode), "gas": table}, indent=2, sort_keys=True))
+
+
+def measure(SeedLiquidity, router, weth, new_token, users, chain):
+    """
+    Measure the gas of every path in `PATHS` on fresh seeds.
+
+    `new_token()` deploys a token with its supply held by `users[0]`, who also
+    holds at least 6 WETH. Every scenario seeds a new pair with a new token.
+    The other four users deposit, `users[4]` only arrives after the target is full.
+    """
+    holder, a, b, c, d = users[:5]
+    gas = {}
+
+    def deploy(partial=False):
+        token = new_token()
+        seed = SeedLiquidity.deploy(router, [token, weth], TARGET, DURATION, 0, partial, {"from": holder})
+        for user in (a, b, c, d):
+            for i, asset in enumerate([token, weth]):
+                asset.transfer(user, TARGET[i] // 2, {"from": holder})
+                asset.approve(seed, TARGET[i] // 2, {"from": user})
+        return seed
+
+    def deposit(seed, user, parts):
+        return seed.deposit([TARGET[i] // parts[i] if parts[i] else 0 for i in range(2)], {"from": user}).gas_used
+
+    # filled and claimed, the first deposit into the contract brings both tokens
+    seed = deploy()
+    gas["deploy"] = seed.tx.gas_used
+    gas["deposit_open_both"] = deposit(seed, a, [4, 4])
+    gas["deposit_join_single"] = deposit(seed, b, [4, 0])
+    gas["deposit_join_both"] = deposit(seed, c, [8, 4])
+    gas["deposit_topup_single"] = deposit(seed, a, [8, 0])
+    gas["deposit_topup_both"] = deposit(seed, b, [8, 4])
+    deposit(seed, c, [8, 4])
+    gas["deposit_full"] = deposit(seed, d, [8, 8])
+    gas["provide"] = seed.provide({"from": holder}).gas_used
+    gas["claim"] = seed.claim({"from": a}).gas_used
+    seed.claim({"from": b})
+    gas["claim_last"] = seed.claim({"from": c}).gas_used
+
+    # expired and bailed, the first deposit brings one token
+    seed = deploy()
+    gas["deposit_open_single"] = deposit(seed, a, [4, 0])
+    deposit(seed, b, [4, 4])
+    chain.sleep(DURATION)
+    gas["bail_single"] = seed.bail({"from": a}).gas_used
+    gas["bail_both"] = seed.bail({"from": b}).gas_used
+
+    # half of the WETH target raised and provided after expiry
+    seed = deploy(True)
+    deposit(seed, a, [2, 0])
+    deposit(seed, b, [2, 2])
+    chain.sleep(DURATION)
+    gas["provide_partial"] = seed.provide({"from": holder}).gas_used
+    gas["claim_partial"] = seed.claim({"from": a}).gas_used
+    gas["claim_partial_last"] = seed.claim({"from": b}).gas_used
+    return gas
+
+
+def campaign(depositors, target, both=0.5, topups=0.0, distribution="lognormal", fill=1.1, seed=0):
+    """
+    Draw the deposits of a campaign, returns `(amounts, users)` in order.
+
+    Every depositor brings both tokens with probability `both`, otherwise one of
+    them, and tops up a Poisson number of times with mean `topups`, splitting
+    their size evenly over their deposits. Sizes follow `distribution` and add up
+    to `fill` times the target, so with `fill > 1` the last deposits are clamped.
+    """
+    rng = np.random.default_rng(seed)
+    sizes = DISTRIBUTIONS[distribution](rng, depositors)
+    sides = np.zeros((depositors, 2), dtype=bool)
+    two = rng.random(depositors) < both
+    one = rng.integers(0, 2, size=depositors)
+    for i in range(2):
+        sides[:, i] = two | (one == i)
+    counts = 1 + rng.poisson(topups, size=depositors)
+
+    users = rng.permutation(np.repeat(np.arange(depositors), counts))
+    amounts = np.zeros((len(users), 2), dtype=object)
+    for i in range(2):
+        share = sizes * sides[:, i] / counts
+        total = (share * counts).sum()
+        if total == 0:
+            continue
+        weights = uint_array((share / total * 10**18).astype(np.int64))
+        amounts[:, i] = (weights * (int(target[i]) * int(fill * 100) // 100) // 10**18)[users]
+    return amounts, users
+
+
+class Plan(NamedTuple):
+    outcome: str  # "provide", "partial" or "bail"
+    calls: dict  # phase -> gas of every call in the phase
+    per_user: np.ndarray  # gas paid by every depositor over the whole campaign
+
+    @property
+    def total(self):
+        return sum(int(gas.sum()) for gas in self.calls.values())
+
+
+def plan(table, amounts, users, target, partial=False):
+    """
+    Price the deposits `(amounts, users)` of a campaign with the gas `table`.
+
+    A campaign which reaches its target is provided and claimed. Otherwise it's
+    bailed, unless it's `partial` and raised both tokens, then it's provided
+    after expiry and claimed.
+    """
+    users = np.asarray(users)
+    accepted = clamp(amounts, target)
+    taken = (accepted != 0).astype(bool)
+    sides = taken.sum(axis=1)
+
+    # open is the first deposit which took anything, join the first one of every other user
+    kind = np.full(len(users), 2)
+    took = np.flatnonzero(sides)
+    _, first = np.unique(users[took], return_index=True)
+    kind[took[first]] = 1
+    if len(took):
+        kind[took[0]] = 0
+    path = np.where(sides != 0, 1 + 2 * kind + (sides == 2), 0)
+    deposits = np.array([table[name] for name in DEPOSIT_PATHS])[path]
+
+    balances = np.zeros((users.max() + 1, 2), dtype=object)
+    np.add.at(balances, users, accepted)
+    holding = (balances != 0).astype(bool)
+    holders = np.flatnonzero(holding.any(axis=1))
+    totals = balances.sum(axis=0)
+
+    calls = {"deploy": np.array([table["deploy"]]), "deposit": deposits}
+    if all(totals[i] == target[i] for i in range(2)) or (partial and holding.any(axis=0).all()):
+        outcome = "provide" if all(totals[i] == target[i] for i in range(2)) else "partial"
+        prefix = "" if outcome == "provide" else "_partial"
+        calls["provide"] = np.array([table["provide" + prefix]])
+        # the last claimer also receives the dust
+        exits = np.full(len(holders), table["claim" + prefix])
+        if len(holders):
+            exits[-1] = table["claim" + prefix + "_last"]
+        calls["claim"] = exits
+    else:
+        outcome = "bail"
+        exits = np.where(holding[holders].all(axis=1), table["bail_both"], table["bail_single"])
+        calls["bail"] = exits
+
+    per_user = np.zeros(len(balances), dtype=np.int64)
+    np.add.at(per_user, users, deposits)
+    per_user[holders] += exits
+    return Plan(outcome, calls, per_user)
+
+
+def print_plan(name, plan, gas_prices=GAS_PRICES):
+    print(f"{name}: {len(plan.per_user)} depositors, {len(plan.calls['deposit'])} deposits, outcome: {plan.outcome}")
+    print(f"  {'phase':10}{'calls':>9}{'gas':>15}" + "".join(f"{f'p{q}':>10}" for q in PERCENTILES))
+    rows = list(plan.calls.items()) + [("depositor", plan.per_user)]
+    for phase, gas in rows:
+        values = gas.tolist()
+        print(
+            f"  {phase:10}{len(values):>9}{sum(values):>15}"
+            + "".join(f"{percentile(values, q):>10}" for q in PERCENTILES)
+        )
+    depositors = int(plan.per_user.sum())
+    for gwei in gas_prices:
+        eth = gwei / 10**9
+        print(
+            f"  at {gwei:g} gwei: {plan.total * eth:.4f} ETH in total, {depositors * eth:.4f} ETH by depositors, "
+            + ", ".join(f"p{q} {percentile(plan.per_user.tolist(), q) * eth:.6f}" for q in PERCENTILES)
+            + " ETH per depositor"
+        )
+
+
+def main(depositors="10000", both="0.5", topups="0.2", table="gas_table.json", *gas_prices):
+    from time import perf_counter
+
+    from brownie import (
+        MockERC20,
+        MockUniswapFactory,
+        MockUniswapPair,
+        MockUniswapRouter,
+        MockWETH,
+        SeedLiquidity,
+        accounts,
+        chain,
+    )
+
+    gas = load_table(table, SeedLiquidity.bytecode)
+    if gas is None:
+        holder = accounts[0]
+        weth = MockWETH.deploy({"from": holder})
+        weth.deposit({"from": holder, "value": "6 ether"})
+        pair = MockUniswapPair.deploy({"from": holder})
+        router = MockUniswapRouter.deploy(MockUniswapFactory.deploy(pair, {"from": holder}), weth, {"from": holder})
+
+        def new_token():
+            return MockERC20.deploy("Plan Token", "PLAN", 18, "1000000 ether", {"from": holder})
+
+        gas = measure(SeedLiquidity, router, weth, new_token, accounts[:5], chain)
+        save_table(table, SeedLiquidity.bytecode, gas)
+        print(f"measured the gas table into {table}")
+
+    target = [10**24, 10**21]
+    prices = [float(price) for price in gas_prices] or GAS_PRICES
+    for distribution in DISTRIBUTIONS:
+        start = perf_counter()
+        amounts, users = campaign(int(depositors), target, float(both), float(topups), distribution)
+        result = plan(gas, amounts, users, target)
+        print_plan(f"{distribution} ({perf_counter() - start:.2f}s)", result, prices)
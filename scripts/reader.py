@@ -0,0 +1,118 @@
+"""
+Read the public state of many `SeedLiquidity` contracts in batched calls.
+
+Every getter of every seed becomes one call of a Multicall3 `tryAggregate`,
+so hundreds of seeds are read in a handful of `eth_call`s. Fields fixed at
+deployment are read once and cached for the lifetime of the reader.
+
+Only the plain getters are used, so seeds deployed before `state()` existed
+are read the same way.
+
+    brownie run reader main <seed address> [<seed address> ...] --network mainnet
+"""
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+
+# deployed at the same address on mainnet and most other chains
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# field -> (getter signature, arguments, return type)
+IMMUTABLE_FIELDS = {
+    "router": ("router()", (), "address"),
+    "weth": ("weth()", (), "address"),
+    "tokens": ("tokens(uint256)", (0, 1), "address"),
+    "target": ("target(uint256)", (0, 1), "uint256"),
+    "pair": ("pair()", (), "address"),
+    "expiry": ("expiry()", (), "uint256"),
+    "locktime": ("locktime()", (), "uint256"),
+    "partial": ("partial()", (), "bool"),
+}
+MUTABLE_FIELDS = {
+    "totals": ("totals(uint256)", (0, 1), "uint256"),
+    "liquidity": ("liquidity()", (), "uint256"),
+    "unlock": ("unlock()", (), "uint256"),
+}
+
+TRY_AGGREGATE = function_signature_to_4byte_selector("tryAggregate(bool,(address,bytes)[])")
+
+
+def _calls(seed, fields):
+    """Yield `(seed, field, index, call data, return type)`, `index` is None for plain getters."""
+    for field, (signature, args, output) in fields.items():
+        selector = function_signature_to_4byte_selector(signature)
+        if args:
+            for index in args:
+                yield seed, field, index, selector + encode(["uint256"], [index]), output
+        else:
+            yield seed, field, None, selector, output
+
+
+def _missing(value):
+    return value is None or (isinstance(value, list) and None in value)
+
+
+class SeedReader:
+    """
+    Batch reader for seed contracts.
+
+    `chunk_size` caps the number of calls per `eth_call`, lower it if the node
+    rejects large batches for exceeding its gas cap.
+    """
+
+    def __init__(self, web3, multicall=MULTICALL3, chunk_size=500):
+        self.web3 = web3
+        self.multicall = to_checksum_address(str(multicall))
+        self.chunk_size = chunk_size
+        self.cache = {}  # seed -> immutable fields
+        self.requests = 0
+
+    def read(self, seeds):
+        """
+        Read the state of `seeds`.
+        Returns `{seed: {field: value}}`, the fields of a failed call are None.
+        """
+        seeds = list(dict.fromkeys(to_checksum_address(str(seed)) for seed in seeds))
+        calls = []
+        for seed in seeds:
+            if seed not in self.cache:
+                calls.extend(_calls(seed, IMMUTABLE_FIELDS))
+            calls.extend(_calls(seed, MUTABLE_FIELDS))
+
+        fetched = {seed: {} for seed in seeds}
+        for start in range(0, len(calls), self.chunk_size):
+            chunk = calls[start : start + self.chunk_size]
+            for (seed, field, index, _, output), value in zip(chunk, self._aggregate(chunk)):
+                if index is None:
+                    fetched[seed][field] = value
+                else:
+                    fetched[seed].setdefault(field, [None, None])[index] = value
+
+        for seed, values in fetched.items():
+            # a failed read isn't cached, it's retried on the next call
+            if seed not in self.cache and not any(_missing(values[field]) for field in IMMUTABLE_FIELDS):
+                self.cache[seed] = {field: values[field] for field in IMMUTABLE_FIELDS}
+            fetched[seed] = {**self.cache.get(seed, {}), **values}
+        return fetched
+
+    def _aggregate(self, chunk):
+        data = TRY_AGGREGATE + encode(
+            ["bool", "(address,bytes)[]"], [False, [(seed, calldata) for seed, _, _, calldata, _ in chunk]]
+        )
+        self.requests += 1
+        result = self.web3.eth.call({"to": self.multicall, "data": "0x" + data.hex()})
+        (results,) = decode(["(bool,bytes)[]"], bytes(result))
+        values = []
+        for (_, _, _, _, output), (success, returned) in zip(chunk, results):
+            if not success or len(returned) < 32:
+                values.append(None)
+                continue
+            (value,) = decode([output], returned)
+            values.append(to_checksum_address(value) if output == "address" else value)
+        return values
+
+
+def main(*seeds):
+    from brownie import web3
+
+    for seed, state in SeedReader(web3).read(seeds).items():
+        print(seed, state)
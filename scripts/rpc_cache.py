@@ -0,0 +1,175 @@
+"""
+Record-and-replay JSON-RPC proxy for mainnet forks.
+
+A fork pinned to a block only ever reads state as of that block, so the
+upstream answers to `eth_getStorageAt`, `eth_getCode`, `eth_getBalance` and
+the other state reads never change. The proxy forwards every read it hasn't
+seen to the upstream node once, stores the answer in SQLite, and serves it
+from the store ever after. With a complete store `offline` mode never
+touches the network.
+
+    brownie run rpc_cache main <upstream url> <block> [database path] [port] [offline]
+
+and fork through the proxy, e.g. with a network named `mainnet-cached-fork`:
+
+    brownie networks add Development mainnet-cached-fork host=http://127.0.0.1 \
+        cmd=ganache-cli port=8545 chain_id=1 accounts=10 mnemonic=brownie \
+        fork=http://127.0.0.1:8546@<block>
+"""
+import json
+import sqlite3
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# state reads whose answer is fixed once the block is, method -> position of the
+# block parameter, None for reads keyed by a hash or fixed for the whole chain
+CACHED_METHODS = {
+    "eth_getStorageAt": 2,
+    "eth_getCode": 1,
+    "eth_getBalance": 1,
+    "eth_getTransactionCount": 1,
+    "eth_getBlockByNumber": 0,
+    "eth_getBlockByHash": None,
+    "eth_getTransactionByHash": None,
+    "eth_getTransactionReceipt": None,
+    "eth_chainId": None,
+    "net_version": None,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    method TEXT NOT NULL,
+    params TEXT NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (method, params)
+);
+"""
+
+
+def _pinned(method, params):
+    """
+    Whether a read names its block by number or hash. Tags like `latest` move
+    with the chain, and a missing block parameter means `latest`.
+    """
+    position = CACHED_METHODS[method]
+    if position is None:
+        return True
+    if len(params) <= position:
+        return False
+    block = params[position]
+    if isinstance(block, dict):
+        # EIP-1898 block object
+        return "blockHash" in block or "blockNumber" in block
+    return isinstance(block, str) and block.startswith("0x")
+
+
+class CacheMiss(Exception):
+    pass
+
+
+class RPCError(Exception):
+    def __init__(self, error):
+        super().__init__(error.get("message"))
+        self.error = error
+
+
+class RPCCache:
+    """
+    Cache in front of the `upstream` JSON-RPC endpoint.
+
+    `block` pins the head reported by `eth_blockNumber`, so a fork started
+    without an explicit block still forks at it. In `offline` mode a read
+    missing from the store is an error instead of an upstream request.
+    """
+
+    def __init__(self, upstream, db_path, block=None, offline=False):
+        self.upstream = upstream
+        self.block = block
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+
+    def handle(self, payload):
+        """Answer one JSON-RPC request or a batch of them."""
+        if isinstance(payload, list):
+            return [self.handle(request) for request in payload]
+        response = {"jsonrpc": "2.0", "id": payload.get("id")}
+        try:
+            response["result"] = self.call(payload["method"], payload.get("params", []))
+        except CacheMiss as exc:
+            response["error"] = {"code": -32000, "message": f"not in the cache: {exc}"}
+        except RPCError as exc:
+            response["error"] = exc.error
+        return response
+
+    def call(self, method, params):
+        if method == "eth_blockNumber" and self.block is not None:
+            return hex(self.block)
+        if method not in CACHED_METHODS or not _pinned(method, params):
+            return self._forward(method, params)
+
+        key = json.dumps(params, separators=(",", ":"))
+        with self.lock:
+            row = self.db.execute(
+                "SELECT result FROM responses WHERE method = ? AND params = ?", (method, key)
+            ).fetchone()
+        if row is not None:
+            self.hits += 1
+            return json.loads(row[0])
+
+        self.misses += 1
+        result = self._forward(method, params)
+        if result is not None:
+            # a missing block or receipt may still appear upstream
+            with self.lock, self.db:
+                self.db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (method, key, json.dumps(result)))
+        return result
+
+    def _forward(self, method, params):
+        if self.offline:
+            raise CacheMiss(f"{method} {params}")
+        body = json.dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": params}).encode()
+        request = urllib.request.Request(self.upstream, body, {"Content-Type": "application/json"})
+        with urllib.request.urlopen(request) as response:
+            response = json.load(response)
+        if "error" in response:
+            raise RPCError(response["error"])
+        return response["result"]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps(self.server.cache.handle(payload)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(cache, port=8546, host="127.0.0.1"):
+    """Start the proxy in a background thread, returns the server, stop it with `shutdown()`."""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.cache = cache
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(upstream, block, db_path="rpc_cache.db", port="8546", offline=""):
+    offline = offline.lower() in ("1", "true", "yes")
+    cache = RPCCache(upstream, db_path, block=int(block), offline=offline)
+    server = serve(cache, int(port))
+    print(f"serving block {block} of {upstream} on port {port}, store {db_path}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"{cache.hits} hits, {cache.misses} misses")
@@ -0,0 +1,123 @@
+"""
+Off-chain model of the `SeedLiquidity` accounting for large depositor sets.
+
+Reproduces with integer math, bit for bit:
+
+- the clamp of `deposit()`, every deposit is cut to what's left of the target
+- the first Uniswap V2 mint of `provide()`, `sqrt(target0 * target1) - 1000`
+- the LP formula of `claim()`, where the last claimer also receives the rounding dust
+
+Amounts are NumPy arrays of Python integers (`dtype=object`), so values up to
+uint256 never overflow, while the work still runs as vectorized array operations.
+
+    brownie run simulator main <depositors> [target0] [target1]
+"""
+from math import isqrt
+from typing import NamedTuple
+
+import numpy as np
+
+MINIMUM_LIQUIDITY = 1000  # burned by the pair on the first mint
+
+
+class Simulation(NamedTuple):
+    accepted: np.ndarray  # (deposits, 2) amounts accepted from every deposit
+    balances: np.ndarray  # (users, 2) token balances per user
+    liquidity: int  # LP tokens received by the seed contract
+    side_lp: np.ndarray  # (users, 2) LP per user earned by each token side
+    lp: np.ndarray  # (users,) LP sent by `claim()`, including the dust for the last claimer
+    dust: int  # LP lost to rounding, received by the last claimer
+    skew: float  # LP share of the token 0 side minus the token 1 side, zero is fair
+
+
+def uint_array(values):
+    """Object array of Python integers, safe for uint256 products."""
+    return np.array([int(value) for value in np.ravel(values)], dtype=object).reshape(np.shape(values))
+
+
+def clamp(amounts, target):
+    """
+    Amounts accepted from `amounts`, an `(n, 2)` array of deposits in order.
+    A deposit is cut to what is left of the target after all earlier ones.
+    """
+    amounts = uint_array(amounts)
+    target = uint_array(target)
+    filled = np.minimum(np.cumsum(amounts, axis=0), target)
+    return np.diff(filled, axis=0, prepend=uint_array([[0, 0]]))
+
+
+def mint(target):
+    """LP tokens minted for the first liquidity in a Uniswap V2 pair."""
+    liquidity = isqrt(int(target[0]) * int(target[1])) - MINIMUM_LIQUIDITY
+    if liquidity <= 0:
+        raise ValueError("insufficient liquidity minted")
+    return liquidity
+
+
+def simulate(amounts, target, users=None, last=None):
+    """
+    Simulate a campaign from deposit to the last claim.
+
+    `amounts` are the deposits in order as an `(n, 2)` array. `users` maps every
+    deposit to a user index, by default every deposit is a different user.
+    `last` is the index of the user who claims last, by default the highest one
+    with a balance, users left with nothing after the clamp don't claim.
+    """
+    target = uint_array(target)
+    accepted = clamp(amounts, target)
+    if users is None:
+        balances = accepted
+    else:
+        users = np.asarray(users)
+        balances = np.zeros((users.max() + 1, 2), dtype=object)
+        np.add.at(balances, users, accepted)
+
+    if (balances.sum(axis=0) != target).any():
+        raise ValueError("target not reached")
+    liquidity = mint(target)
+
+    # each token side is entitled to half of the liquidity
+    side_lp = balances * liquidity // (2 * target)
+    lp = side_lp.sum(axis=1)
+    dust = liquidity - int(lp.sum())
+    if last is None:
+        last = np.flatnonzero(balances.any(axis=1))[-1]
+    lp[last] += dust
+
+    half = liquidity / 2
+    earned = side_lp.sum(axis=0)
+    return Simulation(
+        accepted=accepted,
+        balances=balances,
+        liquidity=liquidity,
+        side_lp=side_lp,
+        lp=lp,
+        dust=dust,
+        skew=float(earned[0] - earned[1]) / half,
+    )
+
+
+def main(depositors="100000", target0="1000000e18", target1="1000e18"):
+    from time import perf_counter
+
+    target = [int(float(target0)), int(float(target1))]
+    n = int(depositors)
+    rng = np.random.default_rng(0)
+    # heavy-tailed deposit sizes, each depositor brings one token
+    sizes = rng.lognormal(mean=0, sigma=2, size=n)
+    side = rng.integers(0, 2, size=n)
+    amounts = np.zeros((n, 2), dtype=object)
+    for i in range(2):
+        share = sizes * (side == i)
+        # overshoot the target by 10% so the last deposits are clamped
+        weights = uint_array((share / share.sum() * 10**18).astype(np.int64))
+        amounts[:, i] = weights * (target[i] * 11 // 10) // 10**18
+
+    start = perf_counter()
+    result = simulate(amounts, target)
+    elapsed = perf_counter() - start
+    print(f"depositors: {n}, simulated in {elapsed:.2f}s")
+    print(f"liquidity: {result.liquidity}")
+    print(f"dust: {result.dust} ({result.dust / result.liquidity:.2e} of liquidity)")
+    print(f"skew: {result.skew:.2e}")
+    print(f"clamped deposits: {int(((result.accepted != amounts).any(axis=1)).sum())}")
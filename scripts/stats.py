@@ -0,0 +1,13 @@
+"""
+Percentiles shared by the gas reports of `load_test` and `planner`.
+"""
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of `values`."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0
+    return ordered[max(0, -(-len(ordered) * q // 100) - 1)]
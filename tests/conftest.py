@@ -1,37 +1,163 @@
+import json
+from pathlib import Path
+
 import pytest
+from brownie import Wei, network
+from eth_abi import encode
+from eth_keys import keys
+from eth_utils import keccak
+from hexbytes import HexBytes
+
+GAS_BASELINE = Path(__file__).parent / "gas_baseline.json"
+DOMAIN_TYPE_HASH = keccak(text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+PERMIT_TYPE_HASH = keccak(text="Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--gas-threshold",
+        type=float,
+        default=0.01,
+        help="allowed relative gas increase over the baseline, e.g. 0.05 for 5%",
+    )
+    parser.addoption(
+        "--update-gas-baseline",
+        action="store_true",
+        help="record the measured gas into tests/gas_baseline.json",
+    )
+    parser.addoption(
+        "--fuzz-examples",
+        type=int,
+        default=20,
+        help="examples per stateful fuzzing test in tests/test_stateful.py",
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def module_setup(module_isolation):
+    # resets the chain before the module scoped deployments below
+    pass
 
 
 @pytest.fixture(scope="function", autouse=True)
 def shared_setup(fn_isolation):
+    # every test reverts to the snapshot taken after the module scoped deployments
     pass
 
 
-@pytest.fixture
-def agent(accounts):
-    return accounts.at("0x3e40D73EB977Dc6a537aF587D48316feE66E9C8c", force=True)
+@pytest.fixture(scope="session")
+def forked():
+    # real mainnet tokens and router on a fork, local mocks otherwise
+    return network.show_active().endswith("-fork")
 
 
-@pytest.fixture
-def lido(interface, agent):
-    return interface.ERC20("0x5A98FcBEA516Cf06857215779Fd812CA3beF1B32", owner=agent)
+@pytest.fixture(scope="session")
+def gas_report(pytestconfig):
+    # gas used by each benchmarked path, collected over the session
+    report = {}
+    yield report
+    if pytestconfig.getoption("update_gas_baseline") and report:
+        baseline = json.loads(GAS_BASELINE.read_text()) if GAS_BASELINE.exists() else {}
+        baseline.update(report)
+        GAS_BASELINE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
 
 
 @pytest.fixture
-def whale(accounts):
-    return accounts.at("0x2F0b23f53734252Bda2277357e97e1517d6B042A", force=True)
+def check_gas(gas_report, pytestconfig, forked):
+    """
+    Compare the gas used by a transaction to the stored baseline.
+    The baseline is recorded against the local mocks, so it's skipped on forks.
+    """
+    if forked:
+        pytest.skip("gas baseline is recorded against the local mocks")
+    update = pytestconfig.getoption("update_gas_baseline")
+    threshold = pytestconfig.getoption("gas_threshold")
+    baseline = json.loads(GAS_BASELINE.read_text()) if GAS_BASELINE.exists() else {}
 
+    def check(name, tx):
+        gas_report[name] = tx.gas_used
+        if update:
+            return
+        assert name in baseline, f"no gas baseline for {name}, run with --update-gas-baseline"
+        limit = int(baseline[name] * (1 + threshold))
+        assert tx.gas_used <= limit, f"{name} used {tx.gas_used} gas, baseline is {baseline[name]}"
 
-@pytest.fixture
-def weth(interface, whale):
-    return interface.ERC20("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", owner=whale)
+    return check
 
 
-@pytest.fixture
-def uniswap(interface):
-    return interface.UniswapRouter("0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D")
+@pytest.fixture(scope="module")
+def agent(accounts, forked):
+    if forked:
+        return accounts.at("0x3e40D73EB977Dc6a537aF587D48316feE66E9C8c", force=True)
+    return accounts[8]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def lido(interface, MockERC20, agent, forked):
+    if forked:
+        return interface.ERC20("0x5A98FcBEA516Cf06857215779Fd812CA3beF1B32", owner=agent)
+    return MockERC20.deploy("Lido DAO Token", "LDO", 18, "1000000000 ether", {"from": agent})
+
+
+@pytest.fixture(scope="module")
+def whale(accounts, forked):
+    if forked:
+        return accounts.at("0x2F0b23f53734252Bda2277357e97e1517d6B042A", force=True)
+    return accounts[9]
+
+
+@pytest.fixture(scope="module")
+def weth(interface, MockWETH, whale, forked):
+    if forked:
+        return interface.ERC20("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", owner=whale)
+    weth = MockWETH.deploy({"from": whale})
+    weth.deposit({"from": whale, "value": "500 ether"})
+    return weth
+
+
+@pytest.fixture(scope="module")
+def permit_token(MockERC20Permit, agent):
+    # there is no permit-capable token in the fork profile, the mock is used on both
+    return MockERC20Permit.deploy("Permit Token", "PRMT", 18, "1000000000 ether", {"from": agent})
+
+
+@pytest.fixture(scope="session")
+def sign_permit(chain):
+    """
+    Sign an EIP-2612 permit with the private key of a local account, e.g. one from `accounts.add()`.
+    Returns the `Permit` struct accepted by `deposit_with_permit`.
+    """
+
+    def sign(token, owner, spender, amount, deadline):
+        domain = keccak(
+            encode(
+                ["bytes32", "bytes32", "bytes32", "uint256", "address"],
+                [DOMAIN_TYPE_HASH, keccak(text=token.name()), keccak(text="1"), chain.id, str(token)],
+            )
+        )
+        message = keccak(
+            encode(
+                ["bytes32", "address", "address", "uint256", "uint256", "uint256"],
+                [PERMIT_TYPE_HASH, str(owner), str(spender), Wei(amount), token.nonces(owner), deadline],
+            )
+        )
+        digest = keccak(b"\x19\x01" + domain + message)
+        signature = keys.PrivateKey(HexBytes(owner.private_key)).sign_msg_hash(digest)
+        return (deadline, signature.v + 27, signature.r.to_bytes(32, "big"), signature.s.to_bytes(32, "big"))
+
+    return sign
+
+
+@pytest.fixture(scope="module")
+def uniswap(interface, MockUniswapPair, MockUniswapFactory, MockUniswapRouter, weth, accounts, forked):
+    if forked:
+        return interface.UniswapRouter("0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D")
+    pair = MockUniswapPair.deploy({"from": accounts[0]})
+    factory = MockUniswapFactory.deploy(pair, {"from": accounts[0]})
+    return MockUniswapRouter.deploy(factory, weth, {"from": accounts[0]})
+
+
+@pytest.fixture(scope="module")
 def seed(SeedLiquidity, uniswap, lido, weth, accounts):
     return SeedLiquidity.deploy(
         uniswap,
@@ -39,10 +165,11 @@ def seed(SeedLiquidity, uniswap, lido, weth, accounts):
         ["10000000 ether", "150 ether"],
         14 * 86400,
         0,
+        False,
         {"from": accounts[0]},
     )
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def seed_with_waitime(SeedLiquidity, uniswap, lido, weth, accounts):
     return SeedLiquidity.deploy(
         uniswap,
@@ -50,5 +177,32 @@ def seed_with_waitime(SeedLiquidity, uniswap, lido, weth, accounts):
         ["10000000 ether", "150 ether"],
         14 * 86400,
         100,
+        False,
         {"from": accounts[0]},
     )
+
+
+@pytest.fixture(scope="module")
+def factory(SeedLiquidity, SeedLiquidityFactory, uniswap, accounts):
+    # EIP-5202 blueprint: preamble + initcode, behind a loader returning it as runtime code
+    blueprint = b"\xfe\x71\x00" + HexBytes(SeedLiquidity.bytecode)
+    loader = b"\x61" + len(blueprint).to_bytes(2, "big") + bytes.fromhex("3d81600a3d39f3")
+    tx = accounts[0].transfer(data=loader + blueprint)
+    return SeedLiquidityFactory.deploy(uniswap, tx.contract_address, {"from": accounts[0]})
+
+
+@pytest.fixture(scope="module")
+def multi(SeedLiquidityMulti, uniswap, accounts):
+    return SeedLiquidityMulti.deploy(uniswap, {"from": accounts[0]})
+
+
+@pytest.fixture(scope="module")
+def campaign(multi, lido, weth, accounts):
+    tx = multi.create([lido, weth], ["10000000 ether", "150 ether"], 14 * 86400, 0, {"from": accounts[0]})
+    return tx.events["CampaignCreated"]["id"]
+
+
+@pytest.fixture(scope="module")
+def campaign_with_waitime(multi, lido, weth, accounts):
+    tx = multi.create([lido, weth], ["10000000 ether", "150 ether"], 14 * 86400, 100, {"from": accounts[0]})
+    return tx.events["CampaignCreated"]["id"]
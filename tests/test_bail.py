@@ -83,4 +83,30 @@ def test_bail_targets_met_expired_multi_deposit(seed, lido, weth, agent, whale,
     assert lido.balanceOf(agent) == lido_before
 
     seed.bail({'from': whale})
-    assert weth.balanceOf(whale) == weth_before
\ No newline at end of file
+    assert weth.balanceOf(whale) == weth_before
+
+def test_bail_for(seed, lido, weth, agent, whale, accounts, chain):
+    lido_amount = seed.target(0) // 2
+    weth_amount = seed.target(1) // 2
+
+    lido_before = lido.balanceOf(agent)
+    weth_before = weth.balanceOf(whale)
+
+    lido.approve(seed, lido_amount)
+    seed.deposit([lido_amount, 0], {'from': agent})
+
+    weth.approve(seed, weth_amount)
+    seed.deposit([0, weth_amount], {'from': whale})
+
+    with brownie.reverts():
+        seed.bail_for([agent, whale], {'from': accounts[1]})
+
+    chain.sleep(14 * 86400)
+
+    seed.bail_for([agent, whale, accounts[1]], {'from': accounts[1]})
+    assert lido.balanceOf(agent) == lido_before
+    assert weth.balanceOf(whale) == weth_before
+    assert seed.balances(agent, 0) == 0
+    assert seed.balances(whale, 1) == 0
+    assert lido.balanceOf(seed) == 0
+    assert weth.balanceOf(seed) == 0
@@ -108,8 +108,9 @@ def test_claim_targets_met_provided_unlocked_distribute(seed_with_waitime, lido,
     seed_with_waitime.claim({"from": agent})
     assert pair.balanceOf(agent) == seed_with_waitime.liquidity() // 2
 
+    # the last claimer also receives the rounding dust
     seed_with_waitime.claim({"from": whale})
-    assert pair.balanceOf(whale) == seed_with_waitime.liquidity() // 2
+    assert pair.balanceOf(whale) == seed_with_waitime.liquidity() - pair.balanceOf(agent)
 
 def test_claim_targets_met_multiaccount_provided_unlocked_distribute(seed_with_waitime, lido, weth, agent, whale, interface, chain):
     pair = interface.ERC20(seed_with_waitime.pair())
@@ -135,4 +136,76 @@ def test_claim_targets_met_multiaccount_provided_unlocked_distribute(seed_with_w
     assert pair.balanceOf(agent) == seed_with_waitime.liquidity() // 4
 
     seed_with_waitime.claim({"from": whale})
-    assert pair.balanceOf(whale) == seed_with_waitime.liquidity()*3 // 4
+    assert pair.balanceOf(whale) == seed_with_waitime.liquidity() - pair.balanceOf(agent)
+
+
+def test_claim_sum_equals_liquidity(seed, lido, weth, agent, whale, accounts, interface, chain):
+    pair = interface.ERC20(seed.pair())
+    lido_amount = seed.target(0)
+    weth_amount = seed.target(1)
+    lido_parts = [lido_amount // 3, lido_amount // 7, lido_amount - lido_amount // 3 - lido_amount // 7]
+    weth_parts = [weth_amount // 11, weth_amount - weth_amount // 11, 0]
+    users = [agent, whale, accounts[1]]
+
+    for user, lido_part, weth_part in zip(users, lido_parts, weth_parts):
+        lido.transfer(user, lido_part, {'from': agent})
+        lido.approve(seed, lido_part, {'from': user})
+        weth.transfer(user, weth_part, {'from': whale})
+        weth.approve(seed, weth_part, {'from': user})
+    for user, lido_part, weth_part in zip(users, lido_parts, weth_parts):
+        seed.deposit([lido_part, weth_part], {'from': user})
+
+    seed.provide()
+    before = [pair.balanceOf(user) for user in users]
+    for user in users:
+        seed.claim({'from': user})
+
+    claimed = [pair.balanceOf(user) - b for user, b in zip(users, before)]
+    assert sum(claimed) == seed.liquidity()
+    assert pair.balanceOf(seed) == 0
+
+
+def test_claim_for(seed_with_waitime, lido, weth, agent, whale, accounts, interface, chain):
+    seed = seed_with_waitime
+    pair = interface.ERC20(seed.pair())
+    users = [agent, whale, accounts[1]]
+    lido_amount = seed.target(0) // 3
+    weth_amount = seed.target(1) // 3
+    lido_parts = [seed.target(0) - 2 * lido_amount, lido_amount, lido_amount]
+    weth_parts = [seed.target(1) - 2 * weth_amount, weth_amount, weth_amount]
+
+    for user, lido_part, weth_part in zip(users, lido_parts, weth_parts):
+        lido.transfer(user, lido_part, {'from': agent})
+        lido.approve(seed, lido_part, {'from': user})
+        weth.transfer(user, weth_part, {'from': whale})
+        weth.approve(seed, weth_part, {'from': user})
+        seed.deposit([lido_part, weth_part], {'from': user})
+
+    seed.provide()
+    with brownie.reverts():
+        seed.claim_for(users, {'from': accounts[2]})
+
+    chain.sleep(100)
+    expected = [
+        seed.balances(user, 0) * seed.liquidity() // (2 * seed.target(0))
+        + seed.balances(user, 1) * seed.liquidity() // (2 * seed.target(1))
+        for user in users[1:]
+    ]
+    seed.claim_for(users[1:], {'from': accounts[2]})
+    assert [pair.balanceOf(user) for user in users[1:]] == expected
+    assert seed.balances(whale, 0) == 0
+    assert seed.balances(whale, 1) == 0
+
+    # already claimed users are skipped
+    seed.claim_for(users, {'from': accounts[2]})
+    assert [pair.balanceOf(user) for user in users[1:]] == expected
+    assert pair.balanceOf(agent) == seed.liquidity() - sum(expected)
+    assert pair.balanceOf(seed) == 0
+
+
+def test_claim_for_not_seeded(seed, lido, agent):
+    lido.approve(seed, seed.target(0), {'from': agent})
+    seed.deposit([seed.target(0), 0], {'from': agent})
+
+    with brownie.reverts():
+        seed.claim_for([agent])
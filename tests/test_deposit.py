@@ -3,7 +3,7 @@ import brownie
 
 
 # SeedLiquidity contract
-@pytest.fixture
+@pytest.fixture(scope="module")
 def seed(SeedLiquidity, uniswap, lido, weth, accounts):
     return SeedLiquidity.deploy(
         uniswap,
@@ -11,6 +11,7 @@ def seed(SeedLiquidity, uniswap, lido, weth, accounts):
         ["10 ether", "10 ether"],
         14 * 86400,
         0,
+        False,
         {"from": accounts[0]},
     )
 
@@ -284,3 +285,49 @@ def test_both_exceeds_target(seed, lido, weth, agent, whale, chain):
     assert seed.totals(1) == target_amount
     assert lido.allowance(whale, seed) == balance_amount
     assert weth.allowance(whale, seed) == balance_amount
+
+
+def test_deposit_returns_accepted(seed, lido, agent):
+    lido.approve(seed, "12 ether", {'from': agent})
+    assert list(seed.deposit.call(["12 ether", 0], {'from': agent})) == ["10 ether", 0]
+    tx = seed.deposit(["7 ether", 0], {'from': agent})
+    assert list(tx.return_value) == ["7 ether", 0]
+    assert list(tx.events["Deposit"]["amounts"]) == ["7 ether", 0]
+
+
+def test_deposit_single(seed, lido, weth, agent, whale):
+    lido.approve(seed, "12 ether", {'from': agent})
+    tx = seed.deposit_single(0, "7 ether", {'from': agent})
+    assert tx.return_value == "7 ether"
+    assert seed.balances(agent, 0) == "7 ether"
+
+    # clamped to the target
+    tx = seed.deposit_single(0, "5 ether", {'from': agent})
+    assert tx.return_value == "3 ether"
+    assert seed.totals(0) == "10 ether"
+    assert lido.allowance(agent, seed) == "2 ether"
+
+    weth.approve(seed, "1 ether", {'from': whale})
+    assert seed.deposit_single(1, "1 ether", {'from': whale}).return_value == "1 ether"
+    assert seed.balances(whale, 1) == "1 ether"
+
+    with brownie.reverts():
+        seed.deposit_single(2, "1 ether", {'from': whale})
+
+
+def test_deposit_skips_nothing_to_take(seed, lido, weth, agent, whale):
+    # no allowance is needed for a side that takes nothing
+    lido.approve(seed, "10 ether", {'from': agent})
+    seed.deposit(["10 ether", 0], {'from': agent})
+    tx = seed.deposit(["1 ether", 0], {'from': agent})
+    assert list(tx.return_value) == [0, 0]
+    assert "Transfer" not in tx.events
+    assert "Deposit" not in tx.events
+    assert seed.balances(agent, 0) == "10 ether"
+
+    lido.transfer(whale, "1 ether", {'from': agent})
+    weth.approve(seed, "1 ether", {'from': whale})
+    tx = seed.deposit(["1 ether", "1 ether"], {'from': whale})
+    assert list(tx.return_value) == [0, "1 ether"]
+    assert lido.balanceOf(whale) == "1 ether"
+    assert seed.balances(whale, 0) == 0
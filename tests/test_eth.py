@@ -0,0 +1,100 @@
+import brownie
+
+
+def spent(tx):
+    return tx.gas_used * tx.gas_price
+
+
+def test_deposit_eth(seed, lido, weth, agent):
+    lido_amount = seed.target(0) // 2
+    weth_amount = seed.target(1) // 3
+    eth_before = agent.balance()
+
+    lido.approve(seed, lido_amount, {'from': agent})
+    tx = seed.deposit_eth(lido_amount, {'from': agent, 'value': weth_amount})
+
+    assert agent.balance() == eth_before - weth_amount - spent(tx)
+    assert weth.balanceOf(seed) == weth_amount
+    assert lido.balanceOf(seed) == lido_amount
+    assert seed.balances(agent, 0) == lido_amount
+    assert seed.balances(agent, 1) == weth_amount
+    assert seed.totals(1) == weth_amount
+    assert seed.balance() == 0
+
+
+def test_deposit_eth_only(seed, weth, agent):
+    seed.deposit_eth(0, {'from': agent, 'value': "1 ether"})
+    assert seed.balances(agent, 1) == "1 ether"
+    assert weth.balanceOf(seed) == "1 ether"
+
+
+def test_deposit_eth_refund(seed, weth, agent, whale):
+    weth.approve(seed, seed.target(1) - "1 ether", {'from': whale})
+    seed.deposit([0, seed.target(1) - "1 ether"], {'from': whale})
+    eth_before = agent.balance()
+
+    tx = seed.deposit_eth(0, {'from': agent, 'value': "5 ether"})
+
+    assert agent.balance() == eth_before - "1 ether" - spent(tx)
+    assert seed.balances(agent, 1) == "1 ether"
+    assert seed.totals(1) == seed.target(1)
+    assert weth.balanceOf(seed) == seed.target(1)
+    assert seed.balance() == 0
+
+
+def test_deposit_eth_weth_first(SeedLiquidity, uniswap, lido, weth, agent, accounts):
+    seed = SeedLiquidity.deploy(uniswap, [weth, lido], ["2 ether", "20 ether"], 86400, 0, False, {'from': accounts[0]})
+    lido.approve(seed, "20 ether", {'from': agent})
+    seed.deposit_eth("20 ether", {'from': agent, 'value': "3 ether"})
+
+    assert seed.balances(agent, 0) == "2 ether"
+    assert seed.balances(agent, 1) == "20 ether"
+    seed.provide({'from': agent})
+    assert seed.liquidity() > 0
+
+
+def test_deposit_eth_no_weth_side(SeedLiquidity, MockERC20, uniswap, lido, agent, accounts):
+    other = MockERC20.deploy("Other", "OTH", 18, "1000 ether", {'from': agent})
+    seed = SeedLiquidity.deploy(uniswap, [lido, other], ["10 ether", "10 ether"], 86400, 0, False, {'from': accounts[0]})
+    with brownie.reverts():
+        seed.deposit_eth(0, {'from': agent, 'value': "1 ether"})
+
+
+def test_deposit_eth_expired(seed, agent, chain):
+    chain.sleep(14 * 86400)
+    with brownie.reverts():
+        seed.deposit_eth(0, {'from': agent, 'value': "1 ether"})
+
+
+def test_direct_ether_rejected(seed, agent):
+    with brownie.reverts():
+        agent.transfer(seed, "1 ether")
+
+
+def test_bail_unwrap(seed, lido, weth, agent, whale, chain):
+    lido_before = lido.balanceOf(agent)
+    lido.approve(seed, "10 ether", {'from': agent})
+    seed.deposit_eth("10 ether", {'from': agent, 'value': "2 ether"})
+    weth.approve(seed, "3 ether", {'from': whale})
+    seed.deposit([0, "3 ether"], {'from': whale})
+
+    chain.sleep(14 * 86400)
+    eth_before = agent.balance()
+    tx = seed.bail(True, {'from': agent})
+    assert agent.balance() == eth_before + "2 ether" - spent(tx)
+    assert lido.balanceOf(agent) == lido_before
+    assert seed.balances(agent, 1) == 0
+
+    # the wrapped side is refunded as ether regardless of how it was deposited
+    eth_before = whale.balance()
+    tx = seed.bail(True, {'from': whale})
+    assert whale.balance() == eth_before + "3 ether" - spent(tx)
+    assert weth.balanceOf(seed) == 0
+    assert seed.balance() == 0
+
+
+def test_bail_no_unwrap(seed, weth, agent, chain):
+    seed.deposit_eth(0, {'from': agent, 'value': "2 ether"})
+    chain.sleep(14 * 86400)
+    seed.bail({'from': agent})
+    assert weth.balanceOf(agent) == "2 ether"
@@ -0,0 +1,79 @@
+import brownie
+
+
+def deploy(factory, tokens, target, duration=86400, locktime=0):
+    tx = factory.deploy_seed(tokens, target, duration, locktime)
+    return tx.events["SeedDeployed"]["seed"]
+
+
+def test_deploy_seed(factory, SeedLiquidity, uniswap, lido, weth, agent, whale, interface, chain):
+    tx = factory.deploy_seed([lido, weth], ["10 ether", "10 ether"], 14 * 86400, 0)
+    seed = SeedLiquidity.at(tx.events["SeedDeployed"]["seed"])
+    pair = interface.ERC20(seed.pair())
+
+    assert tx.events["SeedDeployed"]["pair"] == pair
+    assert seed.router() == uniswap
+    assert seed.tokens(0) == lido
+    assert seed.tokens(1) == weth
+    assert seed.target(0) == "10 ether"
+    assert seed.target(1) == "10 ether"
+    assert seed.expiry() == tx.timestamp + 14 * 86400
+
+    lido.approve(seed, "10 ether", {'from': agent})
+    seed.deposit(["10 ether", 0], {'from': agent})
+    weth.approve(seed, "10 ether", {'from': whale})
+    seed.deposit([0, "10 ether"], {'from': whale})
+    seed.provide({'from': agent})
+
+    seed.claim({'from': agent})
+    seed.claim({'from': whale})
+    assert pair.balanceOf(agent) + pair.balanceOf(whale) == seed.liquidity()
+
+
+def test_registry(factory, lido, weth):
+    first = deploy(factory, [lido, weth], ["10 ether", "10 ether"])
+    second = deploy(factory, [weth, lido], ["5 ether", "50 ether"])
+
+    assert factory.seed_count() == 2
+    assert factory.seeds(0) == first
+    assert factory.seeds(1) == second
+    assert factory.get_seeds(0, 10) == [first, second]
+    assert factory.get_seeds(1, 10) == [second]
+    assert factory.get_seeds(0, 1) == [first]
+    assert factory.get_seeds(2, 10) == []
+
+
+def test_registry_by_pair(factory, SeedLiquidity, MockERC20, lido, weth, accounts):
+    other = MockERC20.deploy("Other", "OTH", 18, "1000 ether", {'from': accounts[0]})
+    first = SeedLiquidity.at(deploy(factory, [lido, weth], ["10 ether", "10 ether"]))
+    second = SeedLiquidity.at(deploy(factory, [weth, lido], ["5 ether", "50 ether"]))
+    third = SeedLiquidity.at(deploy(factory, [other, weth], ["5 ether", "5 ether"]))
+
+    assert first.pair() == second.pair()
+    assert factory.pair_seed_count(first.pair()) == 2
+    assert factory.get_pair_seeds(first.pair(), 0, 10) == [first, second]
+    assert factory.get_pair_seeds(first.pair(), 1, 10) == [second]
+    assert factory.get_pair_seeds(first.pair(), 0, 1) == [first]
+    assert factory.get_pair_seeds(third.pair(), 0, 10) == [third]
+    assert factory.get_pair_seeds(lido, 0, 10) == []
+
+
+def test_registry_by_pair_unbounded(factory, lido, weth):
+    # a pair can't be blocked by filling up its list
+    txs = [factory.deploy_seed([lido, weth], ["1 ether", "1 ether"], 86400, 0) for _ in range(101)]
+    pair = txs[0].events["SeedDeployed"]["pair"]
+    seeds = [tx.events["SeedDeployed"]["seed"] for tx in txs]
+    assert factory.pair_seed_count(pair) == 101
+    assert factory.get_pair_seeds(pair, 0, 1000) == seeds
+    assert factory.get_pair_seeds(pair, 100, 10) == seeds[100:]
+
+
+def test_deploy_seed_liquid_pair(factory, uniswap, lido, weth, agent, whale, chain):
+    lido.transfer(whale, "1 ether", {'from': agent})
+    lido.approve(uniswap, "1 ether", {'from': whale})
+    weth.approve(uniswap, "1 ether", {'from': whale})
+    uniswap.addLiquidity(lido, weth, "1 ether", "1 ether", 0, 0, whale, chain.time() + 100, {'from': whale})
+
+    with brownie.reverts():
+        factory.deploy_seed([lido, weth], ["10 ether", "10 ether"], 86400, 0)
+    assert factory.seed_count() == 0
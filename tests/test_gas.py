@@ -0,0 +1,149 @@
+import pytest
+
+
+@pytest.fixture
+def funded(lido, weth, agent, whale, accounts, seed):
+    # agent brings lido only, whale brings both tokens
+    lido.transfer(whale, seed.target(0), {"from": agent})
+    lido.approve(seed, seed.target(0), {"from": agent})
+    lido.approve(seed, seed.target(0), {"from": whale})
+    weth.approve(seed, seed.target(1), {"from": whale})
+
+
+def test_deposit_single(seed, funded, agent, check_gas):
+    amount = seed.target(0) // 4
+    check_gas("deposit_first_single", seed.deposit([amount, 0], {"from": agent}))
+    check_gas("deposit_topup_single", seed.deposit([amount, 0], {"from": agent}))
+
+
+def test_deposit_single_entry(seed, funded, agent, check_gas):
+    amount = seed.target(0) // 4
+    check_gas("deposit_single_first", seed.deposit_single(0, amount, {"from": agent}))
+    check_gas("deposit_single_topup", seed.deposit_single(0, amount, {"from": agent}))
+
+
+def test_deposit_target_full(seed, funded, agent, whale, check_gas):
+    # nothing is left to take of token 0, so no transfer is made
+    seed.deposit([seed.target(0) // 2, 0], {"from": agent})
+    seed.deposit([seed.target(0) // 2, seed.target(1) // 2], {"from": whale})
+    check_gas("deposit_target_full", seed.deposit([seed.target(0) // 4, 0], {"from": agent}))
+
+
+def test_deposit_both(seed, funded, whale, check_gas):
+    amounts = [seed.target(0) // 4, seed.target(1) // 4]
+    check_gas("deposit_first_both", seed.deposit(amounts, {"from": whale}))
+    check_gas("deposit_topup_both", seed.deposit(amounts, {"from": whale}))
+
+
+def test_deposit_clamped(seed, funded, agent, whale, check_gas):
+    seed.deposit([seed.target(0) // 2, 0], {"from": agent})
+    tx = seed.deposit([seed.target(0), seed.target(1)], {"from": whale})
+    assert seed.totals(0) == seed.target(0)
+    check_gas("deposit_clamped", tx)
+
+
+def test_deposit_permit(SeedLiquidity, uniswap, permit_token, weth, agent, accounts, sign_permit, chain, check_gas):
+    seed = SeedLiquidity.deploy(uniswap, [permit_token, weth], ["10 ether", "10 ether"], 86400, 0, False, {"from": agent})
+    signer = accounts.add()
+    accounts[0].transfer(signer, "1 ether")
+    permit_token.transfer(signer, "10 ether", {"from": agent})
+    no_permit = (0, 0, b"\x00" * 32, b"\x00" * 32)
+    permit = sign_permit(permit_token, signer, seed, "5 ether", chain.time() + 3600)
+    check_gas("deposit_permit", seed.deposit_with_permit(["5 ether", 0], [permit, no_permit], {"from": signer}))
+
+
+def test_deposit_eth(seed, funded, agent, whale, check_gas):
+    amount = seed.target(1) // 4
+    check_gas("deposit_eth_first", seed.deposit_eth(seed.target(0) // 4, {"from": agent, "value": amount}))
+    seed.deposit([0, seed.target(1) - 2 * amount], {"from": whale})
+    check_gas("deposit_eth_refund", seed.deposit_eth(0, {"from": agent, "value": 2 * amount}))
+
+
+def test_provide(seed, funded, agent, whale, check_gas):
+    seed.deposit([seed.target(0), 0], {"from": agent})
+    seed.deposit([0, seed.target(1)], {"from": whale})
+    check_gas("provide", seed.provide({"from": agent}))
+
+
+def test_claim(seed, funded, agent, whale, check_gas):
+    seed.deposit([seed.target(0) // 2, 0], {"from": agent})
+    seed.deposit([seed.target(0) // 2, seed.target(1)], {"from": whale})
+    seed.provide({"from": agent})
+    check_gas("claim_first", seed.claim({"from": agent}))
+    check_gas("claim_last", seed.claim({"from": whale}))
+
+
+def test_bail(seed, funded, agent, whale, chain, check_gas):
+    seed.deposit([seed.target(0) // 2, 0], {"from": agent})
+    seed.deposit([seed.target(0) // 4, seed.target(1) // 2], {"from": whale})
+    chain.sleep(14 * 86400)
+    check_gas("bail_single", seed.bail({"from": agent}))
+    check_gas("bail_both", seed.bail({"from": whale}))
+
+
+def test_bail_unwrap(seed, funded, whale, chain, check_gas):
+    seed.deposit([seed.target(0) // 4, seed.target(1) // 2], {"from": whale})
+    chain.sleep(14 * 86400)
+    check_gas("bail_unwrap", seed.bail(True, {"from": whale}))
+
+
+@pytest.fixture
+def crowd(seed, lido, weth, agent, whale, accounts):
+    # ten depositors splitting both targets evenly
+    users = list(accounts[:8]) + [agent, whale]
+    for user in users:
+        lido.transfer(user, seed.target(0) // 10, {"from": agent})
+        weth.transfer(user, seed.target(1) // 10, {"from": whale})
+        lido.approve(seed, seed.target(0) // 10, {"from": user})
+        weth.approve(seed, seed.target(1) // 10, {"from": user})
+        seed.deposit([seed.target(0) // 10, seed.target(1) // 10], {"from": user})
+    return users
+
+
+def test_claim_for(seed, crowd, accounts, check_gas):
+    seed.provide({"from": accounts[0]})
+    check_gas("claim_for_1", seed.claim_for(crowd[:1], {"from": accounts[0]}))
+    check_gas("claim_for_9", seed.claim_for(crowd[1:], {"from": accounts[0]}))
+
+
+def test_bail_for(seed, crowd, accounts, chain, check_gas):
+    chain.sleep(14 * 86400)
+    check_gas("bail_for_1", seed.bail_for(crowd[:1], {"from": accounts[0]}))
+    check_gas("bail_for_9", seed.bail_for(crowd[1:], {"from": accounts[0]}))
+
+
+def test_provide_existing_pair(seed, funded, agent, whale, uniswap, lido, weth, MockUniswapFactory, forked, check_gas):
+    if forked:
+        pytest.skip("the mainnet pair already exists")
+    seed.deposit([seed.target(0), 0], {"from": agent})
+    seed.deposit([0, seed.target(1)], {"from": whale})
+    MockUniswapFactory.at(uniswap.factory()).createPair(lido, weth, {"from": agent})
+    check_gas("provide_existing_pair", seed.provide({"from": agent}))
+
+
+def test_deploy(SeedLiquidity, MockUniswapFactory, factory, uniswap, lido, weth, accounts, forked, check_gas):
+    if forked:
+        pytest.skip("the mainnet pair already exists")
+    # the pair is only created by `provide()`, the later deployments find it existing
+    args = ([lido, weth], ["10000000 ether", "150 ether"], 14 * 86400, 0, False)
+    check_gas("deploy_new_pair", SeedLiquidity.deploy(uniswap, *args, {"from": accounts[0]}).tx)
+    MockUniswapFactory.at(uniswap.factory()).createPair(lido, weth, {"from": accounts[0]})
+    check_gas("deploy_full", SeedLiquidity.deploy(uniswap, *args, {"from": accounts[0]}).tx)
+    check_gas("deploy_factory", factory.deploy_seed(*args, {"from": accounts[0]}))
+
+
+def test_partial(SeedLiquidity, uniswap, lido, weth, agent, whale, accounts, chain, check_gas):
+    # the weth side reaches half of its target, `claim()` also refunds half of the lido
+    seed = SeedLiquidity.deploy(
+        uniswap, [lido, weth], ["10000000 ether", "150 ether"], 14 * 86400, 0, True, {"from": accounts[0]}
+    )
+    lido.transfer(whale, "5000000 ether", {"from": agent})
+    lido.approve(seed, "5000000 ether", {"from": agent})
+    lido.approve(seed, "5000000 ether", {"from": whale})
+    weth.approve(seed, "75 ether", {"from": whale})
+    seed.deposit(["5000000 ether", 0], {"from": agent})
+    seed.deposit(["5000000 ether", "75 ether"], {"from": whale})
+    chain.sleep(14 * 86400)
+    check_gas("provide_partial", seed.provide({"from": agent}))
+    check_gas("claim_partial_first", seed.claim({"from": agent}))
+    check_gas("claim_partial_last", seed.claim({"from": whale}))
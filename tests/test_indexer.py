@@ -0,0 +1,92 @@
+import sqlite3
+
+from brownie import SeedLiquidity, web3
+from scripts.indexer import Indexer
+
+
+def rows(db_path, *columns):
+    query = f"SELECT {', '.join(columns)} FROM events ORDER BY block_number, log_index"
+    return sqlite3.connect(db_path).execute(query).fetchall()
+
+
+def test_events(seed, lido, weth, agent, whale, interface):
+    lido.approve(seed, seed.target(0), {'from': agent})
+    tx = seed.deposit([seed.target(0) * 2, 0], {'from': agent})
+    assert tx.events["Deposit"]["user"] == agent
+    assert tx.events["Deposit"]["amounts"][0] == seed.target(0)
+    assert tx.events["Deposit"]["amounts"][1] == 0
+
+    weth.approve(seed, seed.target(1), {'from': whale})
+    seed.deposit([0, seed.target(1)], {'from': whale})
+    tx = seed.provide({'from': whale})
+    assert tx.events["Provide"]["caller"] == whale
+    assert tx.events["Provide"]["amounts"][0] == seed.target(0)
+    assert tx.events["Provide"]["amounts"][1] == seed.target(1)
+    assert tx.events["Provide"]["liquidity"] == seed.liquidity()
+
+    tx = seed.claim({'from': agent})
+    assert tx.events["Claim"]["user"] == agent
+    assert tx.events["Claim"]["liquidity"] == interface.ERC20(seed.pair()).balanceOf(agent)
+
+
+def test_bail_event(seed, lido, agent, chain):
+    lido.approve(seed, "5 ether", {'from': agent})
+    seed.deposit(["5 ether", 0], {'from': agent})
+    chain.sleep(14 * 86400)
+    tx = seed.bail({'from': agent})
+    assert tx.events["Bail"]["user"] == agent
+    assert tx.events["Bail"]["amounts"][0] == "5 ether"
+    assert tx.events["Bail"]["amounts"][1] == 0
+
+
+def test_indexer(seed, lido, weth, agent, whale, accounts, interface, tmp_path):
+    db_path = tmp_path / "seed.db"
+    start = web3.eth.block_number
+    lido.approve(seed, seed.target(0), {'from': agent})
+    weth.approve(seed, seed.target(1), {'from': whale})
+    seed.deposit([seed.target(0) // 2, 0], {'from': agent})
+    seed.deposit([0, seed.target(1) // 3], {'from': whale})
+
+    indexer = Indexer(web3, seed, SeedLiquidity.abi, db_path, chunk_size=2, start_block=start)
+    assert indexer.sync() == 2
+    assert indexer.checkpoint == web3.eth.block_number
+    assert rows(db_path, "event", "user", "amount0", "amount1") == [
+        ("Deposit", agent, str(seed.target(0) // 2), "0"),
+        ("Deposit", whale, "0", str(seed.target(1) // 3)),
+    ]
+
+    # a new indexer on the same database resumes after the checkpoint
+    seed.deposit([seed.target(0), 0], {'from': agent})
+    seed.deposit([0, seed.target(1)], {'from': whale})
+    seed.provide({'from': accounts[0]})
+    seed.claim({'from': agent})
+    indexer = Indexer(web3, seed, SeedLiquidity.abi, db_path, chunk_size=2, start_block=start)
+    assert indexer.sync() == 4
+    assert indexer.sync() == 0
+    assert rows(db_path, "event", "user") == [
+        ("Deposit", agent),
+        ("Deposit", whale),
+        ("Deposit", agent),
+        ("Deposit", whale),
+        ("Provide", accounts[0]),
+        ("Claim", agent),
+    ]
+    # the stored amounts are the clamped ones
+    assert rows(db_path, "amount0", "amount1")[2:4] == [
+        (str(seed.target(0) - seed.target(0) // 2), "0"),
+        ("0", str(seed.target(1) - seed.target(1) // 3)),
+    ]
+    claimed = interface.ERC20(seed.pair()).balanceOf(agent)
+    assert rows(db_path, "liquidity")[4:] == [(str(seed.liquidity()),), (str(claimed),)]
+
+
+def test_indexer_confirmations(seed, lido, agent, tmp_path):
+    start = web3.eth.block_number
+    lido.approve(seed, "1 ether", {'from': agent})
+    seed.deposit(["1 ether", 0], {'from': agent})
+
+    indexer = Indexer(web3, seed, SeedLiquidity.abi, tmp_path / "seed.db", start_block=start, confirmations=1)
+    assert indexer.sync() == 0
+    assert indexer.checkpoint == web3.eth.block_number - 1
+    lido.approve(seed, 0, {'from': agent})
+    assert indexer.sync() == 1
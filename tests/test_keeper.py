@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+from brownie import SeedLiquidity, web3
+from scripts.keeper import Keeper
+from web3.exceptions import TimeExhausted
+
+
+@pytest.fixture(scope="module")
+def signer(accounts):
+    signer = accounts.add()
+    accounts[0].transfer(signer, "10 ether")
+    return signer
+
+
+@pytest.fixture(scope="module")
+def seeds(factory, lido, weth):
+    seeds = []
+    for _ in range(3):
+        tx = factory.deploy_seed([lido, weth], ["10 ether", "10 ether"], 86400, 0)
+        seeds.append(SeedLiquidity.at(tx.events["SeedDeployed"]["seed"]))
+    return seeds
+
+
+def fill(seed, lido, weth, agent, whale, share=1):
+    lido.approve(seed, "10 ether", {'from': agent})
+    seed.deposit([10**19 // share, 0], {'from': agent})
+    weth.approve(seed, "10 ether", {'from': whale})
+    seed.deposit([0, 10**19 // share], {'from': whale})
+
+
+def keeper(signer, seeds, **kwargs):
+    return Keeper(web3, signer.private_key, seeds, SeedLiquidity.abi, **kwargs)
+
+
+def test_provide(seeds, signer, lido, weth, agent, whale):
+    fill(seeds[0], lido, weth, agent, whale)
+    fill(seeds[2], lido, weth, agent, whale, share=2)
+    bot = keeper(signer, seeds)
+
+    actions = asyncio.run(bot.tick())
+    assert [(seed, action) for seed, action, _ in actions] == [(seeds[0], "provide")]
+    assert seeds[0].liquidity() > 0
+    assert seeds[1].liquidity() == 0
+    assert seeds[2].liquidity() == 0
+
+    # nothing left to do
+    assert asyncio.run(bot.tick()) == []
+
+
+def test_provide_concurrent(factory, weth, whale, signer, accounts, MockERC20):
+    # seeds on different pairs become ready in the same round
+    seeds = []
+    for _ in range(3):
+        other = MockERC20.deploy("Other", "OTH", 18, "100 ether", {'from': accounts[0]})
+        tx = factory.deploy_seed([other, weth], ["10 ether", "10 ether"], 86400, 0)
+        seed = SeedLiquidity.at(tx.events["SeedDeployed"]["seed"])
+        other.approve(seed, "10 ether", {'from': accounts[0]})
+        seed.deposit(["10 ether", 0], {'from': accounts[0]})
+        weth.approve(seed, "10 ether", {'from': whale})
+        seed.deposit([0, "10 ether"], {'from': whale})
+        seeds.append(seed)
+
+    nonce = signer.nonce
+    actions = asyncio.run(keeper(signer, seeds).tick())
+    assert len(actions) == 3
+    assert all(seed.liquidity() > 0 for seed in seeds)
+    assert sorted(web3.eth.get_transaction(tx)["nonce"] for _, _, (tx,) in actions) == [nonce, nonce + 1, nonce + 2]
+
+
+def test_provided_by_someone_else(seeds, signer, lido, weth, agent, whale):
+    fill(seeds[0], lido, weth, agent, whale)
+    seeds[0].provide({'from': agent})
+    nonce = signer.nonce
+    assert asyncio.run(keeper(signer, seeds).tick()) == []
+    assert signer.nonce == nonce
+
+
+def test_failing_seed(seeds, signer, lido, weth, agent, whale):
+    # `state()` reverts on a contract which isn't a seed, the other seeds are still served
+    fill(seeds[0], lido, weth, agent, whale)
+    bot = keeper(signer, [lido] + seeds)
+    actions = asyncio.run(bot.tick())
+    assert [(seed, action) for seed, action, _ in actions] == [(seeds[0], "provide")]
+    assert seeds[0].liquidity() > 0
+
+
+def test_stuck_transaction(seeds, signer, lido, weth, agent, whale, monkeypatch):
+    fill(seeds[0], lido, weth, agent, whale)
+    bot = keeper(signer, seeds)
+    nonce = signer.nonce
+
+    def timeout(tx_hash, *args, **kwargs):
+        raise TimeExhausted(f"{tx_hash.hex()} not mined")
+
+    monkeypatch.setattr(web3.eth, "wait_for_transaction_receipt", timeout)
+    actions = asyncio.run(bot.tick())
+    assert [(seed, action) for seed, action, _ in actions] == [(seeds[0], "provide")]
+    assert bot.stuck[seeds[0].address][0] == nonce
+    # later sends queue behind the stuck nonce
+    assert bot.nonce == nonce + 1
+
+    # the dev chain mined it after all, nothing is left to replace
+    monkeypatch.undo()
+    assert asyncio.run(bot.tick()) == []
+    assert bot.stuck == {}
+
+
+def test_gas_price_cap(seeds, signer, lido, weth, agent, whale):
+    fill(seeds[0], lido, weth, agent, whale)
+    if web3.eth.gas_price == 0:
+        pytest.skip("the dev chain has no gas price")
+    bot = keeper(signer, seeds, max_gas_price=web3.eth.gas_price, gas_price_multiplier=2)
+    assert asyncio.run(bot.tick()) == [(seeds[0].address, "provide", [])]
+    assert seeds[0].liquidity() == 0
+
+
+def test_bail_due(seeds, signer, lido, weth, agent, whale, chain):
+    fill(seeds[1], lido, weth, agent, whale, share=2)
+    chain.sleep(86400)
+    chain.mine()
+
+    assert asyncio.run(keeper(signer, seeds).tick()) == [(seeds[1].address, "bail_due", [])]
+    assert seeds[1].balances(agent, 0) == "5 ether"
+
+
+def test_bail_refund(seeds, signer, lido, weth, agent, whale, chain):
+    lido_before = lido.balanceOf(agent)
+    weth_before = weth.balanceOf(whale)
+    fill(seeds[1], lido, weth, agent, whale, share=2)
+    chain.sleep(86400)
+    chain.mine()
+
+    bot = keeper(signer, seeds, refund=True)
+    actions = asyncio.run(bot.tick())
+    assert [(seed, action, len(txs)) for seed, action, txs in actions] == [(seeds[1].address, "bail_for", 1)]
+    assert lido.balanceOf(agent) == lido_before
+    assert weth.balanceOf(whale) == weth_before
+
+    # everyone was refunded
+    assert asyncio.run(bot.tick()) == []
@@ -0,0 +1,31 @@
+from brownie import web3
+from scripts.load_test import LoadTest
+from scripts.stats import percentile
+
+
+def test_percentile():
+    assert percentile([5, 1, 4, 2, 3], 50) == 3
+    assert percentile([5, 1, 4, 2, 3], 90) == 5
+    assert percentile(list(range(1, 101)), 99) == 99
+    assert percentile([], 50) == 0
+
+
+def test_load(SeedLiquidity, uniswap, lido, weth, agent, whale, accounts, interface):
+    seed = SeedLiquidity.deploy(uniswap, [lido, weth], ["10 ether", "1 ether"], 86400, 0, False, {"from": accounts[0]})
+    funder = accounts.add()
+    accounts[0].transfer(funder, "1 ether")
+    lido.transfer(funder, "20 ether", {"from": agent})
+    weth.transfer(funder, "2 ether", {"from": whale})
+
+    test = LoadTest(web3, seed, SeedLiquidity.abi, lido.abi, funder.private_key, users=8, workers=4)
+    reports = test.run(overfill=1.5)
+    assert [report.name for report in reports] == ["fund", "approve", "deposit", "provide", "claim"]
+    assert [report.txs for report in reports[:4]] == [16, 8, 8, 1]
+    assert all(report.reverted == 0 for report in reports)
+
+    # the burst overshoots the target, the late deposits are clamped
+    assert seed.totals(0) == "10 ether"
+    assert seed.totals(1) == "1 ether"
+    assert test.clamped() > 0
+    assert reports[4].txs == sum(any(amounts) for amounts in test.accepted.values())
+    assert interface.ERC20(seed.pair()).balanceOf(seed) == 0
@@ -0,0 +1,112 @@
+import brownie
+
+def test_bail_seed_running(multi, campaign, lido, weth, agent, whale, chain):
+    lido_amount = multi.target(campaign, 0)
+    weth_amount = multi.target(campaign, 1)
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign, [lido_amount, 0], {'from': agent})
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign, [0, weth_amount], {'from': whale})
+
+    with brownie.reverts():
+        multi.bail(campaign, {'from': agent})
+    with brownie.reverts():
+        multi.bail(campaign, {'from': whale})
+
+def test_bail_targets_met_expired(multi, campaign, lido, weth, agent, whale, chain):
+    lido_amount = multi.target(campaign, 0)
+    weth_amount = multi.target(campaign, 1)
+
+    lido_before = lido.balanceOf(agent)
+    weth_before = weth.balanceOf(whale)
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign, [lido_amount, 0], {'from': agent})
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign, [0, weth_amount], {'from': whale})
+
+    chain.sleep(14 * 86400)
+
+    multi.bail(campaign, {'from': agent})
+    assert lido.balanceOf(agent) == lido_before
+
+    multi.bail(campaign, {'from': whale})
+    assert weth.balanceOf(whale) == weth_before
+
+def test_bail_targets_not_met(multi, campaign, lido, weth, agent, whale, chain):
+    lido_amount = multi.target(campaign, 0)//2
+    weth_amount = multi.target(campaign, 1)*3//4
+
+    lido_before = lido.balanceOf(agent)
+    weth_before = weth.balanceOf(whale)
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign, [lido_amount, 0], {'from': agent})
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign, [0, weth_amount], {'from': whale})
+
+    with brownie.reverts():
+        multi.provide(campaign)
+
+    chain.sleep(14 * 86400)
+
+    multi.bail(campaign, {'from': agent})
+    assert lido.balanceOf(agent) == lido_before
+
+    multi.bail(campaign, {'from': whale})
+    assert weth.balanceOf(whale) == weth_before
+
+def test_bail_targets_met_expired_multi_deposit(multi, campaign, lido, weth, agent, whale, chain):
+    lido_amount = multi.target(campaign, 0)
+    weth_amount = multi.target(campaign, 1)
+
+    lido_before = lido.balanceOf(agent)
+    weth_before = weth.balanceOf(whale)
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign, [lido_amount//2, 0], {'from': agent})
+    multi.deposit(campaign, [lido_amount//2, 0], {'from': agent})
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign, [0, weth_amount//4], {'from': whale})
+    multi.deposit(campaign, [0, weth_amount//4], {'from': whale})
+    multi.deposit(campaign, [0, weth_amount//4], {'from': whale})
+    multi.deposit(campaign, [0, weth_amount//4], {'from': whale})
+
+    chain.sleep(14 * 86400)
+
+    multi.bail(campaign, {'from': agent})
+    assert lido.balanceOf(agent) == lido_before
+
+    multi.bail(campaign, {'from': whale})
+    assert weth.balanceOf(whale) == weth_before
+
+def test_bail_for(multi, campaign, lido, weth, agent, whale, accounts, chain):
+    lido_amount = multi.target(campaign, 0) // 2
+    weth_amount = multi.target(campaign, 1) // 2
+
+    lido_before = lido.balanceOf(agent)
+    weth_before = weth.balanceOf(whale)
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign, [lido_amount, 0], {'from': agent})
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign, [0, weth_amount], {'from': whale})
+
+    with brownie.reverts():
+        multi.bail_for(campaign, [agent, whale], {'from': accounts[1]})
+
+    chain.sleep(14 * 86400)
+
+    multi.bail_for(campaign, [agent, whale, accounts[1]], {'from': accounts[1]})
+    assert lido.balanceOf(agent) == lido_before
+    assert weth.balanceOf(whale) == weth_before
+    assert multi.balances(campaign, agent, 0) == 0
+    assert multi.balances(campaign, whale, 1) == 0
+    assert lido.balanceOf(multi) == 0
+    assert weth.balanceOf(multi) == 0
@@ -0,0 +1,228 @@
+import brownie
+
+def test_claim_seed_expired(multi, campaign, lido, weth, agent, whale, chain):
+
+    lido_amount = multi.target(campaign, 0)
+    weth_amount = multi.target(campaign, 1)
+
+    lido_before = lido.balanceOf(agent)
+    weth_seed_before = weth.balanceOf(multi)
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign, [lido_amount, 0], {'from': agent})
+
+    lido_after = lido.balanceOf(agent)
+
+    assert lido_amount == lido_before - lido_after
+    assert lido.balanceOf(multi) == lido_amount
+    assert weth.balanceOf(multi) == weth_seed_before
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.balances(campaign, agent, 1) == 0
+    assert multi.totals(campaign, 0) == lido_amount
+    assert multi.totals(campaign, 1) == 0
+
+    weth_before = weth.balanceOf(whale)
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign, [0, weth_amount], {'from': whale})
+
+    weth_after = weth.balanceOf(whale)
+
+    assert weth_amount == weth_before - weth_after
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.balances(campaign, whale, 0) == 0
+    assert multi.totals(campaign, 1) == weth_amount
+
+    chain.sleep(14 * 86400)
+
+    with brownie.reverts():
+        multi.claim(campaign)
+    with brownie.reverts():
+        multi.provide(campaign)
+    with brownie.reverts():
+        multi.claim(campaign)
+
+def test_claim_target_not_met(multi, campaign, lido, weth, agent, whale, chain):
+
+    lido_amount = multi.target(campaign, 0)//2
+    weth_amount = multi.target(campaign, 1)*3//4
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign, [lido_amount, 0], {'from': agent})
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign, [0, weth_amount], {'from': whale})
+
+    with brownie.reverts():
+        multi.claim(campaign)
+    with brownie.reverts():
+        multi.provide(campaign)
+    with brownie.reverts():
+        multi.claim(campaign)
+
+def test_claim_targets_met_not_provided(multi, campaign, lido, weth, agent, whale, chain):
+
+    lido_amount = multi.target(campaign, 0)
+    weth_amount = multi.target(campaign, 1)
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign, [lido_amount, 0], {'from': agent})
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign, [0, weth_amount], {'from': whale})
+
+    with brownie.reverts():
+        multi.claim(campaign)
+
+def test_claim_targets_met_provided_locked(multi, campaign_with_waitime, lido, weth, agent, whale, chain):
+
+    lido_amount = multi.target(campaign_with_waitime, 0)
+    weth_amount = multi.target(campaign_with_waitime, 1)
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign_with_waitime, [lido_amount, 0], {'from': agent})
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign_with_waitime, [0, weth_amount], {'from': whale})
+
+    multi.provide(campaign_with_waitime)
+    with brownie.reverts():
+        multi.claim(campaign_with_waitime)
+
+def test_claim_targets_met_provided_unlocked_distribute(multi, campaign_with_waitime, lido, weth, agent, whale, interface, chain):
+    pair = interface.ERC20(multi.pair(campaign_with_waitime))
+    lido_amount = multi.target(campaign_with_waitime, 0)
+    weth_amount = multi.target(campaign_with_waitime, 1)
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign_with_waitime, [lido_amount, 0], {'from': agent})
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign_with_waitime, [0, weth_amount], {'from': whale})
+
+    multi.provide(campaign_with_waitime)
+
+    chain.sleep(100)
+
+    multi.claim(campaign_with_waitime, {"from": agent})
+    assert pair.balanceOf(agent) == multi.liquidity(campaign_with_waitime) // 2
+
+    # the last claimer also receives the rounding dust
+    multi.claim(campaign_with_waitime, {"from": whale})
+    assert pair.balanceOf(whale) == multi.liquidity(campaign_with_waitime) - pair.balanceOf(agent)
+
+def test_claim_targets_met_multiaccount_provided_unlocked_distribute(multi, campaign_with_waitime, lido, weth, agent, whale, interface, chain):
+    pair = interface.ERC20(multi.pair(campaign_with_waitime))
+    lido_amount = multi.target(campaign_with_waitime, 0)
+    weth_amount = multi.target(campaign_with_waitime, 1)
+
+    lido.approve(multi, lido_amount//2)
+    multi.deposit(campaign_with_waitime, [lido_amount//2, 0], {'from': agent})
+
+    lido.transfer(whale, lido_amount//2, {'from': agent})
+
+    lido.approve(multi, lido_amount//2, {'from': whale})
+    multi.deposit(campaign_with_waitime, [lido_amount//2, 0], {'from': whale})
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign_with_waitime, [0, weth_amount], {'from': whale})
+
+    multi.provide(campaign_with_waitime)
+
+    chain.sleep(100)
+
+    multi.claim(campaign_with_waitime, {"from": agent})
+    assert pair.balanceOf(agent) == multi.liquidity(campaign_with_waitime) // 4
+
+    multi.claim(campaign_with_waitime, {"from": whale})
+    assert pair.balanceOf(whale) == multi.liquidity(campaign_with_waitime) - pair.balanceOf(agent)
+
+
+def test_claim_sum_equals_liquidity(multi, campaign, lido, weth, agent, whale, accounts, interface, chain):
+    pair = interface.ERC20(multi.pair(campaign))
+    lido_amount = multi.target(campaign, 0)
+    weth_amount = multi.target(campaign, 1)
+    lido_parts = [lido_amount // 3, lido_amount // 7, lido_amount - lido_amount // 3 - lido_amount // 7]
+    weth_parts = [weth_amount // 11, weth_amount - weth_amount // 11, 0]
+    users = [agent, whale, accounts[1]]
+
+    for user, lido_part, weth_part in zip(users, lido_parts, weth_parts):
+        lido.transfer(user, lido_part, {'from': agent})
+        lido.approve(multi, lido_part, {'from': user})
+        weth.transfer(user, weth_part, {'from': whale})
+        weth.approve(multi, weth_part, {'from': user})
+    for user, lido_part, weth_part in zip(users, lido_parts, weth_parts):
+        multi.deposit(campaign, [lido_part, weth_part], {'from': user})
+
+    multi.provide(campaign)
+    before = [pair.balanceOf(user) for user in users]
+    for user in users:
+        multi.claim(campaign, {'from': user})
+
+    claimed = [pair.balanceOf(user) - b for user, b in zip(users, before)]
+    assert sum(claimed) == multi.liquidity(campaign)
+    assert pair.balanceOf(multi) == 0
+
+
+def test_claim_last_leaves_stray_lp(multi, campaign, lido, weth, agent, whale, interface):
+    pair = interface.ERC20(multi.pair(campaign))
+    lido.approve(multi, multi.target(campaign, 0), {'from': agent})
+    multi.deposit(campaign, [multi.target(campaign, 0), 0], {'from': agent})
+    weth.approve(multi, multi.target(campaign, 1), {'from': whale})
+    multi.deposit(campaign, [0, multi.target(campaign, 1)], {'from': whale})
+    multi.provide(campaign)
+
+    multi.claim(campaign, {'from': whale})
+    first = pair.balanceOf(whale)
+    # LP sent to the shared contract doesn't belong to the campaign
+    pair.transfer(multi, first // 2, {'from': whale})
+    multi.claim(campaign, {'from': agent})
+    assert pair.balanceOf(agent) == multi.liquidity(campaign) - first
+    assert pair.balanceOf(multi) == first // 2
+
+
+def test_claim_for(multi, campaign_with_waitime, lido, weth, agent, whale, accounts, interface, chain):
+    campaign = campaign_with_waitime
+    pair = interface.ERC20(multi.pair(campaign))
+    users = [agent, whale, accounts[1]]
+    lido_amount = multi.target(campaign, 0) // 3
+    weth_amount = multi.target(campaign, 1) // 3
+    lido_parts = [multi.target(campaign, 0) - 2 * lido_amount, lido_amount, lido_amount]
+    weth_parts = [multi.target(campaign, 1) - 2 * weth_amount, weth_amount, weth_amount]
+
+    for user, lido_part, weth_part in zip(users, lido_parts, weth_parts):
+        lido.transfer(user, lido_part, {'from': agent})
+        lido.approve(multi, lido_part, {'from': user})
+        weth.transfer(user, weth_part, {'from': whale})
+        weth.approve(multi, weth_part, {'from': user})
+        multi.deposit(campaign, [lido_part, weth_part], {'from': user})
+
+    multi.provide(campaign)
+    with brownie.reverts():
+        multi.claim_for(campaign, users, {'from': accounts[2]})
+
+    chain.sleep(100)
+    expected = [
+        multi.balances(campaign, user, 0) * multi.liquidity(campaign) // (2 * multi.target(campaign, 0))
+        + multi.balances(campaign, user, 1) * multi.liquidity(campaign) // (2 * multi.target(campaign, 1))
+        for user in users[1:]
+    ]
+    multi.claim_for(campaign, users[1:], {'from': accounts[2]})
+    assert [pair.balanceOf(user) for user in users[1:]] == expected
+    assert multi.balances(campaign, whale, 0) == 0
+    assert multi.balances(campaign, whale, 1) == 0
+
+    # already claimed users are skipped
+    multi.claim_for(campaign, users, {'from': accounts[2]})
+    assert [pair.balanceOf(user) for user in users[1:]] == expected
+    assert pair.balanceOf(agent) == multi.liquidity(campaign) - sum(expected)
+    assert pair.balanceOf(multi) == 0
+
+
+def test_claim_for_not_seeded(multi, campaign, lido, agent):
+    lido.approve(multi, multi.target(campaign, 0), {'from': agent})
+    multi.deposit(campaign, [multi.target(campaign, 0), 0], {'from': agent})
+
+    with brownie.reverts():
+        multi.claim_for(campaign, [agent])
@@ -0,0 +1,279 @@
+import pytest
+import brownie
+
+
+@pytest.fixture(scope="module")
+def campaign(multi, lido, weth, accounts):
+    tx = multi.create([lido, weth], ["10 ether", "10 ether"], 14 * 86400, 0, {"from": accounts[0]})
+    return tx.events["CampaignCreated"]["id"]
+
+
+def test_lido_not_approved(multi, campaign, lido, agent):
+    lido_amount = "1 ether"
+
+    with brownie.reverts():
+        multi.deposit(campaign,
+            [lido_amount, 0],
+            {'from': agent},
+        )
+
+    assert lido.balanceOf(multi) == 0
+    assert multi.balances(campaign, agent, 0) == 0
+    assert multi.totals(campaign, 0) == 0
+
+
+def test_lido_approved(multi, campaign, lido, agent):
+    lido_amount = "1 ether"
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    multi.deposit(campaign,
+        [lido_amount, 0],
+        {'from': agent},
+    )
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+
+    lido_amount = "2 ether"
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    multi.deposit(campaign,
+        [lido_amount, 0],
+        {'from': agent},
+    )
+
+    lido_amount = "3 ether"
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+
+
+def test_weth_not_approved(multi, campaign, weth, whale):
+    weth_amount = "1 ether"
+
+    with brownie.reverts():
+        multi.deposit(campaign,
+            [0, weth_amount],
+            {'from': whale},
+        )
+
+    assert weth.balanceOf(multi) == 0
+    assert multi.balances(campaign, whale, 1) == 0
+    assert multi.totals(campaign, 1) == 0
+
+
+def test_weth_approved(multi, campaign, weth, whale):
+    weth_amount = "1 ether"
+
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [0, weth_amount],
+        {'from': whale},
+    )
+
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    weth_amount = "2 ether"
+
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [0, weth_amount],
+        {'from': whale},
+    )
+
+    weth_amount = "3 ether"
+
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+
+def test_both_approved(multi, campaign, lido, weth, agent, whale):
+    lido_amount = "1 ether"
+    weth_amount = "1 ether"
+
+    lido.transfer(whale, lido_amount, {'from': agent})
+    lido.approve(multi, lido_amount, {'from': whale})
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [lido_amount, weth_amount],
+        {'from': whale},
+    )
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, whale, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    lido_amount = "2 ether"
+    weth_amount = "2 ether"
+
+    lido.transfer(whale, lido_amount, {'from': agent})
+    lido.approve(multi, lido_amount, {'from': whale})
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [lido_amount, weth_amount],
+        {'from': whale},
+    )
+
+    lido_amount = "3 ether"
+    weth_amount = "3 ether"
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, whale, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+
+def test_lido_expired(multi, campaign, lido, agent, chain):
+    lido_amount = "1 ether"
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    chain.sleep(14 * 86400)
+    with brownie.reverts():
+        multi.deposit(campaign,
+            [lido_amount, 0],
+            {'from': agent},
+        )
+
+    assert lido.balanceOf(multi) == 0
+    assert multi.balances(campaign, agent, 0) == 0
+    assert multi.totals(campaign, 0) == 0
+
+
+def test_weth_expired(multi, campaign, weth, whale, chain):
+    weth_amount = "1 ether"
+
+    weth.approve(multi, weth_amount, {'from': whale})
+    chain.sleep(14 * 86400)
+    with brownie.reverts():
+        multi.deposit(campaign,
+            [0, weth_amount],
+            {'from': whale},
+        )
+
+    assert weth.balanceOf(multi) == 0
+    assert multi.balances(campaign, whale, 1) == 0
+    assert multi.totals(campaign, 1) == 0
+
+
+def test_both_expired(multi, campaign, lido, weth, agent, whale, chain):
+    lido_amount = "1 ether"
+    weth_amount = "1 ether"
+
+    lido.transfer(whale, lido_amount, {'from': agent})
+    lido.approve(multi, lido_amount, {'from': whale})
+    weth.approve(multi, weth_amount, {'from': whale})
+    chain.sleep(14 * 86400)
+    with brownie.reverts():
+        multi.deposit(campaign,
+            [lido_amount, weth_amount],
+            {'from': whale},
+        )
+
+    assert lido.balanceOf(multi) == 0
+    assert multi.balances(campaign, whale, 0) == 0
+    assert multi.totals(campaign, 0) == 0
+    assert weth.balanceOf(multi) == 0
+    assert multi.balances(campaign, whale, 1) == 0
+    assert multi.totals(campaign, 1) == 0
+
+
+def test_lido_exceeds_target(multi, campaign, lido, agent, chain):
+    target_amount = "10 ether"
+    balance_amount = "4 ether"
+    lido_amount = "7 ether"
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    multi.deposit(campaign,
+        [lido_amount, 0],
+        {'from': agent},
+    )
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    multi.deposit(campaign,
+        [lido_amount, 0],
+        {'from': agent},
+    )
+
+    assert lido.balanceOf(multi) == target_amount
+    assert multi.balances(campaign, agent, 0) == target_amount
+    assert multi.totals(campaign, 0) == target_amount
+    assert lido.allowance(agent, multi) == balance_amount
+
+
+def test_weth_exceeds_target(multi, campaign, weth, whale, chain):
+    target_amount = "10 ether"
+    balance_amount = "4 ether"
+    weth_amount = "7 ether"
+
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [0, weth_amount],
+        {'from': whale},
+    )
+
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [0, weth_amount],
+        {'from': whale},
+    )
+
+    assert weth.balanceOf(multi) == target_amount
+    assert multi.balances(campaign, whale, 1) == target_amount
+    assert multi.totals(campaign, 1) == target_amount
+    assert weth.allowance(whale, multi) == balance_amount
+
+
+def test_both_exceeds_target(multi, campaign, lido, weth, agent, whale, chain):
+    target_amount = "10 ether"
+    balance_amount = "4 ether"
+    lido_amount = "7 ether"
+    weth_amount = "7 ether"
+
+    lido.transfer(whale, lido_amount, {'from': agent})
+    lido.approve(multi, lido_amount, {'from': whale})
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [lido_amount, weth_amount],
+        {'from': whale},
+    )
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, whale, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    lido.transfer(whale, lido_amount, {'from': agent})
+    lido.approve(multi, lido_amount, {'from': whale})
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [lido_amount, weth_amount],
+        {'from': whale},
+    )
+
+    assert lido.balanceOf(multi) == target_amount
+    assert multi.balances(campaign, whale, 0) == target_amount
+    assert multi.totals(campaign, 0) == target_amount
+    assert weth.balanceOf(multi) == target_amount
+    assert multi.balances(campaign, whale, 1) == target_amount
+    assert multi.totals(campaign, 1) == target_amount
+    assert lido.allowance(whale, multi) == balance_amount
+    assert weth.allowance(whale, multi) == balance_amount
@@ -0,0 +1,262 @@
+import pytest
+import brownie
+
+
+@pytest.fixture(scope="module")
+def campaign(multi, lido, weth, accounts):
+    tx = multi.create([lido, weth], ["10 ether", "10 ether"], 14 * 86400, 0, {"from": accounts[0]})
+    return tx.events["CampaignCreated"]["id"]
+
+
+def test_both_unfilled(multi, campaign, lido, weth, agent, whale, interface):
+    pair = interface.ERC20(multi.pair(campaign))
+    lido_amount = "9 ether"
+    weth_amount = "9 ether"
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    multi.deposit(campaign,
+        [lido_amount, 0],
+        {'from': agent},
+    )
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [0, weth_amount],
+        {'from': whale},
+    )
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    with brownie.reverts():
+        multi.provide(campaign)
+
+    assert multi.liquidity(campaign) == 0
+    assert pair.balanceOf(multi) == 0
+    assert pair.totalSupply() == 0
+
+
+def test_lido_unfilled(multi, campaign, lido, weth, agent, whale, interface):
+    pair = interface.ERC20(multi.pair(campaign))
+    lido_amount = "9 ether"
+    weth_amount = "10 ether"
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    multi.deposit(campaign,
+        [lido_amount, 0],
+        {'from': agent},
+    )
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [0, weth_amount],
+        {'from': whale},
+    )
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    with brownie.reverts():
+        multi.provide(campaign)
+
+    assert multi.liquidity(campaign) == 0
+    assert pair.balanceOf(multi) == 0
+    assert pair.totalSupply() == 0
+
+
+def test_weth_unfilled(multi, campaign, lido, weth, agent, whale, interface):
+    pair = interface.ERC20(multi.pair(campaign))
+    lido_amount = "10 ether"
+    weth_amount = "9 ether"
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    multi.deposit(campaign,
+        [lido_amount, 0],
+        {'from': agent},
+    )
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [0, weth_amount],
+        {'from': whale},
+    )
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    with brownie.reverts():
+        multi.provide(campaign)
+
+    assert multi.liquidity(campaign) == 0
+    assert pair.balanceOf(multi) == 0
+    assert pair.totalSupply() == 0
+
+
+def test_filled(multi, campaign, lido, weth, agent, whale, interface):
+    pair = interface.ERC20(multi.pair(campaign))
+    lido_amount = "10 ether"
+    weth_amount = "10 ether"
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    multi.deposit(campaign,
+        [lido_amount, 0],
+        {'from': agent},
+    )
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [0, weth_amount],
+        {'from': whale},
+    )
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    multi.provide(campaign)
+
+    assert multi.liquidity(campaign) > 0
+    assert pair.balanceOf(multi) == multi.liquidity(campaign)
+    assert pair.balanceOf(multi) == pair.totalSupply() - 1000  # 1000 LP tokens burned
+
+    # Check revert on second time
+    with brownie.reverts():
+        multi.provide(campaign)
+
+
+def test_existing(multi, campaign, lido, weth, agent, whale, interface, uniswap, chain):
+    pair = interface.ERC20(multi.pair(campaign))
+
+    # Prefund pool
+    lido_amount = "1 ether"
+    weth_amount = "1 ether"
+    lido.transfer(whale, lido_amount, {'from': agent})
+    lido.approve(uniswap, lido_amount, {'from': whale})
+    weth.approve(uniswap, weth_amount, {'from': whale})
+    uniswap.addLiquidity(
+        lido,
+        weth,
+        lido_amount,
+        weth_amount,
+        lido_amount,
+        weth_amount,
+        whale,
+        chain.time(),
+        {'from': whale},
+    )
+
+    assert multi.liquidity(campaign) == 0
+    assert pair.balanceOf(multi) == 0
+    assert pair.balanceOf(whale) > 0
+    assert pair.totalSupply() > 0
+
+    # Try to multi
+    lido_amount = "10 ether"
+    weth_amount = "10 ether"
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    multi.deposit(campaign,
+        [lido_amount, 0],
+        {'from': agent},
+    )
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [0, weth_amount],
+        {'from': whale},
+    )
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    with brownie.reverts():
+        multi.provide(campaign)
+
+    assert multi.liquidity(campaign) == 0
+    assert pair.balanceOf(multi) == 0
+    assert pair.totalSupply() > 0
+
+
+def test_expired(multi, campaign, lido, weth, agent, whale, interface, chain):
+    pair = interface.ERC20(multi.pair(campaign))
+    lido_amount = "10 ether"
+    weth_amount = "10 ether"
+
+    lido.approve(multi, lido_amount, {'from': agent})
+    multi.deposit(campaign,
+        [lido_amount, 0],
+        {'from': agent},
+    )
+    weth.approve(multi, weth_amount, {'from': whale})
+    multi.deposit(campaign,
+        [0, weth_amount],
+        {'from': whale},
+    )
+
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    chain.sleep(14 * 86400)
+    with brownie.reverts():
+        multi.provide(campaign)
+
+    assert multi.liquidity(campaign) == 0
+    assert pair.balanceOf(multi) == 0
+    assert pair.totalSupply() == 0
+
+
+@pytest.fixture(scope="module")
+def hostile(MockHostileToken, whale):
+    return MockHostileToken.deploy("Hostile", "HOST", 18, "1000 ether", {'from': whale})
+
+
+def test_reentrant_provide(multi, campaign, hostile, lido, weth, agent, whale, interface):
+    # another campaign holds WETH in the same contract
+    lido.approve(multi, "10 ether", {'from': agent})
+    weth.approve(multi, "10 ether", {'from': whale})
+    multi.deposit(campaign, ["10 ether", 0], {'from': agent})
+    multi.deposit(campaign, [0, "10 ether"], {'from': whale})
+
+    tx = multi.create([weth, hostile], ["1 ether", "1 ether"], 86400, 0, {'from': whale})
+    attack = tx.events["CampaignCreated"]["id"]
+    weth.approve(multi, "1 ether", {'from': whale})
+    hostile.approve(multi, "1 ether", {'from': whale})
+    multi.deposit(attack, ["1 ether", "1 ether"], {'from': whale})
+
+    # the token re-enters `provide()` while the router pulls it, before any liquidity is recorded
+    hostile.set_hook(multi, multi.provide.encode_input(attack), {'from': whale})
+    multi.provide(attack, {'from': whale})
+    assert not hostile.hook_success()
+
+    pair = interface.ERC20(multi.pair(attack))
+    assert multi.liquidity(attack) == pair.balanceOf(multi)
+    assert weth.balanceOf(multi) == "10 ether"
+    multi.provide(campaign, {'from': agent})
+    assert weth.balanceOf(multi) == 0
+
+
+def test_fee_on_transfer(multi, hostile, weth, whale):
+    tx = multi.create([hostile, weth], ["1 ether", "1 ether"], 86400, 0, {'from': whale})
+    id = tx.events["CampaignCreated"]["id"]
+    hostile.set_fee(100, {'from': whale})
+    hostile.approve(multi, "1 ether", {'from': whale})
+    with brownie.reverts("dev: fee on transfer not supported"):
+        multi.deposit(id, ["1 ether", 0], {'from': whale})
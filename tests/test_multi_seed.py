@@ -0,0 +1,106 @@
+import brownie
+
+
+def test_seed(multi, campaign, lido, weth, agent, whale, interface):
+    pair = interface.ERC20(multi.pair(campaign))
+    lido_amount = multi.target(campaign, 0)
+    weth_amount = multi.target(campaign, 1)
+
+    lido.approve(multi, lido_amount)
+    weth.approve(multi, weth_amount)
+
+    multi.deposit(campaign, [lido_amount, 0], {'from': agent})
+    assert lido.balanceOf(multi) == lido_amount
+    assert multi.balances(campaign, agent, 0) == lido_amount
+    assert multi.totals(campaign, 0) == lido_amount
+
+    multi.deposit(campaign, [0, weth_amount], {'from': whale})
+    assert weth.balanceOf(multi) == weth_amount
+    assert multi.balances(campaign, whale, 1) == weth_amount
+    assert multi.totals(campaign, 1) == weth_amount
+
+    multi.provide(campaign)
+    assert multi.liquidity(campaign) > 0
+    assert pair.balanceOf(multi) == multi.liquidity(campaign)
+    assert pair.balanceOf(multi) + 1000 == pair.totalSupply()
+
+    multi.claim(campaign, {'from': agent})
+    assert pair.balanceOf(agent) == multi.liquidity(campaign) // 2
+
+    multi.claim(campaign, {'from': whale})
+    assert pair.balanceOf(whale) == multi.liquidity(campaign) - pair.balanceOf(agent)
+
+
+def test_bail(multi, campaign, lido, weth, agent, whale, chain):
+    lido_before = lido.balanceOf(agent)
+    weth_before = weth.balanceOf(whale)
+    lido_amount = multi.target(campaign, 0)
+    weth_amount = multi.target(campaign, 1)
+
+    lido.approve(multi, lido_amount)
+    multi.deposit(campaign, [lido_amount, 0], {'from': agent})
+    assert lido.balanceOf(agent) == lido_before - lido_amount
+
+    weth.approve(multi, weth_amount)
+    multi.deposit(campaign, [0, weth_amount], {'from': whale})
+    assert weth.balanceOf(whale) == weth_before - weth_amount
+
+    chain.sleep(14 * 86400)
+
+    multi.bail(campaign, {'from': agent})
+    assert lido.balanceOf(agent) == lido_before
+
+    multi.bail(campaign, {'from': whale})
+    assert weth.balanceOf(whale) == weth_before
+
+
+def test_target_too_large(multi, lido, weth, accounts):
+    count = multi.campaign_count()
+    with brownie.reverts():
+        multi.create([lido, weth], [2**128, "150 ether"], 14 * 86400, 0, {"from": accounts[0]})
+    assert multi.campaign_count() == count
+
+
+def test_campaigns_isolated(multi, campaign, MockERC20, lido, weth, agent, whale, accounts, interface, chain):
+    other = MockERC20.deploy("Other", "OTH", 18, "1000 ether", {'from': agent})
+    count = multi.campaign_count()
+    tx = multi.create([other, weth], ["10 ether", "10 ether"], 14 * 86400, 0, {'from': accounts[0]})
+    second = tx.events["CampaignCreated"]["id"]
+    assert second == campaign + 1
+    assert multi.campaign_count() == count + 1
+    assert multi.pair(second) != multi.pair(campaign)
+
+    lido.approve(multi, multi.target(campaign, 0), {'from': agent})
+    multi.deposit(campaign, [multi.target(campaign, 0), 0], {'from': agent})
+    weth.approve(multi, multi.target(campaign, 1) + 5 * 10**18, {'from': whale})
+    multi.deposit(campaign, [0, multi.target(campaign, 1)], {'from': whale})
+
+    other_before = other.balanceOf(agent)
+    weth_before = weth.balanceOf(whale)
+    other.approve(multi, "4 ether", {'from': agent})
+    multi.deposit(second, ["4 ether", 0], {'from': agent})
+    multi.deposit(second, [0, "5 ether"], {'from': whale})
+    assert multi.totals(second, 0) == "4 ether"
+    assert multi.totals(second, 1) == "5 ether"
+    assert multi.balances(second, agent, 0) == "4 ether"
+    assert multi.balances(campaign, agent, 0) == multi.target(campaign, 0)
+
+    # the second campaign can't be seeded with the tokens of the first one
+    with brownie.reverts():
+        multi.provide(second)
+    multi.provide(campaign)
+    pair = interface.ERC20(multi.pair(campaign))
+    assert pair.balanceOf(multi) == multi.liquidity(campaign)
+    assert multi.liquidity(second) == 0
+
+    chain.sleep(14 * 86400)
+    multi.bail(second, {'from': agent})
+    multi.bail(second, {'from': whale})
+    assert other.balanceOf(agent) == other_before
+    assert weth.balanceOf(whale) == weth_before
+
+    multi.claim(campaign, {'from': agent})
+    multi.claim(campaign, {'from': whale})
+    assert pair.balanceOf(agent) + pair.balanceOf(whale) == multi.liquidity(campaign)
+    assert other.balanceOf(multi) == 0
+    assert weth.balanceOf(multi) == 0
@@ -0,0 +1,166 @@
+import pytest
+import brownie
+
+READY = 1
+BAILABLE = 4
+
+
+@pytest.fixture(scope="module")
+def seed(SeedLiquidity, uniswap, lido, weth, accounts):
+    return SeedLiquidity.deploy(
+        uniswap,
+        [lido, weth],
+        ["10 ether", "10 ether"],
+        14 * 86400,
+        0,
+        True,
+        {"from": accounts[0]},
+    )
+
+
+@pytest.fixture(scope="module")
+def raised(seed, lido, weth, agent, whale, accounts):
+    # the lido side is full, the weth side only reaches half of its target
+    lido.transfer(accounts[1], "4 ether", {'from': agent})
+    for user, amount in [(agent, "6 ether"), (accounts[1], "4 ether")]:
+        lido.approve(seed, amount, {'from': user})
+        seed.deposit([amount, 0], {'from': user})
+    weth.approve(seed, "5 ether", {'from': whale})
+    seed.deposit([0, "5 ether"], {'from': whale})
+    return [agent, accounts[1], whale]
+
+
+def test_provide_before_expiry(seed, raised):
+    assert seed.partial()
+    with brownie.reverts("dev: target not reached"):
+        seed.provide()
+
+
+def test_provide_after_expiry(seed, raised, lido, weth, agent, whale, accounts, chain, interface):
+    pair = interface.ERC20(seed.pair())
+    chain.sleep(14 * 86400)
+    assert seed.state().dict()["phase"] == READY
+
+    # the weth side limits the pair, at the target price it takes half of the lido
+    tx = seed.provide({'from': whale})
+    assert tx.events["Provide"]["amounts"] == ["5 ether", "5 ether"]
+    assert lido.balanceOf(seed) == "5 ether"
+    assert weth.balanceOf(seed) == 0
+    liquidity = seed.liquidity()
+    assert pair.balanceOf(seed) == liquidity
+
+    assert list(seed.position(agent).dict()["refunds"]) == ["3 ether", 0]
+    assert list(seed.position(whale).dict()["refunds"]) == [0, 0]
+
+    lido_before = {user: lido.balanceOf(user) for user in raised}
+    for user in raised:
+        seed.claim({'from': user})
+
+    # each side still earns half of the liquidity, the lido excess is refunded pro-rata
+    assert pair.balanceOf(agent) == liquidity * 6 // 20
+    assert pair.balanceOf(accounts[1]) == liquidity * 4 // 20
+    assert pair.balanceOf(whale) == liquidity - pair.balanceOf(agent) - pair.balanceOf(accounts[1])
+    assert lido.balanceOf(agent) - lido_before[agent] == "3 ether"
+    assert lido.balanceOf(accounts[1]) - lido_before[accounts[1]] == "2 ether"
+    assert lido.balanceOf(whale) == lido_before[whale]
+    assert lido.balanceOf(seed) == 0
+    assert pair.balanceOf(seed) == 0
+
+
+def test_provide_rounding(seed, lido, weth, agent, whale, accounts, chain, interface):
+    lido.transfer(accounts[1], "3 ether", {'from': agent})
+    for user, amount in [(agent, 7 * 10**18 + 1), (accounts[1], "3 ether")]:
+        lido.approve(seed, amount, {'from': user})
+        seed.deposit([amount, 0], {'from': user})
+    weth.approve(seed, 3 * 10**18 + 1, {'from': whale})
+    seed.deposit([0, 3 * 10**18 + 1], {'from': whale})
+    chain.sleep(14 * 86400)
+
+    seed.provide({'from': whale})
+    seed.claim({'from': agent})
+    # the last claimer also receives the rounding dust of the refunds
+    seed.claim({'from': accounts[1]})
+    seed.claim({'from': whale})
+    assert lido.balanceOf(seed) == 0
+    assert weth.balanceOf(seed) == 0
+    assert interface.ERC20(seed.pair()).balanceOf(seed) == 0
+
+
+def test_bail_then_provide(seed, raised, lido, weth, agent, accounts, chain):
+    chain.sleep(14 * 86400)
+    seed.bail({'from': accounts[1]})
+    assert seed.totals(0) == "6 ether"
+    assert seed.state().dict()["phase"] == READY
+
+    tx = seed.provide({'from': agent})
+    assert tx.events["Provide"]["amounts"] == ["5 ether", "5 ether"]
+    assert lido.balanceOf(seed) == "1 ether"
+    assert list(seed.position(agent).dict()["refunds"]) == ["1 ether", 0]
+
+    with brownie.reverts("dev: liquidity already seeded, use `claim()`"):
+        seed.bail({'from': agent})
+
+
+def test_bail_reenter_provide(SeedLiquidity, MockReentrantDepositor, uniswap, lido, weth, agent, whale, accounts, chain):
+    # with weth as token 0, `bail(True)` sends the ether before the lido side is paid out
+    seed = SeedLiquidity.deploy(uniswap, [weth, lido], ["10 ether", "10 ether"], 14 * 86400, 0, True, {'from': accounts[0]})
+    depositor = MockReentrantDepositor.deploy({'from': accounts[0]})
+    weth.transfer(depositor, "2 ether", {'from': whale})
+    lido.transfer(depositor, "2 ether", {'from': agent})
+    for token in (weth, lido):
+        depositor.execute(token, token.approve.encode_input(seed, "2 ether"))
+    depositor.execute(seed, seed.deposit.encode_input(["2 ether", "2 ether"]))
+    weth.approve(seed, "3 ether", {'from': whale})
+    seed.deposit(["3 ether", 0], {'from': whale})
+    lido.approve(seed, "4 ether", {'from': agent})
+    seed.deposit([0, "4 ether"], {'from': agent})
+    chain.sleep(14 * 86400)
+
+    # the ether refund re-enters `provide()` while the depositor's lido still counts
+    depositor.set_hook(seed, seed.provide.encode_input())
+    depositor.execute(seed, seed.bail["bool"].encode_input(True))
+    assert not depositor.hook_success()
+    assert depositor.balance() == "2 ether"
+    assert lido.balanceOf(depositor) == "2 ether"
+    assert seed.liquidity() == 0
+    assert [seed.totals(0), seed.totals(1)] == ["3 ether", "4 ether"]
+
+    # the rest is provided and everyone else claims in full
+    seed.provide({'from': agent})
+    for user in (whale, agent):
+        seed.claim({'from': user})
+    assert weth.balanceOf(seed) == 0
+    assert lido.balanceOf(seed) == 0
+
+
+def test_one_side_empty(seed, lido, agent, chain):
+    lido.approve(seed, "10 ether", {'from': agent})
+    seed.deposit(["10 ether", 0], {'from': agent})
+    chain.sleep(14 * 86400)
+    assert seed.state().dict()["phase"] == BAILABLE
+
+    with brownie.reverts("dev: nothing to provide"):
+        seed.provide()
+
+    seed.bail({'from': agent})
+    assert seed.totals(0) == 0
+
+
+def test_not_partial(SeedLiquidity, uniswap, lido, weth, agent, whale, accounts, chain):
+    seed = SeedLiquidity.deploy(uniswap, [lido, weth], ["10 ether", "10 ether"], 86400, 0, False, {'from': accounts[0]})
+    lido.approve(seed, "10 ether", {'from': agent})
+    seed.deposit(["10 ether", 0], {'from': agent})
+    weth.approve(seed, "5 ether", {'from': whale})
+    seed.deposit([0, "5 ether"], {'from': whale})
+    chain.sleep(86400)
+    assert seed.state().dict()["phase"] == BAILABLE
+
+    with brownie.reverts("dev: contract has expired"):
+        seed.provide()
+
+
+def test_factory_partial(factory, SeedLiquidity, lido, weth):
+    tx = factory.deploy_seed([lido, weth], ["10 ether", "10 ether"], 86400, 0, True)
+    assert SeedLiquidity.at(tx.events["SeedDeployed"]["seed"]).partial()
+    tx = factory.deploy_seed([lido, weth], ["10 ether", "10 ether"], 86400, 0)
+    assert not SeedLiquidity.at(tx.events["SeedDeployed"]["seed"]).partial()
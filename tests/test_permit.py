@@ -0,0 +1,93 @@
+import pytest
+import brownie
+
+NO_PERMIT = (0, 0, b"\x00" * 32, b"\x00" * 32)
+
+
+@pytest.fixture(scope="module")
+def seed(SeedLiquidity, uniswap, permit_token, weth, accounts):
+    return SeedLiquidity.deploy(
+        uniswap,
+        [permit_token, weth],
+        ["10 ether", "10 ether"],
+        14 * 86400,
+        0,
+        False,
+        {"from": accounts[0]},
+    )
+
+
+@pytest.fixture
+def signer(accounts, permit_token, weth, agent, whale):
+    # a local account with a private key to sign permits
+    signer = accounts.add()
+    accounts[0].transfer(signer, "1 ether")
+    permit_token.transfer(signer, "20 ether", {'from': agent})
+    weth.transfer(signer, "20 ether", {'from': whale})
+    return signer
+
+
+def test_deposit_with_permit(seed, permit_token, signer, sign_permit, chain):
+    permit = sign_permit(permit_token, signer, seed, "4 ether", chain.time() + 3600)
+    seed.deposit_with_permit(["4 ether", 0], [permit, NO_PERMIT], {'from': signer})
+
+    assert permit_token.balanceOf(seed) == "4 ether"
+    assert seed.balances(signer, 0) == "4 ether"
+    assert seed.totals(0) == "4 ether"
+    assert permit_token.allowance(signer, seed) == 0
+    assert permit_token.nonces(signer) == 1
+
+
+def test_deposit_with_permit_fallback(seed, permit_token, weth, signer, sign_permit, chain):
+    # weth has no permit, it uses a regular allowance
+    weth.approve(seed, "3 ether", {'from': signer})
+    permit = sign_permit(permit_token, signer, seed, "4 ether", chain.time() + 3600)
+    seed.deposit_with_permit(["4 ether", "3 ether"], [permit, NO_PERMIT], {'from': signer})
+
+    assert seed.balances(signer, 0) == "4 ether"
+    assert seed.balances(signer, 1) == "3 ether"
+    assert weth.allowance(signer, seed) == 0
+
+
+def test_deposit_with_permit_clamped(seed, permit_token, signer, sign_permit, chain):
+    permit = sign_permit(permit_token, signer, seed, "15 ether", chain.time() + 3600)
+    seed.deposit_with_permit(["15 ether", 0], [permit, NO_PERMIT], {'from': signer})
+
+    assert seed.balances(signer, 0) == "10 ether"
+    assert seed.totals(0) == "10 ether"
+    assert permit_token.allowance(signer, seed) == "5 ether"
+
+
+def test_deposit_with_permit_front_run(seed, permit_token, signer, sign_permit, accounts, chain):
+    # someone submits the permit first, the deposit goes through on the allowance
+    permit = sign_permit(permit_token, signer, seed, "4 ether", chain.time() + 3600)
+    permit_token.permit(signer, seed, "4 ether", *permit, {'from': accounts[1]})
+    seed.deposit_with_permit(["4 ether", 0], [permit, NO_PERMIT], {'from': signer})
+
+    assert seed.balances(signer, 0) == "4 ether"
+    assert permit_token.nonces(signer) == 1
+
+
+def test_deposit_with_permit_wrong_amount(seed, permit_token, signer, sign_permit, chain):
+    permit = sign_permit(permit_token, signer, seed, "4 ether", chain.time() + 3600)
+    with brownie.reverts("dev: permit failed"):
+        seed.deposit_with_permit(["5 ether", 0], [permit, NO_PERMIT], {'from': signer})
+
+    assert seed.balances(signer, 0) == 0
+    assert permit_token.nonces(signer) == 0
+
+
+def test_deposit_with_permit_expired(seed, permit_token, signer, sign_permit, chain):
+    permit = sign_permit(permit_token, signer, seed, "4 ether", chain.time() + 3600)
+    chain.sleep(7200)
+    with brownie.reverts("dev: permit failed"):
+        seed.deposit_with_permit(["4 ether", 0], [permit, NO_PERMIT], {'from': signer})
+
+    assert seed.balances(signer, 0) == 0
+
+
+def test_deposit_with_permit_other_signer(seed, permit_token, signer, sign_permit, accounts, chain):
+    # a permit only ever approves its signer's tokens
+    permit = sign_permit(permit_token, signer, seed, "4 ether", chain.time() + 3600)
+    with brownie.reverts("dev: permit failed"):
+        seed.deposit_with_permit(["4 ether", 0], [permit, NO_PERMIT], {'from': accounts[1]})
@@ -0,0 +1,105 @@
+import numpy as np
+from scripts.planner import PATHS, campaign, load_table, measure, plan, save_table
+
+TABLE = {path: 1000 + i for i, path in enumerate(PATHS)}
+
+
+def gas(*paths):
+    return [TABLE[path] for path in paths]
+
+
+def test_plan_paths():
+    users = [0, 1, 0, 2, 3]
+    amounts = [[5, 0], [3, 3], [0, 2], [5, 5], [1, 1]]
+    result = plan(TABLE, amounts, users, [10, 10])
+    assert result.outcome == "provide"
+    assert result.calls["deposit"].tolist() == gas(
+        "deposit_open_single",
+        "deposit_join_both",
+        "deposit_topup_single",
+        "deposit_join_both",  # clamped to [2, 5]
+        "deposit_full",
+    )
+    assert result.calls["claim"].tolist() == gas("claim", "claim", "claim_last")
+    assert result.per_user.tolist() == [
+        TABLE["deposit_open_single"] + TABLE["deposit_topup_single"] + TABLE["claim"],
+        TABLE["deposit_join_both"] + TABLE["claim"],
+        TABLE["deposit_join_both"] + TABLE["claim_last"],
+        TABLE["deposit_full"],
+    ]
+    assert result.total == result.per_user.sum() + TABLE["deploy"] + TABLE["provide"]
+
+
+def test_plan_unfilled():
+    users = [0, 1]
+    amounts = [[5, 0], [3, 3]]
+    result = plan(TABLE, amounts, users, [10, 10])
+    assert result.outcome == "bail"
+    assert "provide" not in result.calls
+    assert result.calls["bail"].tolist() == gas("bail_single", "bail_both")
+
+    result = plan(TABLE, amounts, users, [10, 10], partial=True)
+    assert result.outcome == "partial"
+    assert result.calls["provide"].tolist() == gas("provide_partial")
+    assert result.calls["claim"].tolist() == gas("claim_partial", "claim_partial_last")
+
+    # nothing to pair the first token with
+    result = plan(TABLE, [[5, 0]], [0], [10, 10], partial=True)
+    assert result.outcome == "bail"
+
+
+def test_campaign():
+    target = [10**24, 10**21]
+    amounts, users = campaign(1000, target, both=0.3, topups=0.5, fill=1.5)
+    assert sorted(set(users.tolist())) == list(range(1000))
+    assert len(users) > 1000
+    for i in range(2):
+        assert target[i] < amounts[:, i].sum() <= target[i] * 3 // 2
+
+    amounts, users = campaign(1000, target, both=0)
+    assert (((amounts != 0).astype(bool)).sum(axis=1) == 1).all()
+    amounts, users = campaign(1000, target, both=1, distribution="equal")
+    assert (amounts != 0).astype(bool).all()
+    assert len(set(amounts[:, 0].tolist())) == 1
+
+
+def test_table_cache(tmp_path):
+    path = tmp_path / "gas_table.json"
+    assert load_table(path, "0x6001") is None
+    save_table(path, "0x6001", TABLE)
+    assert load_table(path, "0x6001") == TABLE
+    # a changed contract is measured again
+    assert load_table(path, "0x6002") is None
+
+
+def test_matches_chain(SeedLiquidity, MockERC20, uniswap, weth, whale, accounts, chain):
+    def new_token():
+        return MockERC20.deploy("Plan Token", "PLAN", 18, "1000000 ether", {"from": whale})
+
+    table = measure(SeedLiquidity, uniswap, weth, new_token, [whale] + list(accounts[1:5]), chain)
+    assert set(table) == set(PATHS)
+    assert table["deposit_full"] < table["deposit_topup_single"] < table["deposit_join_single"]
+
+    # a campaign drawn by the planner, run on chain
+    target = [10**21, 10**18]
+    amounts, users = campaign(8, target, both=0.5, topups=0.5, fill=1.2)
+    token = new_token()
+    seed = SeedLiquidity.deploy(uniswap, [token, weth], target, 86400, 0, False, {"from": whale})
+    used = {"deploy": seed.tx.gas_used, "deposit": 0, "provide": 0, "claim": 0}
+    for user in range(8):
+        for i, asset in enumerate([token, weth]):
+            asset.transfer(accounts[user + 1], target[i] * 2, {"from": whale})
+            asset.approve(seed, target[i] * 2, {"from": accounts[user + 1]})
+    for user, deposit in zip(users, amounts):
+        used["deposit"] += seed.deposit(deposit.tolist(), {"from": accounts[user + 1]}).gas_used
+    used["provide"] = seed.provide({"from": whale}).gas_used
+    claimers = [user for user in range(8) if seed.position(accounts[user + 1]).dict()["claimable"]]
+    for user in claimers:
+        used["claim"] += seed.claim({"from": accounts[user + 1]}).gas_used
+
+    result = plan(table, amounts, users, target)
+    assert result.outcome == "provide"
+    assert len(result.calls["claim"]) == len(claimers)
+    for phase, total in used.items():
+        # the table misses only the storage costs that depend on the order of deposits
+        assert abs(int(np.sum(result.calls[phase])) - total) <= total // 20
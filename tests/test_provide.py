@@ -1,8 +1,9 @@
 import pytest
 import brownie
+from brownie import web3
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def seed(SeedLiquidity, uniswap, lido, weth, accounts):
     return SeedLiquidity.deploy(
         uniswap,
@@ -10,6 +11,7 @@ def seed(SeedLiquidity, uniswap, lido, weth, accounts):
         ["10 ether", "10 ether"],
         14 * 86400,
         0,
+        False,
         {"from": accounts[0]},
     )
 
@@ -41,8 +43,8 @@ def test_both_unfilled(seed, lido, weth, agent, whale, interface):
         seed.provide()
 
     assert seed.liquidity() == 0
-    assert pair.balanceOf(seed) == 0
-    assert pair.totalSupply() == 0
+    # the pair is only created by a successful provide
+    assert len(web3.eth.get_code(pair.address)) == 0
 
 
 def test_lido_unfilled(seed, lido, weth, agent, whale, interface):
@@ -72,8 +74,8 @@ def test_lido_unfilled(seed, lido, weth, agent, whale, interface):
         seed.provide()
 
     assert seed.liquidity() == 0
-    assert pair.balanceOf(seed) == 0
-    assert pair.totalSupply() == 0
+    # the pair is only created by a successful provide
+    assert len(web3.eth.get_code(pair.address)) == 0
 
 
 def test_weth_unfilled(seed, lido, weth, agent, whale, interface):
@@ -103,8 +105,8 @@ def test_weth_unfilled(seed, lido, weth, agent, whale, interface):
         seed.provide()
 
     assert seed.liquidity() == 0
-    assert pair.balanceOf(seed) == 0
-    assert pair.totalSupply() == 0
+    # the pair is only created by a successful provide
+    assert len(web3.eth.get_code(pair.address)) == 0
 
 
 def test_filled(seed, lido, weth, agent, whale, interface):
@@ -141,6 +143,39 @@ def test_filled(seed, lido, weth, agent, whale, interface):
         seed.provide()
 
 
+def test_pair_created_on_provide(seed, lido, weth, agent, whale, uniswap, MockUniswapFactory, forked):
+    if forked:
+        pytest.skip("the mainnet pair already exists")
+    # the pair address is derived at deployment, the router deploys the pair in `provide()`
+    factory = MockUniswapFactory.at(uniswap.factory())
+    assert factory.getPair(lido, weth) == brownie.ZERO_ADDRESS
+
+    lido.approve(seed, "10 ether", {'from': agent})
+    seed.deposit(["10 ether", 0], {'from': agent})
+    weth.approve(seed, "10 ether", {'from': whale})
+    seed.deposit([0, "10 ether"], {'from': whale})
+    seed.provide()
+
+    assert factory.getPair(lido, weth) == seed.pair()
+    assert seed.liquidity() > 0
+
+
+def test_pair_exists_empty(SeedLiquidity, uniswap, lido, weth, agent, whale, accounts, MockUniswapFactory, forked):
+    if forked:
+        pytest.skip("the mainnet pair already exists")
+    factory = MockUniswapFactory.at(uniswap.factory())
+    factory.createPair(lido, weth, {'from': accounts[0]})
+    seed = SeedLiquidity.deploy(uniswap, [lido, weth], ["10 ether", "10 ether"], 86400, 0, False, {'from': accounts[0]})
+    assert seed.pair() == factory.getPair(lido, weth)
+
+    lido.approve(seed, "10 ether", {'from': agent})
+    seed.deposit(["10 ether", 0], {'from': agent})
+    weth.approve(seed, "10 ether", {'from': whale})
+    seed.deposit([0, "10 ether"], {'from': whale})
+    seed.provide()
+    assert seed.liquidity() > 0
+
+
 def test_existing(seed, lido, weth, agent, whale, interface, uniswap, chain):
     pair = interface.ERC20(seed.pair())
 
@@ -225,5 +260,5 @@ def test_expired(seed, lido, weth, agent, whale, interface, chain):
         seed.provide()
 
     assert seed.liquidity() == 0
-    assert pair.balanceOf(seed) == 0
-    assert pair.totalSupply() == 0
+    # the pair is only created by a successful provide
+    assert len(web3.eth.get_code(pair.address)) == 0
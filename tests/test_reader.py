@@ -0,0 +1,80 @@
+import pytest
+from brownie import ZERO_ADDRESS, web3
+from scripts.reader import SeedReader
+
+
+@pytest.fixture(scope="module")
+def multicall(MockMulticall, accounts):
+    return MockMulticall.deploy({'from': accounts[0]})
+
+
+@pytest.fixture(scope="module")
+def seeds(factory, lido, weth, agent):
+    seeds = []
+    for i in range(1, 6):
+        tx = factory.deploy_seed([lido, weth], [f"{i} ether", f"{i} ether"], 86400 * i, i)
+        seeds.append(tx.events["SeedDeployed"]["seed"])
+    return seeds
+
+
+def expected(seed):
+    return {
+        "router": seed.router(),
+        "weth": seed.weth(),
+        "tokens": [seed.tokens(0), seed.tokens(1)],
+        "target": [seed.target(0), seed.target(1)],
+        "pair": seed.pair(),
+        "expiry": seed.expiry(),
+        "locktime": seed.locktime(),
+        "partial": seed.partial(),
+        "totals": [seed.totals(0), seed.totals(1)],
+        "liquidity": seed.liquidity(),
+        "unlock": seed.unlock(),
+    }
+
+
+def test_read(SeedLiquidity, multicall, seeds, lido, agent):
+    seed = SeedLiquidity.at(seeds[2])
+    lido.approve(seed, "1 ether", {'from': agent})
+    seed.deposit(["1 ether", 0], {'from': agent})
+
+    reader = SeedReader(web3, multicall)
+    state = reader.read(seeds)
+    assert list(state) == seeds
+    for address in seeds:
+        assert state[address] == expected(SeedLiquidity.at(address))
+    assert state[seed.address]["totals"] == [10**18, 0]
+    assert reader.requests == 1
+
+
+def test_chunks(multicall, seeds):
+    # 10 immutable and 4 mutable calls per seed
+    reader = SeedReader(web3, multicall, chunk_size=8)
+    state = reader.read(seeds)
+    assert reader.requests == 9
+    assert reader.read(seeds) == state
+    assert reader.requests == 9 + 3
+
+
+def test_immutables_cached(SeedLiquidity, multicall, seeds, lido, agent):
+    reader = SeedReader(web3, multicall, chunk_size=14)
+    reader.read(seeds[:2])
+    assert reader.requests == 2
+    assert set(reader.cache) == set(seeds[:2])
+
+    # only the mutable fields of known seeds are read again
+    seed = SeedLiquidity.at(seeds[0])
+    lido.approve(seed, "1 ether", {'from': agent})
+    seed.deposit(["1 ether", 0], {'from': agent})
+    state = reader.read(seeds[:2])
+    assert reader.requests == 3
+    assert state[seed.address] == expected(seed)
+
+
+def test_failed_calls(multicall, seeds, accounts):
+    reader = SeedReader(web3, multicall)
+    state = reader.read([seeds[0], accounts[1], ZERO_ADDRESS])
+    assert state[accounts[1]]["liquidity"] is None
+    assert state[accounts[1]]["tokens"] == [None, None]
+    assert state[ZERO_ADDRESS]["pair"] is None
+    assert set(reader.cache) == {seeds[0]}
@@ -0,0 +1,87 @@
+import json
+import urllib.request
+
+import pytest
+from brownie import web3
+from scripts.rpc_cache import RPCCache, serve
+
+
+@pytest.fixture
+def proxy(tmp_path):
+    servers = []
+
+    def start(**kwargs):
+        cache = RPCCache(web3.provider.endpoint_uri, tmp_path / "cache.db", **kwargs)
+        server = serve(cache, port=0)
+        servers.append(server)
+        return cache, f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+
+
+def rpc(url, method, *params):
+    body = json.dumps({"jsonrpc": "2.0", "id": 7, "method": method, "params": list(params)}).encode()
+    request = urllib.request.Request(url, body, {"Content-Type": "application/json"})
+    with urllib.request.urlopen(request) as response:
+        return json.load(response)
+
+
+def test_record_and_replay(proxy, lido, agent, chain):
+    block = hex(chain.height)
+    cache, url = proxy(block=chain.height)
+    code = rpc(url, "eth_getCode", lido.address, block)["result"]
+    balance = rpc(url, "eth_getBalance", agent.address, block)["result"]
+    slot = rpc(url, "eth_getStorageAt", lido.address, "0x0", block)["result"]
+    assert bytes.fromhex(code[2:]) == bytes(web3.eth.get_code(lido.address))
+    assert int(balance, 16) == agent.balance()
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    # a new session replays the store without the upstream
+    replay, url = proxy(block=chain.height, offline=True)
+    assert rpc(url, "eth_getCode", lido.address, block)["result"] == code
+    assert rpc(url, "eth_getBalance", agent.address, block)["result"] == balance
+    assert rpc(url, "eth_getStorageAt", lido.address, "0x0", block)["result"] == slot
+    assert (replay.hits, replay.misses) == (3, 0)
+
+
+def test_pinned_block(proxy, chain):
+    pinned = chain.height
+    _, url = proxy(block=pinned)
+    chain.mine(3)
+    assert rpc(url, "eth_blockNumber")["result"] == hex(pinned)
+
+
+def test_moving_tags_not_stored(proxy, agent, accounts):
+    cache, url = proxy()
+    before = int(rpc(url, "eth_getBalance", agent.address, "latest")["result"], 16)
+    accounts[0].transfer(agent, 1)
+    assert int(rpc(url, "eth_getBalance", agent.address, "latest")["result"], 16) == before + 1
+    # no block parameter reads at `latest` too
+    accounts[0].transfer(agent, 1)
+    assert int(rpc(url, "eth_getBalance", agent.address)["result"], 16) == before + 2
+    assert cache.misses == 0
+
+
+def test_offline_miss(proxy, agent, chain):
+    _, url = proxy(offline=True)
+    response = rpc(url, "eth_getBalance", agent.address, hex(chain.height))
+    assert response["id"] == 7
+    assert "not in the cache" in response["error"]["message"]
+
+
+def test_batch(proxy, agent, chain):
+    cache, url = proxy()
+    body = json.dumps(
+        [
+            {"jsonrpc": "2.0", "id": i, "method": "eth_getBalance", "params": [agent.address, hex(chain.height)]}
+            for i in range(2)
+        ]
+    ).encode()
+    request = urllib.request.Request(url, body, {"Content-Type": "application/json"})
+    with urllib.request.urlopen(request) as response:
+        results = json.load(response)
+    assert [result["id"] for result in results] == [0, 1]
+    assert results[0]["result"] == results[1]["result"]
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -1,3 +1,6 @@
+import brownie
+
+
 def test_seed(seed, lido, weth, agent, whale, interface):
     pair = interface.ERC20(seed.pair())
     lido_amount = seed.target(0)
@@ -25,7 +28,7 @@ def test_seed(seed, lido, weth, agent, whale, interface):
     assert pair.balanceOf(agent) == seed.liquidity() // 2
 
     seed.claim({'from': whale})
-    assert pair.balanceOf(whale) == seed.liquidity() // 2
+    assert pair.balanceOf(whale) == seed.liquidity() - pair.balanceOf(agent)
 
 
 def test_bail(seed, lido, weth, agent, whale, chain):
@@ -49,3 +52,16 @@ def test_bail(seed, lido, weth, agent, whale, chain):
 
     seed.bail({'from': whale})
     assert weth.balanceOf(whale) == weth_before
+
+
+def test_target_too_large(SeedLiquidity, uniswap, lido, weth, accounts):
+    with brownie.reverts():
+        SeedLiquidity.deploy(
+            uniswap,
+            [lido, weth],
+            [2**128, "150 ether"],
+            14 * 86400,
+            0,
+            False,
+            {"from": accounts[0]},
+        )
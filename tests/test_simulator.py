@@ -0,0 +1,72 @@
+import pytest
+from scripts.simulator import clamp, simulate
+
+# deposits in order as (user, amounts), the last ones are clamped
+DEPOSITS = [
+    (1, [333333333333333333, 0]),
+    (2, [0, 77777777777777777]),
+    (3, [111111111111111111, 22222222222222223]),
+    (1, [0, 11]),
+    (4, [999999999999999999, 999999999999999999]),
+    (5, [7, 7]),
+]
+TARGET = [10**18 + 1, 3 * 10**17 + 7]
+
+
+@pytest.fixture(scope="module")
+def odd_seed(SeedLiquidity, uniswap, lido, weth, accounts, agent, whale):
+    seed = SeedLiquidity.deploy(uniswap, [lido, weth], TARGET, 86400, 0, False, {"from": accounts[0]})
+    for user in range(1, 6):
+        lido.transfer(accounts[user], "1 ether", {'from': agent})
+        weth.transfer(accounts[user], "1 ether", {'from': whale})
+        lido.approve(seed, "1 ether", {'from': accounts[user]})
+        weth.approve(seed, "1 ether", {'from': accounts[user]})
+    return seed
+
+
+def test_clamp():
+    accepted = clamp([[5, 1], [4, 4], [3, 0], [0, 9]], [10, 10])
+    assert accepted.tolist() == [[5, 1], [4, 4], [1, 0], [0, 5]]
+
+
+def test_target_not_reached():
+    with pytest.raises(ValueError):
+        simulate([[5, 0], [0, 10**6]], [10**6, 10**6])
+
+
+def test_matches_chain(odd_seed, accounts, interface):
+    seed = odd_seed
+    accepted = []
+    for user, amounts in DEPOSITS:
+        tx = seed.deposit(amounts, {'from': accounts[user]})
+        # a deposit which takes nothing emits no event
+        accepted.append(list(tx.events["Deposit"]["amounts"]) if "Deposit" in tx.events else [0, 0])
+    seed.provide({'from': accounts[0]})
+
+    users = [user - 1 for user, _ in DEPOSITS]
+    result = simulate([amounts for _, amounts in DEPOSITS], TARGET, users=users)
+    assert result.accepted.tolist() == accepted
+    assert result.liquidity == seed.liquidity()
+    assert result.dust > 0
+
+    pair = interface.ERC20(seed.pair())
+    for user in range(1, 6):
+        assert [seed.balances(accounts[user], i) for i in range(2)] == result.balances[user - 1].tolist()
+        seed.claim({'from': accounts[user]})
+        assert pair.balanceOf(accounts[user]) == result.lp[user - 1]
+    assert pair.balanceOf(seed) == 0
+
+
+def test_dust_to_last_claimer(odd_seed, accounts, interface):
+    seed = odd_seed
+    for user, amounts in DEPOSITS:
+        seed.deposit(amounts, {'from': accounts[user]})
+    seed.provide({'from': accounts[0]})
+
+    users = [user - 1 for user, _ in DEPOSITS]
+    result = simulate([amounts for _, amounts in DEPOSITS], TARGET, users=users, last=0)
+    pair = interface.ERC20(seed.pair())
+    for user in [2, 3, 4, 5, 1]:
+        seed.claim({'from': accounts[user]})
+        assert pair.balanceOf(accounts[user]) == result.lp[user - 1]
+    assert result.lp.sum() == result.liquidity
@@ -0,0 +1,187 @@
+"""
+Differential fuzzing of `SeedLiquidity` against a pure-Python model.
+
+Hypothesis generates random sequences of deposits, provides, claims, bails and
+time jumps across many accounts. Every step is applied to the contract and to
+`SeedModel`, reverts must agree and the full state is compared after each step.
+The chain is reverted to a snapshot between examples.
+
+    brownie test tests/test_stateful.py --fuzz-examples 10000 -n auto
+"""
+import brownie
+import pytest
+from brownie.test import strategy
+from scripts.simulator import mint
+
+USERS = 5
+DURATION = 86400
+
+
+class Revert(Exception):
+    pass
+
+
+class SeedModel:
+    """Reference model of one `SeedLiquidity` contract, `now` is the block timestamp."""
+
+    def __init__(self, target, expiry, locktime):
+        self.target = list(target)
+        self.expiry = expiry
+        self.locktime = locktime
+        self.totals = [0, 0]
+        self.balances = {}
+        self.liquidity = 0
+        self.claimed = 0
+        self.unclaimed = [0, 0]
+        self.unlock = 0
+
+    def deposit(self, user, amounts, now):
+        if self.liquidity or now >= self.expiry:
+            raise Revert
+        accepted = [min(amounts[i], self.target[i] - self.totals[i]) for i in range(2)]
+        balances = self.balances.setdefault(user, [0, 0])
+        for i in range(2):
+            balances[i] += accepted[i]
+            self.totals[i] += accepted[i]
+        return accepted
+
+    def provide(self, now):
+        if self.liquidity or now >= self.expiry or self.totals != self.target:
+            raise Revert
+        self.liquidity = mint(self.target)
+        self.unlock = now + self.locktime
+        self.unclaimed = list(self.target)
+
+    def claim(self, user, now):
+        if not self.liquidity or now < self.unlock:
+            raise Revert
+        position = self.balances.pop(user, [0, 0])
+        if position == [0, 0]:
+            return 0
+        if position == self.unclaimed:
+            # the last claimer receives the rounding dust
+            amount = self.liquidity - self.claimed
+        else:
+            amount = sum(position[i] * self.liquidity // (2 * self.target[i]) for i in range(2))
+        self.unclaimed = [self.unclaimed[i] - position[i] for i in range(2)]
+        self.claimed += amount
+        return amount
+
+    def bail(self, user, now):
+        if self.liquidity or now < self.expiry:
+            raise Revert
+        return self.balances.pop(user, [0, 0])
+
+
+class StateMachine:
+
+    st_user = strategy("uint256", max_value=USERS - 1)
+    st_amount0 = strategy("uint256", max_value=4 * 10**17)
+    st_amount1 = strategy("uint256", max_value=10**17)
+    st_sleep = strategy("uint256", max_value=DURATION // 2)
+
+    def __init__(cls, seed, lido, weth, pair, users):
+        cls.seed = seed
+        cls.tokens = [lido, weth]
+        cls.pair = pair
+        cls.users = users
+
+    def setup(self):
+        self.model = SeedModel(
+            [self.seed.target(i) for i in range(2)], self.seed.expiry(), self.seed.locktime()
+        )
+        self.wallets = {user: [token.balanceOf(user) for token in self.tokens] for user in self.users}
+        self.lp = dict.fromkeys(self.users, 0)
+
+    def _apply(self, action, model_action):
+        """Run `model_action` at the current time, the contract call must revert if it does."""
+        try:
+            result = model_action(brownie.chain.time())
+        except Revert:
+            with brownie.reverts():
+                action()
+            return None
+        action()
+        return result
+
+    def rule_deposit(self, st_user, st_amount0, st_amount1):
+        user = self.users[st_user]
+        amounts = [st_amount0, st_amount1]
+        accepted = self._apply(
+            lambda: self.seed.deposit(amounts, {'from': user}),
+            lambda now: self.model.deposit(user, amounts, now),
+        )
+        if accepted is not None:
+            for i in range(2):
+                self.wallets[user][i] -= accepted[i]
+
+    def rule_provide(self, st_user):
+        user = self.users[st_user]
+        self._apply(lambda: self.seed.provide({'from': user}), self.model.provide)
+
+    def rule_claim(self, st_user):
+        user = self.users[st_user]
+        amount = self._apply(
+            lambda: self.seed.claim({'from': user}),
+            lambda now: self.model.claim(user, now),
+        )
+        if amount is not None:
+            self.lp[user] += amount
+
+    def rule_bail(self, st_user):
+        user = self.users[st_user]
+        refund = self._apply(
+            lambda: self.seed.bail({'from': user}),
+            lambda now: self.model.bail(user, now),
+        )
+        if refund is not None:
+            for i in range(2):
+                self.wallets[user][i] += refund[i]
+
+    def rule_sleep(self, st_sleep):
+        brownie.chain.sleep(st_sleep)
+        # stay clear of the expiry and unlock, the next block may land a few seconds later
+        now = brownie.chain.time()
+        if any(abs(now - edge) < 30 for edge in (self.model.expiry, self.model.unlock)):
+            brownie.chain.sleep(60)
+        brownie.chain.mine()
+
+    def invariant(self):
+        seed = self.seed
+        model = self.model
+        assert [seed.totals(i) for i in range(2)] == model.totals
+        assert seed.liquidity() == model.liquidity
+        assert seed.unlock() == model.unlock
+        for user in self.users:
+            balances = model.balances.get(user, [0, 0])
+            assert [seed.balances(user, i) for i in range(2)] == balances
+            assert [token.balanceOf(user) for token in self.tokens] == self.wallets[user]
+        # the pair is deployed by `provide()`
+        if model.liquidity:
+            for user in self.users:
+                assert self.pair.balanceOf(user) == self.lp[user]
+            assert self.pair.balanceOf(seed) == model.liquidity - model.claimed
+        else:
+            assert len(brownie.web3.eth.get_code(self.pair.address)) == 0
+
+
+@pytest.fixture(scope="module", params=[0, 3600])
+def fuzzed_seed(request, SeedLiquidity, uniswap, lido, weth, agent, whale, accounts):
+    # odd targets so that claims round
+    target = [10**18 + 1, 3 * 10**17 + 7]
+    seed = SeedLiquidity.deploy(uniswap, [lido, weth], target, DURATION, request.param, False, {'from': accounts[0]})
+    for user in accounts[1 : USERS + 1]:
+        lido.transfer(user, target[0], {'from': agent})
+        weth.transfer(user, target[1], {'from': whale})
+        for token in (lido, weth):
+            token.approve(seed, 2**256 - 1, {'from': user})
+    return seed
+
+
+def test_stateful(state_machine, pytestconfig, fuzzed_seed, lido, weth, accounts, interface):
+    settings = {
+        "max_examples": pytestconfig.getoption("fuzz_examples"),
+        "stateful_step_count": 20,
+    }
+    pair = interface.ERC20(fuzzed_seed.pair())
+    state_machine(StateMachine, fuzzed_seed, lido, weth, pair, accounts[1 : USERS + 1], settings=settings)
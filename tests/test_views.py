@@ -0,0 +1,127 @@
+OPEN, READY, LOCKED, CLAIMABLE, BAILABLE = range(5)
+
+
+def position(seed, user):
+    balances, claimable, refunds = seed.position(user)
+    assert list(refunds) == [0, 0]
+    return list(balances), claimable
+
+
+def fill(seed, lido, weth, agent, whale):
+    lido.approve(seed, seed.target(0), {'from': agent})
+    seed.deposit([seed.target(0), 0], {'from': agent})
+    weth.approve(seed, seed.target(1), {'from': whale})
+    seed.deposit([0, seed.target(1)], {'from': whale})
+
+
+def test_state(seed_with_waitime, lido, weth, agent, whale, chain):
+    seed = seed_with_waitime
+    state = seed.state().dict()
+    assert state["tokens"] == [lido, weth]
+    assert state["target"] == [seed.target(0), seed.target(1)]
+    assert list(state["totals"]) == [0, 0]
+    assert state["pair"] == seed.pair()
+    assert state["liquidity"] == 0
+    assert state["expiry"] == seed.expiry()
+    assert state["locktime"] == 100
+    assert state["unlock"] == 0
+    assert state["phase"] == OPEN
+
+    fill(seed, lido, weth, agent, whale)
+    state = seed.state().dict()
+    assert state["totals"] == state["target"]
+    assert state["phase"] == READY
+
+    tx = seed.provide({'from': agent})
+    state = seed.state().dict()
+    assert state["liquidity"] == seed.liquidity()
+    assert state["unlock"] == tx.timestamp + 100
+    assert state["phase"] == LOCKED
+
+    chain.sleep(100)
+    chain.mine()
+    assert seed.state().dict()["phase"] == CLAIMABLE
+
+
+def test_state_bailable(seed, lido, agent, chain):
+    lido.approve(seed, "1 ether", {'from': agent})
+    seed.deposit(["1 ether", 0], {'from': agent})
+    assert seed.state().dict()["phase"] == OPEN
+
+    chain.sleep(14 * 86400)
+    chain.mine()
+    assert seed.state().dict()["phase"] == BAILABLE
+
+
+def test_state_liquid_pair(seed, lido, weth, agent, whale, uniswap, chain):
+    fill(seed, lido, weth, agent, whale)
+    lido.transfer(whale, "1 ether", {'from': agent})
+    lido.approve(uniswap, "1 ether", {'from': whale})
+    weth.approve(uniswap, "1 ether", {'from': whale})
+    uniswap.addLiquidity(lido, weth, "1 ether", "1 ether", 0, 0, whale, chain.time() + 100, {'from': whale})
+
+    # `provide()` would revert, so the campaign isn't ready
+    assert seed.state().dict()["phase"] == OPEN
+
+
+def test_position(seed, lido, weth, agent, whale, accounts, interface):
+    pair = interface.ERC20(seed.pair())
+    lido.approve(seed, seed.target(0), {'from': agent})
+    seed.deposit([seed.target(0) // 3, 0], {'from': agent})
+    lido.transfer(whale, seed.target(0), {'from': agent})
+    lido.approve(seed, seed.target(0), {'from': whale})
+    weth.approve(seed, seed.target(1), {'from': whale})
+    seed.deposit([seed.target(0), seed.target(1)], {'from': whale})
+
+    assert position(seed, agent) == ([seed.target(0) // 3, 0], 0)
+    assert position(seed, accounts[1]) == ([0, 0], 0)
+
+    seed.provide({'from': agent})
+    preview = seed.position(agent).dict()["claimable"]
+    assert preview == seed.target(0) // 3 * seed.liquidity() // (2 * seed.target(0))
+    seed.claim({'from': agent})
+    assert pair.balanceOf(agent) == preview
+    assert position(seed, agent) == ([0, 0], 0)
+
+    # the last claimer's preview includes the rounding dust
+    preview = seed.position(whale).dict()["claimable"]
+    assert preview == seed.liquidity() - pair.balanceOf(agent)
+    seed.claim({'from': whale})
+    assert pair.balanceOf(whale) == preview
+
+
+def depositors(seed, offset, limit):
+    return [(user, list(balances)) for user, balances in seed.get_depositors(offset, limit)]
+
+
+def test_depositors(seed, lido, weth, agent, whale, accounts):
+    assert seed.depositor_count() == 0
+    assert seed.get_depositors(0, 10) == []
+
+    lido.approve(seed, seed.target(0), {'from': agent})
+    seed.deposit(["1 ether", 0], {'from': agent})
+    seed.deposit(["2 ether", 0], {'from': agent})
+    weth.approve(seed, seed.target(1), {'from': whale})
+    seed.deposit_single(1, "5 ether", {'from': whale})
+    # a deposit that takes nothing isn't counted
+    seed.deposit([0, 0], {'from': accounts[1]})
+
+    assert seed.depositor_count() == 2
+    assert seed.deposit_count() == 3
+    assert seed.depositors(0) == agent
+    assert seed.depositors(1) == whale
+    assert depositors(seed, 0, 10) == [(agent, ["3 ether", 0]), (whale, [0, "5 ether"])]
+    assert depositors(seed, 1, 10) == [(whale, [0, "5 ether"])]
+    assert depositors(seed, 0, 1) == [(agent, ["3 ether", 0])]
+    assert depositors(seed, 2, 10) == []
+
+
+def test_depositors_after_bail(seed, lido, agent, chain):
+    lido.approve(seed, seed.target(0), {'from': agent})
+    seed.deposit(["1 ether", 0], {'from': agent})
+    chain.sleep(14 * 86400)
+    seed.bail({'from': agent})
+
+    # stays listed with nothing left
+    assert seed.depositor_count() == 1
+    assert depositors(seed, 0, 10) == [(agent, [0, 0])]